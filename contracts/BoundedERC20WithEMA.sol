@@ -4,9 +4,11 @@ pragma solidity ^0.8.17;
 import "./access/GovernanceOnly.sol";
 import "../interfaces/IBoundedERC20WithEMA.sol";
 import "../libraries/ScaledMath.sol";
-import "../libraries/LogExpMath.sol";
+import "../libraries/ExpDecay.sol";
+import "../libraries/Permit.sol";
 import "@openzeppelin/contracts-upgradeable/token/ERC20/ERC20Upgradeable.sol";
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 
 contract BoundedERC20WithEMA is
     IBoundedERC20WithEMA,
@@ -14,22 +16,34 @@ contract BoundedERC20WithEMA is
     GovernanceOnly
 {
     using ScaledMath for uint256;
-    using LogExpMath for uint256;
+    using SafeCast for uint256;
 
     event WindowWidthUpdated(uint256 windowWidth);
 
     IERC20 public immutable underlying;
 
-    struct UintValue {
+    /// @dev Layout of the values before they were packed, kept so that the storage
+    /// of the deployed proxy does not move. The legacy values are read until the
+    /// first update after the upgrade writes the packed ones, see `_loadValues`
+    struct LegacyUintValue {
         uint256 blockNb;
         uint256 value;
     }
 
-    UintValue public previousBoundedPctOfSupply;
-    UintValue public expMovingAverage;
+    /// @dev packed in a single slot
+    struct UintValue {
+        uint64 blockNb;
+        uint192 value;
+    }
+
+    LegacyUintValue internal __deprecated_previousBoundedPctOfSupply;
+    LegacyUintValue internal __deprecated_expMovingAverage;
 
     uint256 public windowWidth;
 
+    UintValue internal _previousBoundedPctOfSupply;
+    UintValue internal _expMovingAverage;
+
     constructor(
         address governance,
         address _underlying
@@ -45,12 +59,12 @@ contract BoundedERC20WithEMA is
         __ERC20_init("BoundedGYD", "bGYD");
         windowWidth = _windowWidth;
 
-        uint256 boundedPct = boundedPctOfSupply();
-        expMovingAverage.value = boundedPct;
-        previousBoundedPctOfSupply.value = boundedPct;
-
-        expMovingAverage.blockNb = block.number;
-        previousBoundedPctOfSupply.blockNb = block.number;
+        UintValue memory current = UintValue(
+            uint64(block.number),
+            boundedPctOfSupply().toUint192()
+        );
+        _expMovingAverage = current;
+        _previousBoundedPctOfSupply = current;
 
         emit WindowWidthUpdated(windowWidth);
     }
@@ -64,6 +78,28 @@ contract BoundedERC20WithEMA is
         _updateEMA();
     }
 
+    /// @notice Same as `deposit` but approves this contract with an EIP-2612 permit first.
+    /// If the permit fails, the deposit uses the existing allowance
+    function depositWithPermit(
+        uint256 _amount,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) external {
+        Permit.tryPermit(
+            address(underlying),
+            msg.sender,
+            address(this),
+            _amount,
+            deadline,
+            v,
+            r,
+            s
+        );
+        deposit(_amount);
+    }
+
     event Withdraw(address indexed dst, uint256 amount);
 
     function withdraw(uint256 _amount) public {
@@ -81,29 +117,89 @@ contract BoundedERC20WithEMA is
         return totalSupply().divDown(gydTotalSupply);
     }
 
+    function previousBoundedPctOfSupply()
+        external
+        view
+        returns (uint256 blockNb, uint256 value)
+    {
+        (UintValue memory previous, ) = _loadValues();
+        return (previous.blockNb, previous.value);
+    }
+
+    function expMovingAverage()
+        external
+        view
+        returns (uint256 blockNb, uint256 value)
+    {
+        (, UintValue memory ema) = _loadValues();
+        return (ema.blockNb, ema.value);
+    }
+
     function _updateEMA() internal {
-        if (previousBoundedPctOfSupply.blockNb < block.number) {
-            uint256 multiplier = ScaledMath.ONE;
-            uint256 deltaBlockNb = (previousBoundedPctOfSupply.blockNb -
-                expMovingAverage.blockNb) * multiplier;
-            int256 exponent = -int256(deltaBlockNb.divDown(windowWidth));
-            if (exponent > LogExpMath.MIN_NATURAL_EXPONENT) {
-                int256 discount = LogExpMath.exp(exponent);
-                multiplier -= uint256(discount);
-            }
-
-            if (previousBoundedPctOfSupply.value > expMovingAverage.value) {
-                expMovingAverage.value += (previousBoundedPctOfSupply.value -
-                    expMovingAverage.value).mulDown(multiplier);
-            } else {
-                expMovingAverage.value -= (expMovingAverage.value -
-                    previousBoundedPctOfSupply.value).mulDown(multiplier);
-            }
-
-            expMovingAverage.blockNb = previousBoundedPctOfSupply.blockNb;
+        (UintValue memory previous, UintValue memory ema) = _loadValues();
+        if (previous.blockNb < block.number) {
+            uint256 emaBlockNb = block.number - 1;
+            ema = UintValue(
+                uint64(emaBlockNb),
+                _extrapolateEMA(previous, ema, emaBlockNb)
+            );
         }
-        previousBoundedPctOfSupply.value = boundedPctOfSupply();
-        previousBoundedPctOfSupply.blockNb = block.number;
+        // also stores the migrated EMA if it was read from the legacy values
+        // and the previous update happened in this block
+        _expMovingAverage = ema;
+        _previousBoundedPctOfSupply = UintValue(
+            uint64(block.number),
+            boundedPctOfSupply().toUint192()
+        );
+    }
+
+    /// @dev Returns the previous bounded percentage of supply and the EMA.
+    /// `initialize` and every update write the packed values, so they can only be
+    /// unset in a proxy initialized before they were packed and not updated since
+    /// the upgrade, in which case the legacy values are returned
+    function _loadValues()
+        internal
+        view
+        returns (UintValue memory previous, UintValue memory ema)
+    {
+        previous = _previousBoundedPctOfSupply;
+        if (previous.blockNb != 0) {
+            return (previous, _expMovingAverage);
+        }
+
+        LegacyUintValue
+            memory legacyPrevious = __deprecated_previousBoundedPctOfSupply;
+        LegacyUintValue memory legacyEma = __deprecated_expMovingAverage;
+        previous = UintValue(
+            legacyPrevious.blockNb.toUint64(),
+            legacyPrevious.value.toUint192()
+        );
+        ema = UintValue(
+            legacyEma.blockNb.toUint64(),
+            legacyEma.value.toUint192()
+        );
+    }
+
+    /// @dev Returns `ema` extrapolated to `blockNb` assuming that the bounded percentage
+    /// of supply did not change since it was last observed, i.e. was `previous.value`
+    /// from `previous.blockNb` to `blockNb`
+    function _extrapolateEMA(
+        UintValue memory previous,
+        UintValue memory ema,
+        uint256 blockNb
+    ) internal view returns (uint192) {
+        uint256 deltaBlockNb = (blockNb - ema.blockNb) * ScaledMath.ONE;
+        uint256 multiplier = ScaledMath.ONE -
+            ExpDecay.expNeg(deltaBlockNb.divDown(windowWidth));
+
+        uint256 emaValue = ema.value;
+        if (previous.value > emaValue) {
+            emaValue += (previous.value - emaValue).mulDown(multiplier);
+        } else {
+            emaValue -= (emaValue - previous.value).mulDown(multiplier);
+        }
+        // emaValue is between the two previous values, so it fits in 192 bits
+        return uint192(emaValue);
     }
 
     function updateEMA() external {
@@ -119,7 +215,20 @@ contract BoundedERC20WithEMA is
         emit WindowWidthUpdated(windowWidth);
     }
 
+    /// @notice EMA as of the last update, see `currentBoundedPctEMA` for an up-to-date value
     function boundedPctEMA() public view returns (uint256) {
-        return uint256(expMovingAverage.value);
+        (, UintValue memory ema) = _loadValues();
+        return uint256(ema.value);
+    }
+
+    /// @notice EMA extrapolated to the previous block from the stored state,
+    /// i.e. the value `updateEMA` would store if it was called in this block.
+    /// This does not require anyone to call `updateEMA` to be up-to-date
+    function currentBoundedPctEMA() public view returns (uint256) {
+        (UintValue memory previous, UintValue memory ema) = _loadValues();
+        if (previous.blockNb == block.number) {
+            return uint256(ema.value);
+        }
+        return uint256(_extrapolateEMA(previous, ema, block.number - 1));
     }
 }
@@ -87,6 +87,33 @@ contract CouncillorNFT is
         vault.updateBaseVotingPower(to, delegate, multiplier);
     }
 
+    function mintBatch(
+        address[] calldata to,
+        uint128[] calldata multipliers,
+        address[] calldata delegates
+    ) external onlyOwner {
+        uint256 count = to.length;
+        require(
+            multipliers.length == count && delegates.length == count,
+            "mint error: length mismatch"
+        );
+        require(
+            tokenId + count <= maxSupply,
+            "mint error: supply cap would be exceeded"
+        );
+
+        uint16 nextTokenId = tokenId;
+        for (uint256 i = 0; i < count; i++) {
+            require(!_claimed[to[i]], "user has already claimed NFT");
+            _claimed[to[i]] = true;
+            _mint(to[i], nextTokenId);
+            nextTokenId++;
+        }
+        tokenId = nextTokenId;
+
+        vault.updateBaseVotingPowers(to, delegates, multipliers);
+    }
+
     function _requireValidProof(
         address to,
         uint128 multiplier,
@@ -120,11 +147,8 @@ contract CouncillorNFT is
     function _encodeProof(
         bytes32[] memory proof
     ) internal pure returns (bytes32) {
-        bytes memory proofB;
-        for (uint256 i = 0; i < proof.length; i++) {
-            proofB = bytes.concat(proofB, abi.encode(proof[i]));
-        }
-        return keccak256(proofB);
+        // equivalent to hashing the concatenation of the 32-byte proof elements
+        return keccak256(abi.encodePacked(proof));
     }
 
     function _beforeTokenTransfer(
@@ -0,0 +1,58 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "../interfaces/IDelegatingVault.sol";
+import "../interfaces/IVotingPowerAggregator.sol";
+import "../libraries/DataTypes.sol";
+
+/// @notice Delegates the available voting power of the caller in every delegating vault
+/// of the aggregator to a single delegate, in a single transaction.
+/// The router must be trusted to delegate by each vault (see `TrustedRouters.DELEGATE_VOTE_CAPABILITY`),
+/// vaults which do not trust it or do not support delegation are skipped
+contract DelegationRouter {
+    IVotingPowerAggregator public immutable votingPowerAggregator;
+
+    constructor(IVotingPowerAggregator _votingPowerAggregator) {
+        votingPowerAggregator = _votingPowerAggregator;
+    }
+
+    /// @notice Delegates all the voting power of the caller that is not delegated yet to `delegate`
+    /// @return delegated the amount delegated in each vault of the aggregator, which is zero
+    /// for the vaults that were skipped or where the caller had nothing left to delegate
+    function delegateAll(
+        address delegate
+    ) external returns (DataTypes.VaultVotingPower[] memory delegated) {
+        require(delegate != address(0), "cannot delegate to 0 address");
+
+        DataTypes.VaultWeight[] memory vaults = votingPowerAggregator
+            .listVaults();
+        delegated = new DataTypes.VaultVotingPower[](vaults.length);
+        for (uint256 i = 0; i < vaults.length; i++) {
+            address vault = vaults[i].vaultAddress;
+            delegated[i].vaultAddress = vault;
+            delegated[i].votingPower = _delegateAvailable(
+                IDelegatingVault(vault),
+                delegate
+            );
+        }
+    }
+
+    /// @dev Returns the amount delegated, or zero if the vault was skipped
+    function _delegateAvailable(
+        IDelegatingVault vault,
+        address delegate
+    ) internal returns (uint256) {
+        try vault.getAvailableToDelegate(msg.sender) returns (
+            uint256 available
+        ) {
+            if (available == 0) return 0;
+            try vault.delegateVoteFor(msg.sender, delegate, available) {
+                return available;
+            } catch {
+                return 0;
+            }
+        } catch {
+            return 0;
+        }
+    }
+}
@@ -9,13 +9,14 @@ import "../interfaces/IVotingPowerAggregator.sol";
 import "../interfaces/IGovernanceManager.sol";
 
 import "@openzeppelin/contracts/utils/Address.sol";
-import "@openzeppelin/contracts/utils/structs/EnumerableMap.sol";
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 
 contract EmergencyRecovery is GovernanceOnly {
     using Address for address;
     using ScaledMath for uint256;
-    using EnumerableMap for EnumerableMap.AddressToUintMap;
+    using SafeCast for uint256;
     using VaultsSnapshot for DataTypes.VaultSnapshot[];
+    using VaultsSnapshot for VaultsSnapshot.Registry;
 
     address public immutable safeAddress;
     address public immutable proxyAdmin;
@@ -23,13 +24,17 @@ contract EmergencyRecovery is GovernanceOnly {
     uint256 public vetoThreshold;
     uint64 public timelockDuration;
 
-    string private UPGRADE_TO_SIG = "upgrade(address,address)";
+    bytes4 internal constant _UPGRADE_SELECTOR =
+        bytes4(keccak256("upgrade(address,address)"));
 
     mapping(uint32 => DataTypes.EmergencyRecoveryProposal) private proposals;
 
-    mapping(uint32 => mapping(address => EnumerableMap.AddressToUintMap))
-        private vetos;
-    mapping(uint32 => DataTypes.VaultSnapshot[]) internal _vaultSnapshots;
+    // veto power of each voter per vault, aligned with the proposal vaults snapshot
+    mapping(uint32 => mapping(address => uint128[])) private _vetoPowers;
+    // vaults snapshots shared by the proposals created while no vault total changed
+    VaultsSnapshot.Registry internal _vaultsSnapshots;
+    // id of the vaults snapshot of each proposal in `_vaultsSnapshots`
+    mapping(uint32 => bytes32) internal _vaultsSnapshotIds;
 
     uint32 private currentProposalCount;
 
@@ -67,22 +72,23 @@ contract EmergencyRecovery is GovernanceOnly {
     function startGovernanceUpgrade(
         address newUnderlying
     ) external onlyFromSafe notSunset returns (uint32) {
-        bytes memory payload = abi.encodeWithSignature(
-            UPGRADE_TO_SIG,
+        bytes memory payload = abi.encodeWithSelector(
+            _UPGRADE_SELECTOR,
             governance,
             newUnderlying
         );
 
         uint32 propId = currentProposalCount;
-        proposals[propId].createdAt = uint64(block.timestamp);
-        proposals[propId].completesAt =
-            uint64(block.timestamp) +
-            timelockDuration;
-        proposals[propId].status = DataTypes.Status.Queued;
-        proposals[propId].payload = payload;
-        _votingPowerAggregator().createVaultsSnapshot().persist(
-            _vaultSnapshots[propId]
-        );
+        DataTypes.EmergencyRecoveryProposal storage prop = proposals[propId];
+        prop.createdAt = uint64(block.timestamp);
+        prop.completesAt = uint64(block.timestamp) + timelockDuration;
+        prop.status = DataTypes.Status.Queued;
+        prop.payload = payload;
+
+        DataTypes.VaultSnapshot[] memory snapshot = _votingPowerAggregator()
+            .createVaultsSnapshot();
+        (_vaultsSnapshotIds[propId], ) = _vaultsSnapshots.register(snapshot);
+        prop.vetoTotals = new uint256[](snapshot.length);
         currentProposalCount++;
 
         emit UpgradeProposed(propId, payload);
@@ -106,12 +112,13 @@ contract EmergencyRecovery is GovernanceOnly {
             "proposal must be queued"
         );
 
-        DataTypes.VaultSnapshot[] memory snapshot = _vaultSnapshots[proposalId];
         // the following line should never revert unless there is a bug elsewhere in the code
         // but the operation is critical, so we add it for safety
-        require(snapshot.length > 0, "no snapshot found");
-        uint256 vetoedPct = snapshot.getBallotPercentage(prop.vetos);
-        bool isVetoed = vetoedPct > vetoThreshold;
+        require(
+            _vaultsSnapshotIds[proposalId] != bytes32(0),
+            "no snapshot found"
+        );
+        bool isVetoed = prop.vetoPct > vetoThreshold;
         if (isVetoed) {
             prop.status = DataTypes.Status.Rejected;
             emit UpgradeVetoed(proposalId);
@@ -129,6 +136,8 @@ contract EmergencyRecovery is GovernanceOnly {
         DataTypes.VaultVotingPower[] castVetoPower
     );
 
+    /// @notice Vetoes the proposal with the voting power of msg.sender at the time it was created.
+    /// Vetoing again replaces the previous veto, e.g. after a delegation was received
     function veto(uint24 proposalId) external {
         DataTypes.EmergencyRecoveryProposal storage prop = proposals[
             proposalId
@@ -139,50 +148,87 @@ contract EmergencyRecovery is GovernanceOnly {
             "proposal is out of timelock"
         );
 
-        // Zero out the effect of previous vetos to avoid double-counting;
-        EnumerableMap.AddressToUintMap storage currentVetoPower = vetos[
-            proposalId
-        ][msg.sender];
-        for (uint256 i = 0; i < prop.vetos.length(); i++) {
-            (address vault, uint256 vaultVetoPower) = prop.vetos.at(i);
-            (, uint256 votingPower) = currentVetoPower.tryGet(vault);
-            prop.vetos.set(vault, vaultVetoPower - votingPower);
-        }
-
-        DataTypes.VaultVotingPower[]
-            memory newVetoPower = _votingPowerAggregator().getVotingPower(
+        IVotingPowerAggregator aggregator = _votingPowerAggregator();
+        DataTypes.VaultSnapshot[] memory snapshot = _vaultsSnapshots.snapshots[
+            _vaultsSnapshotIds[proposalId]
+        ];
+        DataTypes.VaultVotingPower[] memory newVetoPower = aggregator
+            .getVotingPower(
                 msg.sender,
-                prop.createdAt
+                prop.createdAt,
+                _vaultAddresses(snapshot)
             );
+
+        uint128[] storage previousVetoPower = _vetoPowers[proposalId][
+            msg.sender
+        ];
+        bool isNewVeto = previousVetoPower.length == 0;
+        uint256 vetoPct = prop.vetoPct;
         for (uint256 i = 0; i < newVetoPower.length; i++) {
-            DataTypes.VaultVotingPower memory vault = newVetoPower[i];
-            (, uint256 currentVetoTotal) = prop.vetos.tryGet(
-                vault.vaultAddress
+            uint256 votingPower = newVetoPower[i].votingPower;
+            if (isNewVeto) {
+                previousVetoPower.push(votingPower.toUint128());
+            }
+
+            // zero out the effect of the previous veto to avoid double-counting
+            uint256 previousVotingPower = isNewVeto ? 0 : previousVetoPower[i];
+            if (votingPower == previousVotingPower) continue;
+            if (!isNewVeto) {
+                previousVetoPower[i] = votingPower.toUint128();
+            }
+
+            vetoPct = _updateVetoTotal(
+                prop,
+                snapshot[i],
+                i,
+                vetoPct,
+                votingPower,
+                previousVotingPower
             );
-            uint256 newVetoTotal = currentVetoTotal + vault.votingPower;
-            prop.vetos.set(vault.vaultAddress, newVetoTotal);
-            vetos[proposalId][msg.sender].set(vault.vaultAddress, newVetoTotal);
         }
-        emit VetoCast(
-            proposalId,
-            _toVotingPowers(vetos[proposalId][msg.sender])
-        );
+        prop.vetoPct = vetoPct.toUint64();
+
+        emit VetoCast(proposalId, newVetoPower);
     }
 
-    function _toVotingPowers(
-        EnumerableMap.AddressToUintMap storage map
-    ) internal view returns (DataTypes.VaultVotingPower[] memory) {
-        DataTypes.VaultVotingPower[]
-            memory vvps = new DataTypes.VaultVotingPower[](map.length());
-        for (uint256 i = 0; i < map.length(); i++) {
-            (address key, uint256 value) = map.at(i);
-            vvps[i] = DataTypes.VaultVotingPower({
-                vaultAddress: key,
-                votingPower: value
-            });
-        }
+    /// @dev Replaces `previousVotingPower` with `votingPower` in the veto total of the vault at `index`
+    /// of the snapshot and returns the updated veto percentage
+    function _updateVetoTotal(
+        DataTypes.EmergencyRecoveryProposal storage prop,
+        DataTypes.VaultSnapshot memory vault,
+        uint256 index,
+        uint256 vetoPct,
+        uint256 votingPower,
+        uint256 previousVotingPower
+    ) internal returns (uint256) {
+        uint256 previousTotal = prop.vetoTotals[index];
+        uint256 newTotal = previousTotal + votingPower - previousVotingPower;
+        prop.vetoTotals[index] = newTotal;
+        return
+            vetoPct -
+            _vetoPctContribution(vault, previousTotal) +
+            _vetoPctContribution(vault, newTotal);
+    }
 
-        return vvps;
+    /// @dev Share of the veto percentage coming from `vault`, rounded as in `VaultsSnapshot.getBallotPercentage`
+    /// so that the running percentage is exactly the sum of the contributions of the current totals
+    function _vetoPctContribution(
+        DataTypes.VaultSnapshot memory vault,
+        uint256 vetoTotal
+    ) internal pure returns (uint256) {
+        if (vetoTotal == 0) return 0;
+        return vetoTotal.divDown(vault.totalVotingPower).mulDown(vault.weight);
+    }
+
+    function _vaultAddresses(
+        DataTypes.VaultSnapshot[] memory snapshot
+    ) internal pure returns (address[] memory) {
+        uint256 len = snapshot.length;
+        address[] memory vaultAddresses = new address[](len);
+        for (uint256 i = 0; i < len; i++) {
+            vaultAddresses[i] = snapshot[i].vaultAddress;
+        }
+        return vaultAddresses;
     }
 
     function setSunsetAt(uint64 _sunsetAt) external governanceOnly {
@@ -202,11 +248,23 @@ contract EmergencyRecovery is GovernanceOnly {
     function getVetoPercentage(
         uint32 proposalId
     ) external view returns (uint256) {
-        DataTypes.EmergencyRecoveryProposal storage prop = proposals[
-            proposalId
-        ];
-        DataTypes.VaultSnapshot[] memory snapshot = _vaultSnapshots[proposalId];
-        return snapshot.getBallotPercentage(prop.vetos);
+        return proposals[proposalId].vetoPct;
+    }
+
+    function getVetoTotals(
+        uint32 proposalId
+    ) external view returns (DataTypes.VaultVotingPower[] memory totals) {
+        address[] memory vaultAddresses = _vaultsSnapshots
+            .snapshots[_vaultsSnapshotIds[proposalId]]
+            .vaultAddresses();
+        uint256[] storage vetoTotals = proposals[proposalId].vetoTotals;
+        totals = new DataTypes.VaultVotingPower[](vetoTotals.length);
+        for (uint256 i = 0; i < vetoTotals.length; i++) {
+            totals[i] = DataTypes.VaultVotingPower({
+                vaultAddress: vaultAddresses[i],
+                votingPower: vetoTotals[i]
+            });
+        }
     }
 
     function _votingPowerAggregator()
@@ -24,6 +24,8 @@ contract GovernanceManager is IGovernanceManager, Initializable {
     using EnumerableSet for EnumerableSet.UintSet;
     using EnumerableMap for EnumerableMap.AddressToUintMap;
     using VaultsSnapshot for DataTypes.VaultSnapshot[];
+    using VaultsSnapshot for DataTypes.LegacyVaultSnapshot[];
+    using VaultsSnapshot for VaultsSnapshot.Registry;
 
     uint256 internal constant _MULTISIG_SUNSET_PERIOD = 90 days;
 
@@ -40,12 +42,23 @@ contract GovernanceManager is IGovernanceManager, Initializable {
     EnumerableSet.UintSet internal _activeProposals;
     EnumerableSet.UintSet internal _timelockedProposals;
     mapping(uint16 => DataTypes.Proposal) internal _proposals;
-    mapping(uint16 => DataTypes.VaultSnapshot[]) internal _vaultSnapshots;
+    // vaults snapshots of the proposals created before they were deduplicated
+    mapping(uint16 => DataTypes.LegacyVaultSnapshot[])
+        internal _legacyVaultSnapshots;
 
     mapping(address => mapping(uint16 => DataTypes.Ballot)) internal _votes;
     mapping(uint16 => mapping(DataTypes.Ballot => EnumerableMap.AddressToUintMap))
         internal _totals;
 
+    // the following are appended to the original layout as the contract is
+    // deployed behind a proxy
+
+    // vaults snapshots shared by the proposals created while no vault total changed
+    VaultsSnapshot.Registry internal _vaultsSnapshots;
+    // id of the vaults snapshot of each proposal in `_vaultsSnapshots`, zero for
+    // the proposals created before the upgrade, see `_legacyVaultSnapshots`
+    mapping(uint16 => bytes32) internal _vaultsSnapshotIds;
+
     modifier onlySelf() {
         if (msg.sender != address(this))
             revert Errors.NotAuthorized(msg.sender, address(this));
@@ -94,6 +107,8 @@ contract GovernanceManager is IGovernanceManager, Initializable {
         DataTypes.ProposalAction[] actions
     );
 
+    event VaultsSnapshotPersisted(bytes32 indexed snapshotId);
+
     function createProposal(
         DataTypes.ProposalAction[] calldata actions
     ) external override {
@@ -136,9 +151,13 @@ contract GovernanceManager is IGovernanceManager, Initializable {
             p.actions.push(actions[i]);
         }
 
-        votingPowerAggregator.createVaultsSnapshot().persist(
-            _vaultSnapshots[p.id]
+        (bytes32 snapshotId, bool persisted) = _vaultsSnapshots.register(
+            votingPowerAggregator.createVaultsSnapshot()
         );
+        _vaultsSnapshotIds[p.id] = snapshotId;
+        if (persisted) {
+            emit VaultsSnapshotPersisted(snapshotId);
+        }
 
         proposalsCount = p.id + 1;
         _activeProposals.add(uint256(p.id));
@@ -157,6 +176,79 @@ contract GovernanceManager is IGovernanceManager, Initializable {
         DataTypes.Ballot ballot
     ) external override {
         DataTypes.Proposal storage proposal = _proposals[proposalId];
+        _checkCanVote(proposal, ballot);
+
+        DataTypes.VaultVotingPower[] memory uvp = _getVotingPower(
+            proposal.createdAt,
+            _getVaultAddresses(proposalId)
+        );
+        _castVote(proposalId, ballot, uvp);
+    }
+
+    /// @notice Votes on several proposals at once.
+    /// Proposals sharing a creation time and a vaults snapshot are grouped, so that the voting
+    /// power of msg.sender is only queried once per group rather than once per proposal
+    function voteMany(
+        uint16[] calldata proposalIds,
+        DataTypes.Ballot[] calldata ballots
+    ) external override {
+        require(
+            proposalIds.length == ballots.length,
+            "proposals and ballots length mismatch"
+        );
+
+        uint256 len = proposalIds.length;
+        uint64[] memory groupsCreatedAt = new uint64[](len);
+        bytes32[] memory groupsSnapshotKeys = new bytes32[](len);
+        DataTypes.VaultVotingPower[][]
+            memory groupsVotingPower = new DataTypes.VaultVotingPower[][](len);
+
+        for (uint256 i = 0; i < len; i++) {
+            DataTypes.Proposal storage proposal = _proposals[proposalIds[i]];
+            _checkCanVote(proposal, ballots[i]);
+
+            bytes32 snapshotKey = _getVaultsSnapshotKey(proposalIds[i]);
+            uint256 group = _findVotingPowerGroup(
+                groupsCreatedAt,
+                groupsSnapshotKeys,
+                proposal.createdAt,
+                snapshotKey
+            );
+            if (groupsCreatedAt[group] == 0) {
+                groupsCreatedAt[group] = proposal.createdAt;
+                groupsSnapshotKeys[group] = snapshotKey;
+                groupsVotingPower[group] = _getVotingPower(
+                    proposal.createdAt,
+                    _getVaultAddresses(proposalIds[i])
+                );
+            }
+
+            _castVote(proposalIds[i], ballots[i], groupsVotingPower[group]);
+        }
+    }
+
+    /// @dev Returns the index of the group of proposals created at `createdAt` with the
+    /// vaults snapshot `snapshotKey`, or the index of the first unused group if there is none.
+    /// Unused groups have a zero creation time, which no existing proposal has
+    function _findVotingPowerGroup(
+        uint64[] memory groupsCreatedAt,
+        bytes32[] memory groupsSnapshotKeys,
+        uint64 createdAt,
+        bytes32 snapshotKey
+    ) internal pure returns (uint256 group) {
+        while (
+            groupsCreatedAt[group] != 0 &&
+            (groupsCreatedAt[group] != createdAt ||
+                groupsSnapshotKeys[group] != snapshotKey)
+        ) {
+            group++;
+        }
+    }
+
+    function _checkCanVote(
+        DataTypes.Proposal storage proposal,
+        DataTypes.Ballot ballot
+    ) internal view {
         require(proposal.createdAt != 0, "proposal does not exist");
         require(block.timestamp > proposal.createdAt, "voting has not started");
 
@@ -169,18 +261,58 @@ contract GovernanceManager is IGovernanceManager, Initializable {
             ballot != DataTypes.Ballot.Undefined,
             "ballot must be cast For, Against, or Abstain"
         );
+    }
 
-        DataTypes.VaultSnapshot[] memory vaultSnapshots = _vaultSnapshots[
-            proposalId
-        ];
+    /// @dev Identifies the vaults snapshot of a proposal when grouping proposals.
+    /// Proposals created before the upgrade have their own legacy snapshot, so their key
+    /// is their id, which cannot collide with the content hash of a persisted snapshot
+    function _getVaultsSnapshotKey(
+        uint16 proposalId
+    ) internal view returns (bytes32 snapshotKey) {
+        snapshotKey = _vaultsSnapshotIds[proposalId];
+        if (snapshotKey == bytes32(0)) {
+            snapshotKey = bytes32(uint256(proposalId));
+        }
+    }
 
-        DataTypes.VaultVotingPower[] memory uvp = votingPowerAggregator
-            .getVotingPower(
+    function _getVaultsSnapshot(
+        uint16 proposalId
+    ) internal view returns (DataTypes.VaultSnapshot[] memory) {
+        bytes32 snapshotId = _vaultsSnapshotIds[proposalId];
+        if (snapshotId == bytes32(0)) {
+            return _legacyVaultSnapshots[proposalId].fromLegacy();
+        }
+        return _vaultsSnapshots.snapshots[snapshotId];
+    }
+
+    /// @dev Same as `_getVaultsSnapshot` but only loads the vault addresses
+    function _getVaultAddresses(
+        uint16 proposalId
+    ) internal view returns (address[] memory) {
+        bytes32 snapshotId = _vaultsSnapshotIds[proposalId];
+        if (snapshotId == bytes32(0)) {
+            return _legacyVaultSnapshots[proposalId].vaultAddresses();
+        }
+        return _vaultsSnapshots.snapshots[snapshotId].vaultAddresses();
+    }
+
+    function _getVotingPower(
+        uint64 createdAt,
+        address[] memory vaultAddresses
+    ) internal view returns (DataTypes.VaultVotingPower[] memory) {
+        return
+            votingPowerAggregator.getVotingPower(
                 msg.sender,
-                proposal.createdAt,
-                _vaultAddresses(vaultSnapshots)
+                createdAt,
+                vaultAddresses
             );
+    }
 
+    function _castVote(
+        uint16 proposalId,
+        DataTypes.Ballot ballot,
+        DataTypes.VaultVotingPower[] memory uvp
+    ) internal {
         DataTypes.Ballot existingVote = _votes[msg.sender][proposalId];
 
         bool isNewVote = existingVote == DataTypes.Ballot.Undefined;
@@ -333,9 +465,9 @@ contract GovernanceManager is IGovernanceManager, Initializable {
     function _getCurrentPercentages(
         DataTypes.Proposal storage proposal
     ) internal view returns (uint256 for_, uint256 against, uint256 abstain) {
-        DataTypes.VaultSnapshot[] memory snapshot = _vaultSnapshots[
+        DataTypes.VaultSnapshot[] memory snapshot = _getVaultsSnapshot(
             proposal.id
-        ];
+        );
         mapping(DataTypes.Ballot => EnumerableMap.AddressToUintMap)
             storage propTotals = _totals[proposal.id];
         for_ = snapshot.getBallotPercentage(propTotals[DataTypes.Ballot.For]);
@@ -487,17 +619,6 @@ contract GovernanceManager is IGovernanceManager, Initializable {
         return proposals;
     }
 
-    function _vaultAddresses(
-        DataTypes.VaultSnapshot[] memory vaultSnapshots
-    ) internal pure returns (address[] memory) {
-        uint256 len = vaultSnapshots.length;
-        address[] memory vaultAddresses = new address[](len);
-        for (uint256 i = 0; i < len; i++) {
-            vaultAddresses[i] = vaultSnapshots[i].vaultAddress;
-        }
-        return vaultAddresses;
-    }
-
     function _getTier(
         DataTypes.ProposalAction[] memory actions
     ) internal view returns (DataTypes.Tier memory tier) {
@@ -522,7 +643,8 @@ contract GovernanceManager is IGovernanceManager, Initializable {
         return
             address(bGYD) != address(0) &&
             bGYD.totalSupply() >= limitUpgradeabilityParams.minBGYDSupply &&
-            bGYD.boundedPctEMA() > limitUpgradeabilityParams.emaThreshold &&
+            bGYD.currentBoundedPctEMA() >
+            limitUpgradeabilityParams.emaThreshold &&
             actionLevel >= limitUpgradeabilityParams.actionLevelThreshold;
     }
 
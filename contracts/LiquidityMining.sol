@@ -6,16 +6,24 @@ import "../libraries/FixedPoint.sol";
 
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 
 /// @dev Base contract for liquidity mining.
 /// `startMining` and `stopMining` would typically be implemented by the subcontract to perform
 /// its own authorization and then call the underscore versions
+/// Rewards are paid through one or more reward streams, each with its own token, emission and treasury.
+/// Stream 0 uses `rewardToken` and `daoTreasury` and is the one used by the functions without a `streamId`
 abstract contract LiquidityMining is ILiquidityMining {
     using FixedPoint for uint256;
     using SafeERC20 for IERC20;
+    using SafeCast for uint256;
 
     uint256 public override totalStaked;
 
+    // State of stream 0, which predates the other streams. The variables keep their
+    // original slots, as inheriting contracts are deployed behind proxies
+    // The three per-user mappings are legacy: a user's entries are moved to
+    // `UserStake` the first time the user is checkpointed
     uint256 internal _totalStakedIntegral;
     uint256 internal _lastCheckpointTime;
     /// @dev This contract only tracks these, we don't use it; but it may be convenient for inheriting contracts.
@@ -25,7 +33,46 @@ abstract contract LiquidityMining is ILiquidityMining {
     mapping(address => uint256) internal _perUserStaked;
 
     uint256 internal _rewardsEmissionRate;
-    uint256 public override rewardsEmissionEndTime;
+    uint256 internal _rewardsEmissionEndTime;
+
+    /// @dev State of an additional reward stream, `token` and `emissionEndTime` share a slot
+    /// as do `emissionRate` and `totalUnclaimedRewards`
+    struct RewardStream {
+        IERC20 token;
+        uint64 emissionEndTime;
+        address treasury;
+        uint128 emissionRate;
+        uint128 totalUnclaimedRewards;
+        uint256 stakedIntegral;
+    }
+
+    /// @dev Rewards of a user in an additional reward stream
+    struct UserRewards {
+        uint256 share;
+        uint256 stakedIntegral;
+    }
+
+    /// @dev Stake and stream 0 rewards of a user, `staked` and `share` share a slot
+    /// as do `stakedIntegral` and `migrated`, which is set once the legacy
+    /// per-user mappings have been moved here
+    struct UserStake {
+        uint128 staked;
+        uint128 share;
+        uint248 stakedIntegral;
+        bool migrated;
+    }
+
+    /// @dev State of the streams added after stream 0. It lives at a fixed slot
+    /// so that it does not shift the variables of the inheriting contracts
+    struct LiquidityMiningStorage {
+        // stream `i + 1` is stored at index `i`
+        RewardStream[] rewardStreams;
+        mapping(uint256 => mapping(address => UserRewards)) userRewards;
+        mapping(address => UserStake) userStakes;
+    }
+
+    bytes32 private constant _LIQUIDITY_MINING_STORAGE_SLOT =
+        bytes32(uint256(keccak256("gyroscope.LiquidityMining")) - 1);
 
     IERC20 public immutable rewardToken;
     address public immutable daoTreasury;
@@ -38,52 +85,147 @@ abstract contract LiquidityMining is ILiquidityMining {
 
     function claimRewards() external returns (uint256) {
         userCheckpoint(msg.sender);
-        uint256 amount = _perUserShare[msg.sender];
-        if (amount == 0) return 0;
-        delete _perUserShare[msg.sender];
-        emit Claim(msg.sender, amount);
-        _totalUnclaimedRewards -= amount;
-        return _mintRewards(msg.sender, amount);
+        return _claimRewards(msg.sender, msg.sender, 0);
+    }
+
+    function claimRewards(uint256 streamId) external returns (uint256) {
+        _requireRewardStream(streamId);
+        userCheckpoint(msg.sender);
+        return _claimRewards(msg.sender, msg.sender, streamId);
+    }
+
+    function claimAllRewards() external returns (uint256[] memory) {
+        return _claimAllRewards(msg.sender, msg.sender);
     }
 
     function claimableRewards(
         address beneficiary
     ) external view virtual returns (uint256) {
-        uint256 totalStakedIntegral = _totalStakedIntegral;
-        if (totalStaked > 0) {
-            totalStakedIntegral += (rewardsEmissionRate() *
-                (block.timestamp - _lastCheckpointTime)).divDown(totalStaked);
-        }
+        return claimableRewards(beneficiary, 0);
+    }
 
+    function claimableRewards(
+        address beneficiary,
+        uint256 streamId
+    ) public view virtual returns (uint256) {
         return
-            _perUserShare[beneficiary] +
-            stakedBalanceOf(beneficiary).mulDown(
-                totalStakedIntegral - _perUserStakedIntegral[beneficiary]
+            _claimableRewards(
+                beneficiary,
+                streamId,
+                _currentStakedIntegral(streamId)
             );
     }
 
+    /// @notice Same as `claimableRewards` for many beneficiaries, e.g. for reporting.
+    /// The up-to-date integral of the stream is computed only once
+    function claimableRewardsBatch(
+        address[] calldata beneficiaries
+    ) external view returns (uint256[] memory) {
+        return claimableRewardsBatch(beneficiaries, 0);
+    }
+
+    function claimableRewardsBatch(
+        address[] calldata beneficiaries,
+        uint256 streamId
+    ) public view returns (uint256[] memory amounts) {
+        uint256 totalStakedIntegral = _currentStakedIntegral(streamId);
+        amounts = new uint256[](beneficiaries.length);
+        for (uint256 i = 0; i < beneficiaries.length; i++) {
+            amounts[i] = _claimableRewards(
+                beneficiaries[i],
+                streamId,
+                totalStakedIntegral
+            );
+        }
+    }
+
     function stakedBalanceOf(address account) public view returns (uint256) {
-        return _perUserStaked[account];
+        UserStake storage userStake = _liquidityMiningStorage().userStakes[
+            account
+        ];
+        return
+            userStake.migrated
+                ? uint256(userStake.staked)
+                : _perUserStaked[account];
+    }
+
+    function rewardStreamsCount() external view returns (uint256) {
+        return _liquidityMiningStorage().rewardStreams.length + 1;
+    }
+
+    function rewardStreamToken(
+        uint256 streamId
+    ) external view returns (address) {
+        if (streamId == 0) return address(rewardToken);
+        return address(_rewardStream(streamId).token);
+    }
+
+    function rewardStreamTreasury(
+        uint256 streamId
+    ) external view returns (address) {
+        if (streamId == 0) return daoTreasury;
+        return _rewardStream(streamId).treasury;
     }
 
     function globalCheckpoint() public {
+        uint256 lastCheckpointTime = _lastCheckpointTime;
+        if (lastCheckpointTime == block.timestamp) return;
+
         uint256 totalStaked_ = totalStaked;
         if (totalStaked_ > 0) {
-            uint256 elapsedTime = block.timestamp - _lastCheckpointTime;
+            uint256 elapsedTime = block.timestamp - lastCheckpointTime;
             uint256 newRewards = rewardsEmissionRate() * elapsedTime;
-            _totalStakedIntegral += newRewards.divDown(totalStaked_);
-            _totalUnclaimedRewards += newRewards;
+            if (newRewards > 0) {
+                _totalStakedIntegral += newRewards.divDown(totalStaked_);
+                _totalUnclaimedRewards += newRewards;
+            }
+
+            RewardStream[] storage streams = _liquidityMiningStorage()
+                .rewardStreams;
+            for (uint256 i = 0; i < streams.length; i++) {
+                RewardStream storage stream = streams[i];
+                uint256 emissionRate = _emissionRate(stream);
+                if (emissionRate == 0) continue;
+                newRewards = emissionRate * elapsedTime;
+                stream.stakedIntegral += newRewards.divDown(totalStaked_);
+                stream.totalUnclaimedRewards += newRewards.toUint128();
+            }
         }
         _lastCheckpointTime = block.timestamp;
     }
 
     function userCheckpoint(address account) public virtual {
         globalCheckpoint();
+        UserStake storage userStake = _userStake(account);
+        uint256 staked = userStake.staked;
+
         uint256 totalStakedIntegral = _totalStakedIntegral;
-        _perUserShare[account] += stakedBalanceOf(account).mulDown(
-            totalStakedIntegral - _perUserStakedIntegral[account]
-        );
-        _perUserStakedIntegral[account] = totalStakedIntegral;
+        uint256 userStakedIntegral = userStake.stakedIntegral;
+        // the user state is only written if rewards accrued since its last checkpoint
+        if (userStakedIntegral != totalStakedIntegral) {
+            if (staked > 0) {
+                userStake.share = (userStake.share +
+                    staked.mulDown(totalStakedIntegral - userStakedIntegral))
+                    .toUint128();
+            }
+            userStake.stakedIntegral = totalStakedIntegral.toUint248();
+        }
+
+        LiquidityMiningStorage storage s = _liquidityMiningStorage();
+        uint256 streamsCount = s.rewardStreams.length;
+        for (uint256 i = 0; i < streamsCount; i++) {
+            totalStakedIntegral = s.rewardStreams[i].stakedIntegral;
+            UserRewards storage userRewards = s.userRewards[i + 1][account];
+            userStakedIntegral = userRewards.stakedIntegral;
+            if (userStakedIntegral == totalStakedIntegral) continue;
+
+            if (staked > 0) {
+                userRewards.share += staked.mulDown(
+                    totalStakedIntegral - userStakedIntegral
+                );
+            }
+            userRewards.stakedIntegral = totalStakedIntegral;
+        }
     }
 
     /// @dev this is a helper function to be used by the inheriting contract
@@ -92,18 +234,42 @@ abstract contract LiquidityMining is ILiquidityMining {
     function _stake(address account, uint256 amount) internal {
         userCheckpoint(account);
         totalStaked += amount;
-        _perUserStaked[account] += amount;
+        UserStake storage userStake = _userStake(account);
+        userStake.staked = (userStake.staked + amount).toUint128();
         emit Stake(account, amount);
     }
 
     /// @dev same as `_stake` but for unstaking
     function _unstake(address account, uint256 amount) internal {
         userCheckpoint(account);
-        _perUserStaked[account] -= amount;
+        UserStake storage userStake = _userStake(account);
+        userStake.staked = (userStake.staked - amount).toUint128();
         totalStaked -= amount;
         emit Unstake(account, amount);
     }
 
+    /// @dev Helper function for the inheriting contract. Authorization should be performed by the inheriting contract.
+    /// Each stream must use a different token, as the leftover rewards of a stream are computed from the balance of its token
+    function _addRewardStream(
+        address token,
+        address treasury
+    ) internal returns (uint256 streamId) {
+        require(token != address(rewardToken), "reward token already used");
+        RewardStream[] storage streams = _liquidityMiningStorage()
+            .rewardStreams;
+        for (uint256 i = 0; i < streams.length; i++) {
+            require(
+                address(streams[i].token) != token,
+                "reward token already used"
+            );
+        }
+        streamId = streams.length + 1;
+        RewardStream storage stream = streams.push();
+        stream.token = IERC20(token);
+        stream.treasury = treasury;
+        emit RewardStreamAdded(streamId, token, treasury);
+    }
+
     /// @dev Helper function for the inheriting contract. Authorization should be performed by the inheriting contract.
     function _startMining(
         address rewardsFrom,
@@ -113,32 +279,232 @@ abstract contract LiquidityMining is ILiquidityMining {
         globalCheckpoint();
         rewardToken.safeTransferFrom(rewardsFrom, address(this), amount);
         _rewardsEmissionRate = amount / (endTime - block.timestamp);
-        rewardsEmissionEndTime = endTime;
+        _rewardsEmissionEndTime = endTime;
         emit StartMining(amount, endTime);
     }
 
+    /// @dev Same as `_startMining` for the reward stream `streamId`
+    function _startMining(
+        uint256 streamId,
+        address rewardsFrom,
+        uint256 amount,
+        uint256 endTime
+    ) internal {
+        if (streamId == 0) {
+            _startMining(rewardsFrom, amount, endTime);
+            return;
+        }
+
+        RewardStream storage stream = _rewardStream(streamId);
+        globalCheckpoint();
+        stream.token.safeTransferFrom(rewardsFrom, address(this), amount);
+        stream.emissionRate = (amount / (endTime - block.timestamp))
+            .toUint128();
+        stream.emissionEndTime = endTime.toUint64();
+        emit RewardStreamStartMining(streamId, amount, endTime);
+    }
+
     /// @dev same as `_startLiquidityMining` but for stopping.
     function _stopMining() internal {
         globalCheckpoint();
         uint256 reimbursementAmount = rewardToken.balanceOf(address(this)) -
             _totalUnclaimedRewards;
         rewardToken.safeTransfer(daoTreasury, reimbursementAmount);
-        rewardsEmissionEndTime = 0;
+        _rewardsEmissionEndTime = 0;
         emit StopMining();
     }
 
+    /// @dev Same as `_stopMining` for the reward stream `streamId`
+    function _stopMining(uint256 streamId) internal {
+        if (streamId == 0) {
+            _stopMining();
+            return;
+        }
+
+        RewardStream storage stream = _rewardStream(streamId);
+        globalCheckpoint();
+        IERC20 token = stream.token;
+        uint256 reimbursementAmount = token.balanceOf(address(this)) -
+            stream.totalUnclaimedRewards;
+        token.safeTransfer(stream.treasury, reimbursementAmount);
+        stream.emissionEndTime = 0;
+        emit RewardStreamStopMining(streamId);
+    }
+
+    /// @dev Helper function for the inheriting contract, e.g. to let a trusted router claim for `account`.
+    /// Authorization should be performed by the inheriting contract.
+    function _claimAllRewards(
+        address account,
+        address receiver
+    ) internal returns (uint256[] memory amounts) {
+        userCheckpoint(account);
+        uint256 streamsCount = _liquidityMiningStorage().rewardStreams.length +
+            1;
+        amounts = new uint256[](streamsCount);
+        for (uint256 i = 0; i < streamsCount; i++) {
+            amounts[i] = _claimRewards(account, receiver, i);
+        }
+    }
+
+    /// @dev Pays the accrued rewards of `account` in `streamId` to `receiver`.
+    /// `account` must have been checkpointed
+    function _claimRewards(
+        address account,
+        address receiver,
+        uint256 streamId
+    ) internal returns (uint256) {
+        uint256 amount;
+        if (streamId == 0) {
+            UserStake storage userStake = _userStake(account);
+            amount = userStake.share;
+            if (amount == 0) return 0;
+            userStake.share = 0;
+            _totalUnclaimedRewards -= amount;
+            emit Claim(account, amount);
+        } else {
+            UserRewards storage userRewards = _liquidityMiningStorage()
+                .userRewards[streamId][account];
+            amount = userRewards.share;
+            if (amount == 0) return 0;
+            userRewards.share = 0;
+            _rewardStream(streamId).totalUnclaimedRewards -= amount
+                .toUint128();
+            emit RewardStreamClaim(account, streamId, amount);
+        }
+        return _mintRewards(streamId, receiver, amount);
+    }
+
     function _mintRewards(
+        uint256 streamId,
         address beneficiary,
         uint256 amount
     ) internal virtual returns (uint256) {
-        rewardToken.safeTransfer(beneficiary, amount);
+        IERC20 token = streamId == 0
+            ? rewardToken
+            : _rewardStream(streamId).token;
+        token.safeTransfer(beneficiary, amount);
         return amount;
     }
 
     function rewardsEmissionRate() public view override returns (uint256) {
         return
-            block.timestamp <= rewardsEmissionEndTime
+            block.timestamp <= _rewardsEmissionEndTime
                 ? _rewardsEmissionRate
                 : 0;
     }
+
+    function rewardsEmissionRate(
+        uint256 streamId
+    ) public view override returns (uint256) {
+        if (streamId == 0) return rewardsEmissionRate();
+        return _emissionRate(_rewardStream(streamId));
+    }
+
+    function rewardsEmissionEndTime() public view override returns (uint256) {
+        return _rewardsEmissionEndTime;
+    }
+
+    function rewardsEmissionEndTime(
+        uint256 streamId
+    ) public view override returns (uint256) {
+        if (streamId == 0) return _rewardsEmissionEndTime;
+        return _rewardStream(streamId).emissionEndTime;
+    }
+
+    /// @dev Returns the integral of `streamId` as it would be after a global checkpoint
+    function _currentStakedIntegral(
+        uint256 streamId
+    ) internal view returns (uint256 totalStakedIntegral) {
+        totalStakedIntegral = streamId == 0
+            ? _totalStakedIntegral
+            : _rewardStream(streamId).stakedIntegral;
+        uint256 totalStaked_ = totalStaked;
+        if (totalStaked_ > 0) {
+            totalStakedIntegral += (rewardsEmissionRate(streamId) *
+                (block.timestamp - _lastCheckpointTime)).divDown(totalStaked_);
+        }
+    }
+
+    function _claimableRewards(
+        address beneficiary,
+        uint256 streamId,
+        uint256 totalStakedIntegral
+    ) internal view returns (uint256) {
+        uint256 share;
+        uint256 userStakedIntegral;
+        if (streamId == 0) {
+            UserStake memory userStake = _liquidityMiningStorage().userStakes[
+                beneficiary
+            ];
+            if (userStake.migrated) {
+                share = userStake.share;
+                userStakedIntegral = userStake.stakedIntegral;
+            } else {
+                share = _perUserShare[beneficiary];
+                userStakedIntegral = _perUserStakedIntegral[beneficiary];
+            }
+        } else {
+            UserRewards memory userRewards = _liquidityMiningStorage()
+                .userRewards[streamId][beneficiary];
+            share = userRewards.share;
+            userStakedIntegral = userRewards.stakedIntegral;
+        }
+        return
+            share +
+            stakedBalanceOf(beneficiary).mulDown(
+                totalStakedIntegral - userStakedIntegral
+            );
+    }
+
+    /// @dev Returns the stake of `account`, moving its legacy per-user entries
+    /// to the packed struct if this was not done yet
+    function _userStake(
+        address account
+    ) internal returns (UserStake storage userStake) {
+        userStake = _liquidityMiningStorage().userStakes[account];
+        if (userStake.migrated) return userStake;
+
+        userStake.staked = _perUserStaked[account].toUint128();
+        userStake.share = _perUserShare[account].toUint128();
+        userStake.stakedIntegral = _perUserStakedIntegral[account].toUint248();
+        userStake.migrated = true;
+        delete _perUserStaked[account];
+        delete _perUserShare[account];
+        delete _perUserStakedIntegral[account];
+    }
+
+    function _requireRewardStream(uint256 streamId) internal view {
+        require(
+            streamId <= _liquidityMiningStorage().rewardStreams.length,
+            "reward stream does not exist"
+        );
+    }
+
+    /// @dev Returns an additional stream, i.e. `streamId` must not be 0
+    function _rewardStream(
+        uint256 streamId
+    ) internal view returns (RewardStream storage) {
+        _requireRewardStream(streamId);
+        return _liquidityMiningStorage().rewardStreams[streamId - 1];
+    }
+
+    function _emissionRate(
+        RewardStream storage stream
+    ) internal view returns (uint256) {
+        return
+            block.timestamp <= stream.emissionEndTime
+                ? stream.emissionRate
+                : 0;
+    }
+
+    function _liquidityMiningStorage()
+        internal
+        pure
+        returns (LiquidityMiningStorage storage s)
+    {
+        bytes32 slot = _LIQUIDITY_MINING_STORAGE_SLOT;
+        assembly {
+            s.slot := slot
+        }
+    }
 }
@@ -0,0 +1,133 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "../interfaces/ILiquidityMining.sol";
+
+/// @notice Claims the rewards of the caller from several `LiquidityMining` vaults in a single transaction
+/// and sends a single transfer per reward token.
+/// The router must be trusted to claim rewards by each vault (see `TrustedRouters.CLAIM_REWARDS_CAPABILITY`)
+/// and never holds funds between calls
+contract RewardClaimRouter {
+    using SafeERC20 for IERC20;
+
+    event RewardsClaimed(
+        address indexed account,
+        address indexed token,
+        uint256 amount
+    );
+
+    /// @notice Claims all the rewards of the caller in `vaults`
+    /// @return tokens the reward tokens, each appearing once
+    /// @return amounts the amount of each token sent to the caller
+    function claimRewards(
+        ILiquidityMining[] calldata vaults
+    ) external returns (address[] memory tokens, uint256[] memory amounts) {
+        uint256[][] memory claimed = new uint256[][](vaults.length);
+        for (uint256 i = 0; i < vaults.length; i++) {
+            claimed[i] = vaults[i].claimAllRewardsFor(msg.sender);
+        }
+
+        (tokens, amounts) = _consolidate(vaults, claimed);
+        for (uint256 i = 0; i < tokens.length; i++) {
+            IERC20(tokens[i]).safeTransfer(msg.sender, amounts[i]);
+            emit RewardsClaimed(msg.sender, tokens[i], amounts[i]);
+        }
+    }
+
+    /// @notice Returns the rewards `account` would receive by calling `claimRewards` with `vaults`
+    function claimableRewardsBatch(
+        address account,
+        ILiquidityMining[] calldata vaults
+    )
+        external
+        view
+        returns (address[] memory tokens, uint256[] memory amounts)
+    {
+        uint256[][] memory claimable = new uint256[][](vaults.length);
+        for (uint256 i = 0; i < vaults.length; i++) {
+            ILiquidityMining vault = vaults[i];
+            uint256 streamsCount = vault.rewardStreamsCount();
+            claimable[i] = new uint256[](streamsCount);
+            for (uint256 j = 0; j < streamsCount; j++) {
+                claimable[i][j] = vault.claimableRewards(account, j);
+            }
+        }
+        return _consolidate(vaults, claimable);
+    }
+
+    /// @dev Sums `rewards`, indexed by vault and reward stream, per reward token
+    function _consolidate(
+        ILiquidityMining[] calldata vaults,
+        uint256[][] memory rewards
+    ) internal view returns (address[] memory, uint256[] memory) {
+        uint256 maxTokensCount;
+        for (uint256 i = 0; i < rewards.length; i++) {
+            maxTokensCount += rewards[i].length;
+        }
+
+        address[] memory tokens = new address[](maxTokensCount);
+        uint256[] memory amounts = new uint256[](maxTokensCount);
+        uint256 tokensCount;
+        for (uint256 i = 0; i < vaults.length; i++) {
+            tokensCount = _addVaultRewards(
+                tokens,
+                amounts,
+                tokensCount,
+                vaults[i],
+                rewards[i]
+            );
+        }
+
+        address[] memory consolidatedTokens = new address[](tokensCount);
+        uint256[] memory consolidatedAmounts = new uint256[](tokensCount);
+        for (uint256 i = 0; i < tokensCount; i++) {
+            consolidatedTokens[i] = tokens[i];
+            consolidatedAmounts[i] = amounts[i];
+        }
+        return (consolidatedTokens, consolidatedAmounts);
+    }
+
+    function _addVaultRewards(
+        address[] memory tokens,
+        uint256[] memory amounts,
+        uint256 tokensCount,
+        ILiquidityMining vault,
+        uint256[] memory vaultRewards
+    ) internal view returns (uint256) {
+        for (uint256 j = 0; j < vaultRewards.length; j++) {
+            if (vaultRewards[j] == 0) continue;
+            tokensCount = _addAmount(
+                tokens,
+                amounts,
+                tokensCount,
+                vault.rewardStreamToken(j),
+                vaultRewards[j]
+            );
+        }
+        return tokensCount;
+    }
+
+    /// @dev Adds `amount` of `token` to the first `tokensCount` entries of `tokens` and `amounts`,
+    /// appending `token` if needed, and returns the new number of entries
+    /// The number of distinct reward tokens is small, so a linear search is cheaper than a mapping
+    function _addAmount(
+        address[] memory tokens,
+        uint256[] memory amounts,
+        uint256 tokensCount,
+        address token,
+        uint256 amount
+    ) internal pure returns (uint256) {
+        for (uint256 i = 0; i < tokensCount; i++) {
+            if (tokens[i] == token) {
+                amounts[i] += amount;
+                return tokensCount;
+            }
+        }
+        tokens[tokensCount] = token;
+        amounts[tokensCount] = amount;
+        return tokensCount + 1;
+    }
+}
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 pragma solidity ^0.8.17;
 
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
 
 import "./access/ImmutableOwner.sol";
@@ -13,6 +14,7 @@ import "../interfaces/IVault.sol";
 
 contract VotingPowerAggregator is IVotingPowerAggregator, ImmutableOwner {
     using ScaledMath for uint256;
+    using SafeCast for uint256;
     using EnumerableSet for EnumerableSet.AddressSet;
 
     EnumerableSet.AddressSet internal _vaultAddresses;
@@ -46,7 +48,7 @@ contract VotingPowerAggregator is IVotingPowerAggregator, ImmutableOwner {
         return
             DataTypes.VaultSnapshot({
                 vaultAddress: vaultAddress,
-                weight: getVaultWeight(vaultAddress),
+                weight: getVaultWeight(vaultAddress).toUint96(),
                 totalVotingPower: IVault(vaultAddress).getTotalRawVotingPower()
             });
     }
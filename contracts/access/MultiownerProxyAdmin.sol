@@ -111,6 +111,49 @@ contract MultiownerProxyAdmin {
         proxy.upgradeToAndCall{value: msg.value}(implementation, data);
     }
 
+    /**
+     * @dev Upgrades each of `proxies` to the implementation at the same index, atomically.
+     *
+     * Requirements:
+     *
+     * - This contract must be the admin of each of `proxies`.
+     */
+    function upgradeMany(
+        TransparentUpgradeableProxy[] calldata proxies,
+        address[] calldata implementations
+    ) public virtual onlyOwner {
+        require(
+            proxies.length == implementations.length,
+            "proxies and implementations length mismatch"
+        );
+        for (uint256 i = 0; i < proxies.length; i++) {
+            proxies[i].upgradeTo(implementations[i]);
+        }
+    }
+
+    /**
+     * @dev Upgrades each of `proxies` to the implementation at the same index and calls a function
+     * on it with the data at the same index, atomically. Unlike {upgradeAndCall}, no value is sent.
+     *
+     * Requirements:
+     *
+     * - This contract must be the admin of each of `proxies`.
+     */
+    function upgradeAndCallMany(
+        TransparentUpgradeableProxy[] calldata proxies,
+        address[] calldata implementations,
+        bytes[] calldata data
+    ) public virtual onlyOwner {
+        require(
+            proxies.length == implementations.length &&
+                proxies.length == data.length,
+            "proxies and implementations length mismatch"
+        );
+        for (uint256 i = 0; i < proxies.length; i++) {
+            proxies[i].upgradeToAndCall(implementations[i], data[i]);
+        }
+    }
+
     function addOwner(address newOwner) public virtual onlyOwner {
         _addOwner(newOwner);
     }
@@ -0,0 +1,66 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "../../libraries/Errors.sol";
+
+/// @notice Trusted routers are contracts allowed to act on behalf of the accounts calling them,
+/// e.g. to claim rewards from several vaults in a single transaction.
+/// A router is trusted for a single capability, so that e.g. a router trusted to claim
+/// rewards cannot delegate voting power.
+/// The inheriting contract is responsible for authorizing `_setTrustedRouter`
+abstract contract TrustedRouters {
+    /// @notice Capability of claiming the rewards of an account, see `claimAllRewardsFor`
+    bytes32 public constant CLAIM_REWARDS_CAPABILITY =
+        keccak256("CLAIM_REWARDS_CAPABILITY");
+    /// @notice Capability of delegating the voting power of an account, see `delegateVoteFor`
+    bytes32 public constant DELEGATE_VOTE_CAPABILITY =
+        keccak256("DELEGATE_VOTE_CAPABILITY");
+
+    /// @dev Kept at a fixed slot rather than in the sequential layout, as this contract
+    /// was added to vaults that are already deployed behind proxies
+    struct TrustedRoutersStorage {
+        mapping(bytes32 => mapping(address => bool)) trustedRouters;
+    }
+
+    bytes32 private constant _TRUSTED_ROUTERS_STORAGE_SLOT =
+        bytes32(uint256(keccak256("gyroscope.access.TrustedRouters")) - 1);
+
+    event TrustedRouterSet(
+        bytes32 indexed capability,
+        address indexed router,
+        bool trusted
+    );
+
+    modifier onlyTrustedRouter(bytes32 capability) {
+        if (!_trustedRoutersStorage().trustedRouters[capability][msg.sender])
+            revert Errors.UntrustedRouter(msg.sender);
+        _;
+    }
+
+    function isTrustedRouter(
+        bytes32 capability,
+        address router
+    ) external view returns (bool) {
+        return _trustedRoutersStorage().trustedRouters[capability][router];
+    }
+
+    function _setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) internal {
+        _trustedRoutersStorage().trustedRouters[capability][router] = trusted;
+        emit TrustedRouterSet(capability, router, trusted);
+    }
+
+    function _trustedRoutersStorage()
+        private
+        pure
+        returns (TrustedRoutersStorage storage s)
+    {
+        bytes32 slot = _TRUSTED_ROUTERS_STORAGE_SLOT;
+        assembly {
+            s.slot := slot
+        }
+    }
+}
@@ -3,35 +3,59 @@ pragma solidity ^0.8.17;
 
 import "@gnosis.pm/safe-contracts/contracts/common/Enum.sol";
 import "@gnosis.pm/safe-contracts/contracts/GnosisSafe.sol";
+import "@gnosis.pm/safe-contracts/contracts/libraries/MultiSendCallOnly.sol";
 import "../access/GovernanceOnly.sol";
 
 contract SafeManagementModule is GovernanceOnly {
     GnosisSafe private safe;
 
+    /// @dev `MultiSendCallOnly` deployment used to batch the owner updates of `setSigners`.
+    /// The safe delegate-calls it, so it must be the canonical deployment of the
+    /// version of the safe contracts in use, which is only checked to be a contract here
+    address private immutable multiSend;
+
     constructor(
         address payable _safe,
-        address _governance
+        address _governance,
+        address _multiSend
     ) GovernanceOnly(_governance) {
+        require(_multiSend != address(0), "multiSend cannot be 0 address");
+        require(_multiSend.code.length > 0, "multiSend is not a contract");
         safe = GnosisSafe(_safe);
+        multiSend = _multiSend;
     }
 
+    /// @notice Replaces the owners of the safe by `signers`. All the owner updates are
+    /// executed by the safe in a single MultiSend batch
     function setSigners(
         address[] calldata signers,
         uint256 threshold
     ) external governanceOnly {
         address[] memory oldOwners = safe.getOwners();
+        bytes memory transactions;
         if (signers.length >= oldOwners.length) {
             // The new list is longer the old list, therefore:
             // - we swap old for new up until the length of the old list
             // - and add excess members of the new list
             address previousOwner = address(0x1); // head of list
             for (uint256 i = 0; i < oldOwners.length; i++) {
-                _swapOwner(previousOwner, oldOwners[i], signers[i]);
+                transactions = _appendSwapOwner(
+                    transactions,
+                    previousOwner,
+                    oldOwners[i],
+                    signers[i]
+                );
                 previousOwner = signers[i];
             }
 
             for (uint256 i = oldOwners.length; i < signers.length; i++) {
-                _addOwnerWithThreshold(signers[i], threshold);
+                transactions = _appendSafeCall(
+                    transactions,
+                    abi.encodeCall(
+                        OwnerManager.addOwnerWithThreshold,
+                        (signers[i], threshold)
+                    )
+                );
             }
         } else {
             // The old list is longer the new list, therefore:
@@ -39,14 +63,33 @@ contract SafeManagementModule is GovernanceOnly {
             // - and remove excess members from the old list.
             address previousOwner = address(0x1); // head of list
             for (uint256 i = 0; i < signers.length; i++) {
-                _swapOwner(previousOwner, oldOwners[i], signers[i]);
+                transactions = _appendSwapOwner(
+                    transactions,
+                    previousOwner,
+                    oldOwners[i],
+                    signers[i]
+                );
                 previousOwner = signers[i];
             }
 
             for (uint256 i = signers.length; i < oldOwners.length; i++) {
-                _removeOwner(previousOwner, oldOwners[i], threshold);
+                transactions = _appendSafeCall(
+                    transactions,
+                    abi.encodeCall(
+                        OwnerManager.removeOwner,
+                        (previousOwner, oldOwners[i], threshold)
+                    )
+                );
             }
         }
+
+        bool result = safe.execTransactionFromModule(
+            multiSend,
+            0,
+            abi.encodeCall(MultiSendCallOnly.multiSend, (transactions)),
+            Enum.Operation.DelegateCall
+        );
+        require(result, "safe call failed");
     }
 
     function swapOwner(
@@ -177,4 +220,39 @@ contract SafeManagementModule is GovernanceOnly {
         );
         require(result, "safe call failed");
     }
+
+    function _appendSwapOwner(
+        bytes memory transactions,
+        address prevOwner,
+        address oldOwner,
+        address newOwner
+    ) internal view returns (bytes memory) {
+        return
+            _appendSafeCall(
+                transactions,
+                abi.encodeCall(
+                    OwnerManager.swapOwner,
+                    (prevOwner, oldOwner, newOwner)
+                )
+            );
+    }
+
+    /// @dev Appends a call from the safe to itself with `data`, in the `MultiSend` encoding:
+    /// operation (1 byte), to (20 bytes), value (32 bytes), data length (32 bytes), data
+    function _appendSafeCall(
+        bytes memory transactions,
+        bytes memory data
+    ) internal view returns (bytes memory) {
+        return
+            bytes.concat(
+                transactions,
+                abi.encodePacked(
+                    uint8(Enum.Operation.Call),
+                    address(safe),
+                    uint256(0),
+                    data.length,
+                    data
+                )
+            );
+    }
 }
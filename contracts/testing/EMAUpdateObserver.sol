@@ -0,0 +1,16 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "../BoundedERC20WithEMA.sol";
+
+/// @dev Reads `currentBoundedPctEMA` and updates the EMA in the same block,
+/// so that tests can compare both values exactly
+contract EMAUpdateObserver {
+    function currentAndUpdatedEMA(
+        BoundedERC20WithEMA token
+    ) external returns (uint256 current, uint256 updated) {
+        current = token.currentBoundedPctEMA();
+        token.updateEMA();
+        updated = token.boundedPctEMA();
+    }
+}
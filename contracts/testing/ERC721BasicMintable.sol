@@ -0,0 +1,13 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "@openzeppelin/contracts/token/ERC721/ERC721.sol";
+
+/// @dev Same as `ERC721Mintable` without `ERC721Enumerable`, used to measure the cost of enumeration
+contract ERC721BasicMintable is ERC721 {
+    constructor() ERC721("MyNFT", "MNFT") {}
+
+    function mint(address to, uint256 tokenId) public virtual {
+        _mint(to, tokenId);
+    }
+}
@@ -0,0 +1,27 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+/// @dev Vault exposing only the queries of `IVault` that predate `getRawVotingPowers`
+contract LegacyMockVault {
+    mapping(address => uint256) public rawVotingPowers;
+    uint256 public totalRawVotingPower;
+
+    function updateVotingPower(address user, uint256 amount) external {
+        totalRawVotingPower =
+            totalRawVotingPower -
+            rawVotingPowers[user] +
+            amount;
+        rawVotingPowers[user] = amount;
+    }
+
+    function getRawVotingPower(
+        address user,
+        uint256
+    ) external view returns (uint256) {
+        return rawVotingPowers[user];
+    }
+
+    function getTotalRawVotingPower() external view returns (uint256) {
+        return totalRawVotingPower;
+    }
+}
@@ -28,7 +28,7 @@ contract MockVault is BaseDelegatingVault {
         _;
     }
 
-    constructor() {
+    constructor() EIP712("MockVault", "1") {
         _admins.add(msg.sender);
     }
 
@@ -40,6 +40,14 @@ contract MockVault is BaseDelegatingVault {
         return _admins.values();
     }
 
+    function setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) external onlyAdmin {
+        _setTrustedRouter(capability, router, trusted);
+    }
+
     function updateVotingPower(
         address user,
         uint256 amount
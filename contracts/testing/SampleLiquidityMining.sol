@@ -1,9 +1,10 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 pragma solidity ^0.8.17;
 
+import "../access/TrustedRouters.sol";
 import "../LiquidityMining.sol";
 
-contract SampleLiquidityMining is LiquidityMining {
+contract SampleLiquidityMining is TrustedRouters, LiquidityMining {
     IERC20 public depositToken;
 
     constructor(
@@ -24,6 +25,18 @@ contract SampleLiquidityMining is LiquidityMining {
         depositToken.transfer(msg.sender, amount);
     }
 
+    /// @dev moves the stake of msg.sender back to the legacy per-user mappings,
+    /// as it was stored before `UserStake` was introduced
+    function useLegacyStake() external {
+        UserStake memory userStake = _liquidityMiningStorage().userStakes[
+            msg.sender
+        ];
+        delete _liquidityMiningStorage().userStakes[msg.sender];
+        _perUserStaked[msg.sender] = userStake.staked;
+        _perUserShare[msg.sender] = userStake.share;
+        _perUserStakedIntegral[msg.sender] = userStake.stakedIntegral;
+    }
+
     function startMining(
         address rewardsFrom,
         uint256 amount,
@@ -35,4 +48,43 @@ contract SampleLiquidityMining is LiquidityMining {
     function stopMining() external override {
         _stopMining();
     }
+
+    function addRewardStream(
+        address token,
+        address treasury
+    ) external override returns (uint256) {
+        return _addRewardStream(token, treasury);
+    }
+
+    function startMining(
+        uint256 streamId,
+        address rewardsFrom,
+        uint256 amount,
+        uint256 endTime
+    ) external override {
+        _startMining(streamId, rewardsFrom, amount, endTime);
+    }
+
+    function stopMining(uint256 streamId) external override {
+        _stopMining(streamId);
+    }
+
+    function setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) external {
+        _setTrustedRouter(capability, router, trusted);
+    }
+
+    function claimAllRewardsFor(
+        address account
+    )
+        external
+        override
+        onlyTrustedRouter(CLAIM_REWARDS_CAPABILITY)
+        returns (uint256[] memory)
+    {
+        return _claimAllRewards(account, msg.sender);
+    }
 }
@@ -0,0 +1,43 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "../BoundedERC20WithEMA.sol";
+
+/// @dev testing contract that allows to store the values as the token did before they were packed
+contract TestingBoundedERC20WithEMA is BoundedERC20WithEMA {
+    constructor(
+        address governance,
+        address _underlying
+    ) BoundedERC20WithEMA(governance, _underlying) {}
+
+    /// @dev moves the packed values to the legacy storage
+    function useLegacyValues() external {
+        __deprecated_previousBoundedPctOfSupply = LegacyUintValue(
+            _previousBoundedPctOfSupply.blockNb,
+            _previousBoundedPctOfSupply.value
+        );
+        __deprecated_expMovingAverage = LegacyUintValue(
+            _expMovingAverage.blockNb,
+            _expMovingAverage.value
+        );
+        delete _previousBoundedPctOfSupply;
+        delete _expMovingAverage;
+    }
+
+    /// @dev stores arbitrary legacy values, e.g. as written by a version with
+    /// another convention for the EMA block
+    function setLegacyValues(
+        uint256 previousBlockNb,
+        uint256 previousValue,
+        uint256 emaBlockNb,
+        uint256 emaValue
+    ) external {
+        __deprecated_previousBoundedPctOfSupply = LegacyUintValue(
+            previousBlockNb,
+            previousValue
+        );
+        __deprecated_expMovingAverage = LegacyUintValue(emaBlockNb, emaValue);
+        delete _previousBoundedPctOfSupply;
+        delete _expMovingAverage;
+    }
+}
@@ -16,4 +16,22 @@ contract TestingGovernanceManager is GovernanceManager {
     function executeCall(address target, bytes calldata data) external {
         target.functionCall(data);
     }
+
+    /// @dev stores the vaults snapshot of `proposalId` as the proposals created
+    /// before the upgrade did
+    function useLegacyVaultsSnapshot(uint16 proposalId) external {
+        DataTypes.VaultSnapshot[] memory snapshot = _getVaultsSnapshot(
+            proposalId
+        );
+        for (uint256 i = 0; i < snapshot.length; i++) {
+            _legacyVaultSnapshots[proposalId].push(
+                DataTypes.LegacyVaultSnapshot({
+                    vaultAddress: snapshot[i].vaultAddress,
+                    weight: snapshot[i].weight,
+                    totalVotingPower: snapshot[i].totalVotingPower
+                })
+            );
+        }
+        delete _vaultsSnapshotIds[proposalId];
+    }
 }
@@ -0,0 +1,34 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "../vaults/LockedVault.sol";
+
+/// @dev testing contract that allows to create withdrawals as the vault did before the upgrade
+contract TestingLockedVault is LockedVault {
+    using EnumerableSet for EnumerableSet.UintSet;
+    using WithdrawalQueue for WithdrawalQueue.Queue;
+
+    constructor(
+        address _owner,
+        address _underlying,
+        address _rewardsToken,
+        address _daoTreasury
+    ) LockedVault(_owner, _underlying, _rewardsToken, _daoTreasury) {}
+
+    /// @dev moves the pending withdrawal `withdrawalId` of msg.sender to the legacy storage
+    function useLegacyWithdrawal(uint256 withdrawalId) external {
+        uint256 index = _findWithdrawal(withdrawalId);
+        WithdrawalQueue.Queue storage queue = _withdrawalQueue(msg.sender);
+        WithdrawalQueue.Entry memory entry = queue.entries[index];
+        queue.complete(index);
+
+        pendingWithdrawals[withdrawalId] = DataTypes.PendingWithdrawal({
+            id: withdrawalId,
+            withdrawableAt: entry.withdrawableAt,
+            amount: entry.amount,
+            to: msg.sender,
+            delegate: entry.delegate
+        });
+        userPendingWithdrawalIds[msg.sender].add(withdrawalId);
+    }
+}
@@ -73,6 +73,32 @@ contract AggregateLPVault is BaseVault, VaultWithThreshold, ImmutableOwner {
         return rawVotingPower;
     }
 
+    /// @dev Queries each underlying vault once for all the accounts.
+    /// Vaults deployed before `getRawVotingPowers` was added to `IVault` are
+    /// queried once per account instead
+    function getRawVotingPowers(
+        address[] memory accounts,
+        uint256 timestamp
+    ) public view override returns (uint256[] memory powers) {
+        powers = new uint256[](accounts.length);
+        for (uint256 i = 0; i < vaultsToWeights.length(); i++) {
+            (address vault, uint256 weight) = vaultsToWeights.at(i);
+            try IVault(vault).getRawVotingPowers(accounts, timestamp) returns (
+                uint256[] memory vaultPowers
+            ) {
+                for (uint256 j = 0; j < accounts.length; j++) {
+                    powers[j] += vaultPowers[j].mulDown(weight);
+                }
+            } catch {
+                for (uint256 j = 0; j < accounts.length; j++) {
+                    powers[j] += IVault(vault)
+                        .getRawVotingPower(accounts[j], timestamp)
+                        .mulDown(weight);
+                }
+            }
+        }
+    }
+
     function getTotalRawVotingPower() public view override returns (uint256) {
         uint256 totalRawVotingPower = 0;
         for (uint256 i = 0; i < vaultsToWeights.length(); i++) {
@@ -18,7 +18,9 @@ contract AssociatedDAOVault is BaseDelegatingVault, ImmutableOwner {
     EnumerableSet.AddressSet internal _daos;
     uint256 internal _totalRawVotingPower;
 
-    constructor(address _owner) ImmutableOwner(_owner) {}
+    constructor(
+        address _owner
+    ) EIP712("AssociatedDAOVault", "1") ImmutableOwner(_owner) {}
 
     function updateDAOAndTotalWeight(
         address dao,
@@ -51,6 +53,14 @@ contract AssociatedDAOVault is BaseDelegatingVault, ImmutableOwner {
             );
     }
 
+    function setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) external onlyOwner {
+        _setTrustedRouter(capability, router, trusted);
+    }
+
     function getRawVotingPower(
         address account,
         uint256 timestamp
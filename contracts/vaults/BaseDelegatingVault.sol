@@ -1,24 +1,63 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 pragma solidity ^0.8.17;
 
+import "@openzeppelin/contracts/utils/cryptography/EIP712.sol";
+import "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
+import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
+
 import "../../interfaces/IVault.sol";
 import "../../interfaces/IDelegatingVault.sol";
 
+import "../access/TrustedRouters.sol";
 import "./BaseVault.sol";
 
 import "../../libraries/Errors.sol";
 import "../../libraries/DataTypes.sol";
+import "../../libraries/ScaledMath.sol";
 import "../../libraries/VotingPowerHistory.sol";
 
-abstract contract BaseDelegatingVault is BaseVault, IDelegatingVault {
+abstract contract BaseDelegatingVault is
+    BaseVault,
+    IDelegatingVault,
+    EIP712,
+    TrustedRouters
+{
+    using ScaledMath for uint256;
     using VotingPowerHistory for VotingPowerHistory.History;
-    using EnumerableMap for EnumerableMap.AddressToUintMap;
+    using EnumerableSet for EnumerableSet.AddressSet;
+
+    bytes32 private constant _DELEGATION_TYPE_HASH =
+        keccak256(
+            "Delegation(address delegator,address delegate,uint256 amount,uint256 nonce,uint256 deadline)"
+        );
+    bytes32 private constant _UNDELEGATION_TYPE_HASH =
+        keccak256(
+            "Undelegation(address delegator,address delegate,uint256 amount,uint256 nonce,uint256 deadline)"
+        );
 
     // @notice A record of delegates per account
     // this is the current delegates (not snapshot) and
     // is only used to allow this information to be retrived (e.g. by the frontend)
-    mapping(address => EnumerableMap.AddressToUintMap)
-        internal _currentDelegations;
+    // Delegations are still kept in two places: this set holds which accounts
+    // are delegated to, as `history` cannot be enumerated, and the amounts are
+    // only held in `history`. The set is written when a delegation is created
+    // or fully removed, not when its amount changes
+    // This slot used to hold an `EnumerableMap.AddressToUintMap` per account,
+    // whose keys are stored exactly like an `EnumerableSet.AddressSet`, so
+    // existing delegations are preserved and the map's values are left unused
+    mapping(address => EnumerableSet.AddressSet) internal _currentDelegates;
+
+    /// @dev State added after the vaults were deployed behind proxies. It lives at
+    /// a fixed slot so that it does not shift the variables of the inheriting vaults
+    struct DelegatingVaultStorage {
+        // reverse index of `_currentDelegates`, i.e. the delegators of each account
+        mapping(address => EnumerableSet.AddressSet) delegators;
+        // nonce to sign in the next delegation or undelegation of each account
+        mapping(address => uint256) delegationNonces;
+    }
+
+    bytes32 private constant _DELEGATING_VAULT_STORAGE_SLOT =
+        bytes32(uint256(keccak256("gyroscope.vaults.BaseDelegatingVault")) - 1);
 
     function delegateVote(address _delegate, uint256 _amount) external {
         _delegateVote(msg.sender, _delegate, _amount);
@@ -37,27 +76,211 @@ abstract contract BaseDelegatingVault is BaseVault, IDelegatingVault {
         _delegateVote(msg.sender, _newDelegate, _amount);
     }
 
+    /// @notice Delegates on behalf of `account`, which is the caller of the router,
+    /// e.g. to delegate in every vault of the aggregator in a single transaction
+    function delegateVoteFor(
+        address account,
+        address _delegate,
+        uint256 _amount
+    ) external onlyTrustedRouter(DELEGATE_VOTE_CAPABILITY) {
+        _delegateVote(account, _delegate, _amount);
+    }
+
+    /// @notice Returns the voting power of `account` that is not delegated yet
+    function getAvailableToDelegate(
+        address account
+    ) external view returns (uint256) {
+        VotingPowerHistory.Record memory current = history.currentRecord(
+            account
+        );
+        return
+            current.baseVotingPower.mulDown(current.multiplier) -
+            history.delegatedVotingPower(account);
+    }
+
+    /// @notice Delegates `amount` of the voting power of `delegator`, who signed the delegation
+    /// with their current nonce, so that anyone can relay it
+    function delegateBySig(
+        address delegator,
+        address delegate,
+        uint256 amount,
+        uint256 deadline,
+        bytes calldata signature
+    ) external {
+        _useSignature(
+            _DELEGATION_TYPE_HASH,
+            delegator,
+            delegate,
+            amount,
+            deadline,
+            signature
+        );
+        _delegateVote(delegator, delegate, amount);
+    }
+
+    function undelegateBySig(
+        address delegator,
+        address delegate,
+        uint256 amount,
+        uint256 deadline,
+        bytes calldata signature
+    ) external {
+        _useSignature(
+            _UNDELEGATION_TYPE_HASH,
+            delegator,
+            delegate,
+            amount,
+            deadline,
+            signature
+        );
+        _undelegateVote(delegator, delegate, amount);
+    }
+
+    /// @notice Relays many signed delegations in a single transaction.
+    /// Several delegations of the same delegator must be ordered by nonce
+    /// A delegation that fails, e.g. because its signature expired, is skipped
+    /// without consuming its nonce and `DelegationBySigFailed` is emitted, so the
+    /// following delegations of the same delegator are skipped as well
+    function delegateManyBySig(
+        DataTypes.SignedDelegation[] calldata delegations
+    ) external {
+        for (uint256 i = 0; i < delegations.length; i++) {
+            DataTypes.SignedDelegation calldata delegation = delegations[i];
+            try
+                this.delegateBySig(
+                    delegation.delegator,
+                    delegation.delegate,
+                    delegation.amount,
+                    delegation.deadline,
+                    delegation.signature
+                )
+            {} catch (bytes memory reason) {
+                emit DelegationBySigFailed(delegation.delegator, i, reason);
+            }
+        }
+    }
+
+    /// @notice Nonce to sign in the next delegation or undelegation of `account`
+    function delegationNonces(address account) external view returns (uint256) {
+        return _delegatingVaultStorage().delegationNonces[account];
+    }
+
+    /// @notice Returns the current delegations (not snapshot) of `account`,
+    /// e.g. to be displayed by the frontend
     function getDelegations(
         address account
     ) external view returns (DataTypes.Delegation[] memory delegations) {
-        EnumerableMap.AddressToUintMap storage delegates = _currentDelegations[
-            account
-        ];
+        EnumerableSet.AddressSet storage delegates = _currentDelegates[account];
         uint256 len = delegates.length();
         delegations = new DataTypes.Delegation[](len);
         for (uint256 i = 0; i < len; i++) {
-            (address delegate, uint256 amount) = delegates.at(i);
-            delegations[i] = DataTypes.Delegation(delegate, amount);
+            address delegate = delegates.at(i);
+            delegations[i] = DataTypes.Delegation(
+                delegate,
+                history.delegatedAmount(account, delegate)
+            );
         }
         return delegations;
     }
 
+    function getDelegatorsCount(
+        address delegate
+    ) external view returns (uint256) {
+        return _delegatingVaultStorage().delegators[delegate].length();
+    }
+
+    /// @notice Returns up to `limit` of the accounts currently delegating to `delegate`,
+    /// starting at `offset`, with the amount each of them delegates
+    /// The reverse index is updated when a delegation is created or fully removed,
+    /// and removals move the last delegator in place of the removed one
+    /// Delegations created before the index existed are only listed once
+    /// their delegator has been passed to `indexDelegators`
+    function getDelegators(
+        address delegate,
+        uint256 offset,
+        uint256 limit
+    ) external view returns (DataTypes.Delegator[] memory delegators) {
+        EnumerableSet.AddressSet storage current = _delegatingVaultStorage()
+            .delegators[delegate];
+        uint256 end = current.length();
+        if (offset >= end) {
+            return new DataTypes.Delegator[](0);
+        }
+        if (end - offset > limit) {
+            end = offset + limit;
+        }
+        delegators = new DataTypes.Delegator[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            address delegator = current.at(i);
+            delegators[i - offset] = DataTypes.Delegator(
+                delegator,
+                history.delegatedAmount(delegator, delegate)
+            );
+        }
+        return delegators;
+    }
+
+    /// @notice Adds the current delegations of `accounts` to the delegators index,
+    /// which only tracks delegations created after it was introduced
+    /// Anyone can call this, and accounts that are already indexed are left unchanged
+    function indexDelegators(address[] calldata accounts) external {
+        DelegatingVaultStorage storage s = _delegatingVaultStorage();
+        for (uint256 i = 0; i < accounts.length; i++) {
+            EnumerableSet.AddressSet storage delegates = _currentDelegates[
+                accounts[i]
+            ];
+            uint256 len = delegates.length();
+            for (uint256 j = 0; j < len; j++) {
+                s.delegators[delegates.at(j)].add(accounts[i]);
+            }
+        }
+    }
+
+    /// @dev Checks that `delegator` signed the (un)delegation with its current nonce and consumes the nonce
+    function _useSignature(
+        bytes32 typeHash,
+        address delegator,
+        address delegate,
+        uint256 amount,
+        uint256 deadline,
+        bytes calldata signature
+    ) internal {
+        require(block.timestamp <= deadline, "signature expired");
+        bytes32 hash = _hashTypedDataV4(
+            keccak256(
+                abi.encode(
+                    typeHash,
+                    delegator,
+                    delegate,
+                    amount,
+                    _delegatingVaultStorage().delegationNonces[delegator]++,
+                    deadline
+                )
+            )
+        );
+        require(
+            ECDSA.recover(hash, signature) == delegator,
+            "invalid signature"
+        );
+    }
+
     function _delegateVote(address from, address to, uint256 amount) internal {
+        _increaseAndDelegateVote(from, to, 0, amount);
+    }
+
+    /// @dev Increases the base voting power of `from` and delegates `amount` to `to`
+    /// in a single history update, e.g. to delegate freshly deposited voting power
+    function _increaseAndDelegateVote(
+        address from,
+        address to,
+        uint256 baseIncrease,
+        uint256 amount
+    ) internal {
         require(to != address(0), "cannot delegate to 0 address");
-        history.delegateVote(from, to, amount);
-        (bool exists, uint256 current) = _currentDelegations[from].tryGet(to);
-        uint256 newAmount = exists ? current + amount : amount;
-        _currentDelegations[from].set(to, newAmount);
+        history.increaseAndDelegateVote(from, to, baseIncrease, amount);
+        if (_currentDelegates[from].add(to)) {
+            _delegatingVaultStorage().delegators[to].add(from);
+        }
     }
 
     function _undelegateVote(
@@ -66,12 +289,20 @@ abstract contract BaseDelegatingVault is BaseVault, IDelegatingVault {
         uint256 amount
     ) internal {
         history.undelegateVote(from, to, amount);
-        uint256 current = _currentDelegations[from].get(to);
-        if (current == amount) {
-            _currentDelegations[from].remove(to);
-        } else {
-            // amount < current
-            _currentDelegations[from].set(to, current - amount);
+        if (history.delegatedAmount(from, to) == 0) {
+            _currentDelegates[from].remove(to);
+            _delegatingVaultStorage().delegators[to].remove(from);
+        }
+    }
+
+    function _delegatingVaultStorage()
+        internal
+        pure
+        returns (DelegatingVaultStorage storage s)
+    {
+        bytes32 slot = _DELEGATING_VAULT_STORAGE_SLOT;
+        assembly {
+            s.slot := slot
         }
     }
 }
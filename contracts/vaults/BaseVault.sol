@@ -28,4 +28,16 @@ abstract contract BaseVault is IVault {
         address account,
         uint256 timestamp
     ) public view virtual returns (uint256);
+
+    /// @notice Returns the raw voting power of each of `accounts` at `timestamp`,
+    /// so that callers need one call per vault rather than one per account
+    function getRawVotingPowers(
+        address[] memory accounts,
+        uint256 timestamp
+    ) public view virtual returns (uint256[] memory powers) {
+        powers = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            powers[i] = getRawVotingPower(accounts[i], timestamp);
+        }
+    }
 }
@@ -4,18 +4,22 @@ pragma solidity ^0.8.17;
 import "./NFTVault.sol";
 import "../../libraries/VotingPowerHistory.sol";
 import "../../libraries/DataTypes.sol";
+import "../../libraries/ScaledMath.sol";
 import "../../interfaces/IVotingPowersUpdater.sol";
-import "@openzeppelin/contracts/token/ERC721/extensions/IERC721Enumerable.sol";
 
 contract CouncillorNFTVault is NFTVault, IVotingPowersUpdater {
     using VotingPowerHistory for VotingPowerHistory.History;
     using VotingPowerHistory for VotingPowerHistory.Record;
+    using ScaledMath for uint256;
 
     string internal constant _VAULT_TYPE = "CouncillorNFT";
 
     address public immutable underlyingAddress;
 
-    constructor(address _owner, address _underlyingAddress) NFTVault(_owner) {
+    constructor(
+        address _owner,
+        address _underlyingAddress
+    ) EIP712("CouncillorNFTVault", "1") NFTVault(_owner) {
         underlyingAddress = _underlyingAddress;
     }
 
@@ -29,19 +33,63 @@ contract CouncillorNFTVault is NFTVault, IVotingPowersUpdater {
         address _delegate,
         uint128 _addedCount
     ) external onlyUnderlying {
-        VotingPowerHistory.Record memory ovp = history.currentRecord(_user);
-
-        uint256 oldTotal = ovp.total();
-        VotingPowerHistory.Record memory nvp = history.updateVotingPower(
+        sumVotingPowers += _updateBaseVotingPower(
             _user,
-            ovp.baseVotingPower + _addedCount,
-            ovp.multiplier,
-            ovp.netDelegatedVotes
+            _delegate,
+            _addedCount
+        );
+    }
+
+    function updateBaseVotingPowers(
+        address[] calldata _users,
+        address[] calldata _delegates,
+        uint128[] calldata _addedCounts
+    ) external onlyUnderlying {
+        require(
+            _delegates.length == _users.length &&
+                _addedCounts.length == _users.length,
+            "users, delegates and counts length mismatch"
         );
-        sumVotingPowers += (nvp.total() - oldTotal);
+        uint256 addedVotingPower;
+        for (uint256 i = 0; i < _users.length; i++) {
+            addedVotingPower += _updateBaseVotingPower(
+                _users[i],
+                _delegates[i],
+                _addedCounts[i]
+            );
+        }
+        sumVotingPowers += addedVotingPower;
+    }
+
+    /// @dev Adds `_addedCount` to the base voting power of `_user`, delegating it
+    /// to `_delegate` if set, and returns the increase of the total voting power
+    function _updateBaseVotingPower(
+        address _user,
+        address _delegate,
+        uint128 _addedCount
+    ) internal returns (uint256) {
+        VotingPowerHistory.Record memory ovp = history.currentRecord(_user);
+        uint256 newBaseVotingPower = ovp.baseVotingPower + _addedCount;
+
         if (_delegate != address(0) && _delegate != _user) {
-            _delegateVote(_user, _delegate, _addedCount);
+            _increaseAndDelegateVote(
+                _user,
+                _delegate,
+                _addedCount,
+                _addedCount
+            );
+        } else {
+            history.updateVotingPower(
+                _user,
+                newBaseVotingPower,
+                ovp.multiplier,
+                ovp.netDelegatedVotes
+            );
         }
+
+        return
+            newBaseVotingPower.mulDown(ovp.multiplier) -
+            ovp.baseVotingPower.mulDown(ovp.multiplier);
     }
 
     function getVaultType() external pure returns (string memory) {
@@ -9,18 +9,23 @@ import "../../libraries/VotingPowerHistory.sol";
 import "@openzeppelin/contracts/utils/cryptography/EIP712.sol";
 import "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
 
-contract FoundingMemberVault is NFTVault, EIP712 {
+contract FoundingMemberVault is NFTVault {
     using Merkle for Merkle.Root;
     using VotingPowerHistory for VotingPowerHistory.History;
 
     string internal constant _VAULT_TYPE = "FoundingMember";
 
-    mapping(address => bool) private _claimed;
+    /// @dev claimed leaves, packed by leaf index
+    mapping(uint256 => uint256) private _claimedBitmap;
 
     bytes32 private immutable _TYPE_HASH =
         keccak256(
             "Proof(address account,address receiver,address delegate,uint128 multiplier,bytes32[] proof)"
         );
+    bytes32 private constant _CLAIM_TYPE_HASH =
+        keccak256(
+            "Claim(uint256 index,address account,address receiver,address delegate,uint128 multiplier)"
+        );
     Merkle.Root private merkleRoot;
 
     constructor(
@@ -32,17 +37,19 @@ contract FoundingMemberVault is NFTVault, EIP712 {
         merkleRoot = Merkle.Root(_merkleRoot);
     }
 
+    function isClaimed(uint256 index) public view returns (bool) {
+        return _claimedBitmap[index / 256] & (1 << (index % 256)) != 0;
+    }
+
     function claimNFT(
+        uint256 index,
         address nftOwner,
         address delegate,
         uint128 multiplier,
         bytes32[] calldata proof,
         bytes calldata signature
     ) external {
-        require(
-            multiplier >= 1e18 && multiplier <= 100e18,
-            "multiplier must be greater or equal than 1e18 and lower or equal than 100e18"
-        );
+        _requireValidMultiplier(multiplier);
 
         bytes32 hash = _hashTypedDataV4(
             keccak256(
@@ -59,36 +66,124 @@ contract FoundingMemberVault is NFTVault, EIP712 {
         address claimant = ECDSA.recover(hash, signature);
         require(claimant == nftOwner, "invalid signature");
 
-        require(!_claimed[nftOwner], "NFT already claimed");
+        require(!isClaimed(index), "NFT already claimed");
 
-        bytes32 node = keccak256(abi.encodePacked(nftOwner, multiplier));
+        bytes32 node = _leaf(index, nftOwner, multiplier);
         require(merkleRoot.isProofValid(node, proof), "invalid proof");
 
-        _claimed[nftOwner] = true;
+        _claimedBitmap[index / 256] |= 1 << (index % 256);
+
+        _addVotingPower(msg.sender, delegate, multiplier);
+    }
+
+    /// @notice Relays the claims of several founding members using a single multiproof.
+    /// Each member signs the receiver and the delegate of its claim, so anyone can relay it.
+    /// Claims must be sorted by strictly increasing leaf index
+    function claimMany(
+        DataTypes.SignedFoundingMemberClaim[] calldata claims,
+        bytes32[] calldata proof,
+        bool[] calldata proofFlags
+    ) external {
+        uint256 claimsCount = claims.length;
+        bytes32[] memory leaves = new bytes32[](claimsCount);
+        uint256 wordIndex;
+        uint256 word;
+        for (uint256 i = 0; i < claimsCount; i++) {
+            DataTypes.SignedFoundingMemberClaim calldata claim = claims[i];
+            uint256 index = claim.index;
+            require(
+                i == 0 || index > claims[i - 1].index,
+                "indices not sorted"
+            );
+            _requireValidMultiplier(claim.multiplier);
+            _requireClaimSignature(claim);
+
+            // indices are sorted, so the claims of a bitmap word are contiguous
+            // and each word is only written once
+            if (i == 0 || index / 256 != wordIndex) {
+                if (i > 0) _claimedBitmap[wordIndex] = word;
+                wordIndex = index / 256;
+                word = _claimedBitmap[wordIndex];
+            }
+
+            uint256 mask = 1 << (index % 256);
+            require(word & mask == 0, "NFT already claimed");
+            word |= mask;
+
+            leaves[i] = _leaf(index, claim.nftOwner, claim.multiplier);
+            _addVotingPower(claim.receiver, claim.delegate, claim.multiplier);
+        }
+        if (claimsCount > 0) {
+            _claimedBitmap[wordIndex] = word;
+        }
+
+        require(
+            merkleRoot.isMultiProofValid(leaves, proof, proofFlags),
+            "invalid proof"
+        );
+    }
+
+    function _requireClaimSignature(
+        DataTypes.SignedFoundingMemberClaim calldata claim
+    ) internal view {
+        bytes32 hash = _hashTypedDataV4(
+            keccak256(
+                abi.encode(
+                    _CLAIM_TYPE_HASH,
+                    claim.index,
+                    claim.nftOwner,
+                    claim.receiver,
+                    claim.delegate,
+                    claim.multiplier
+                )
+            )
+        );
+        require(
+            ECDSA.recover(hash, claim.signature) == claim.nftOwner,
+            "invalid signature"
+        );
+    }
 
+    function _addVotingPower(
+        address receiver,
+        address delegate,
+        uint128 multiplier
+    ) internal {
         VotingPowerHistory.Record memory current = history.currentRecord(
-            msg.sender
+            receiver
         );
         history.updateVotingPower(
-            msg.sender,
+            receiver,
             current.baseVotingPower + ScaledMath.ONE,
             multiplier,
             current.netDelegatedVotes
         );
 
-        if (delegate != address(0) && delegate != msg.sender) {
-            _delegateVote(msg.sender, delegate, multiplier);
+        if (delegate != address(0) && delegate != receiver) {
+            _delegateVote(receiver, delegate, multiplier);
         }
     }
 
+    function _requireValidMultiplier(uint128 multiplier) internal pure {
+        require(
+            multiplier >= 1e18 && multiplier <= 100e18,
+            "multiplier must be greater or equal than 1e18 and lower or equal than 100e18"
+        );
+    }
+
+    function _leaf(
+        uint256 index,
+        address nftOwner,
+        uint128 multiplier
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encodePacked(index, nftOwner, multiplier));
+    }
+
     function _encodeProof(
         bytes32[] memory proof
     ) internal pure returns (bytes32) {
-        bytes memory proofB;
-        for (uint256 i = 0; i < proof.length; i++) {
-            proofB = bytes.concat(proofB, abi.encode(proof[i]));
-        }
-        return keccak256(proofB);
+        // equivalent to hashing the concatenation of the 32-byte proof elements
+        return keccak256(abi.encodePacked(proof));
     }
 
     function getVaultType() external pure returns (string memory) {
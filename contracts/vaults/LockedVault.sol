@@ -3,13 +3,16 @@ pragma solidity ^0.8.17;
 
 import "@openzeppelin/contracts/token/ERC20/extensions/IERC20Metadata.sol";
 import "@openzeppelin/contracts/proxy/utils/Initializable.sol";
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
 
 import "../../interfaces/ILockingVault.sol";
 
 import "../../libraries/DataTypes.sol";
+import "../../libraries/Permit.sol";
 import "../../libraries/ScaledMath.sol";
 import "../../libraries/VotingPowerHistory.sol";
+import "../../libraries/WithdrawalQueue.sol";
 
 import "../access/ImmutableOwner.sol";
 import "../LiquidityMining.sol";
@@ -23,8 +26,10 @@ contract LockedVault is
     LiquidityMining
 {
     using ScaledMath for uint256;
+    using SafeCast for uint256;
     using EnumerableSet for EnumerableSet.UintSet;
     using VotingPowerHistory for VotingPowerHistory.History;
+    using WithdrawalQueue for WithdrawalQueue.Queue;
 
     string internal constant _VAULT_TYPE = "LockedVault";
 
@@ -32,23 +37,39 @@ contract LockedVault is
     uint256 internal withdrawalWaitDuration;
 
     // Mapping of a user's address to their pending withdrawal ids.
+    // Only holds the withdrawals initiated before the upgrade to `WithdrawalQueue`,
+    // the later ones are queued in `LockedVaultStorage`
     mapping(address => EnumerableSet.UintSet) internal userPendingWithdrawalIds;
 
     mapping(uint256 => DataTypes.PendingWithdrawal) internal pendingWithdrawals;
 
     uint256 internal nextWithdrawalId;
 
-    // Total supply of shares locked in the vault that are not queued for withdrawal
-    uint256 public totalSupply;
+    // Former `totalSupply` counter, now tracked by `LiquidityMining.totalStaked`.
+    // The slot is kept so that the storage layout of the upgraded proxies does not change
+    uint256 internal __deprecated_totalSupply;
 
     uint8 internal immutable _underlyingDecimals;
 
+    /// @dev State added after the vault was deployed behind proxies, see `BaseDelegatingVault`
+    struct LockedVaultStorage {
+        // pending withdrawals of each user, in the order they were queued
+        mapping(address => WithdrawalQueue.Queue) withdrawalQueues;
+    }
+
+    bytes32 private constant _LOCKED_VAULT_STORAGE_SLOT =
+        bytes32(uint256(keccak256("gyroscope.vaults.LockedVault")) - 1);
+
     constructor(
         address _owner,
         address _underlying,
         address _rewardsToken,
         address _daoTreasury
-    ) ImmutableOwner(_owner) LiquidityMining(_rewardsToken, _daoTreasury) {
+    )
+        EIP712("LockedVault", "1")
+        ImmutableOwner(_owner)
+        LiquidityMining(_rewardsToken, _daoTreasury)
+    {
         underlying = IERC20(_underlying);
         _underlyingDecimals = IERC20Metadata(_underlying).decimals();
     }
@@ -71,6 +92,45 @@ contract LockedVault is
         _stopMining();
     }
 
+    function addRewardStream(
+        address token,
+        address treasury
+    ) external override onlyOwner returns (uint256) {
+        return _addRewardStream(token, treasury);
+    }
+
+    function startMining(
+        uint256 streamId,
+        address rewardsFrom,
+        uint256 amount,
+        uint256 endTime
+    ) external override onlyOwner {
+        _startMining(streamId, rewardsFrom, amount, endTime);
+    }
+
+    function stopMining(uint256 streamId) external override onlyOwner {
+        _stopMining(streamId);
+    }
+
+    function setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) external onlyOwner {
+        _setTrustedRouter(capability, router, trusted);
+    }
+
+    function claimAllRewardsFor(
+        address account
+    )
+        external
+        override
+        onlyTrustedRouter(CLAIM_REWARDS_CAPABILITY)
+        returns (uint256[] memory)
+    {
+        return _claimAllRewards(account, msg.sender);
+    }
+
     function setWithdrawalWaitDuration(uint256 _duration) external onlyOwner {
         withdrawalWaitDuration = _duration;
     }
@@ -85,30 +145,40 @@ contract LockedVault is
 
         underlying.transferFrom(msg.sender, address(this), _tokenAmount);
 
-        VotingPowerHistory.Record memory current = history.currentRecord(
-            msg.sender
-        );
-
         // internal accounting is done with 18 decimals
         uint256 scaledAmount = _tokenAmount.changeScale(
             _underlyingDecimals,
             18
         );
-        history.updateVotingPower(
-            msg.sender,
-            current.baseVotingPower + scaledAmount,
-            current.multiplier,
-            current.netDelegatedVotes
-        );
-        if (_delegate != address(0) && _delegate != msg.sender) {
-            _delegateVote(msg.sender, _delegate, scaledAmount);
-        }
-        totalSupply += scaledAmount;
-        _stake(msg.sender, scaledAmount);
+
+        _lock(scaledAmount, _delegate);
 
         emit Deposit(msg.sender, _delegate, _tokenAmount);
     }
 
+    /// @notice Same as `deposit` but approves the vault with an EIP-2612 permit first.
+    /// If the permit fails, the deposit uses the existing allowance
+    function depositWithPermit(
+        uint256 _tokenAmount,
+        address _delegate,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) external {
+        Permit.tryPermit(
+            address(underlying),
+            msg.sender,
+            address(this),
+            _tokenAmount,
+            deadline,
+            v,
+            r,
+            s
+        );
+        deposit(_tokenAmount, _delegate);
+    }
+
     function initiateWithdrawal(
         uint256 _vaultTokenAmount,
         address _delegate
@@ -139,53 +209,100 @@ contract LockedVault is
         if (undelegating) {
             _undelegateVote(msg.sender, _delegate, _vaultTokenAmount);
         }
-        totalSupply -= _vaultTokenAmount;
         _unstake(msg.sender, _vaultTokenAmount);
 
-        DataTypes.PendingWithdrawal memory withdrawal = DataTypes
-            .PendingWithdrawal({
-                id: nextWithdrawalId,
-                withdrawableAt: block.timestamp + withdrawalWaitDuration,
-                amount: _vaultTokenAmount,
-                to: msg.sender,
+        uint256 withdrawalId = nextWithdrawalId++;
+        uint256 withdrawableAt = block.timestamp + withdrawalWaitDuration;
+        _withdrawalQueue(msg.sender).push(
+            WithdrawalQueue.Entry({
+                amount: _vaultTokenAmount.toUint128(),
+                withdrawableAt: withdrawableAt.toUint64(),
+                id: withdrawalId.toUint64(),
                 delegate: _delegate
-            });
-        pendingWithdrawals[withdrawal.id] = withdrawal;
-        userPendingWithdrawalIds[msg.sender].add(withdrawal.id);
-        nextWithdrawalId++;
+            })
+        );
 
         emit WithdrawalQueued(
-            withdrawal.id,
-            withdrawal.to,
-            withdrawal.delegate,
-            withdrawal.withdrawableAt,
-            withdrawal.amount
+            withdrawalId,
+            msg.sender,
+            _delegate,
+            withdrawableAt,
+            _vaultTokenAmount
         );
 
-        return withdrawal.id;
+        return withdrawalId;
     }
 
     function withdraw(uint256 withdrawalId) external {
-        DataTypes.PendingWithdrawal memory pending = pendingWithdrawals[
-            withdrawalId
-        ];
-        require(pending.to == msg.sender, "matching withdrawal does not exist");
-        require(
-            pending.withdrawableAt <= block.timestamp,
-            "no valid pending withdrawal"
-        );
+        uint256 underlyingTokenAmount = _completeWithdrawalById(withdrawalId);
+        underlying.transfer(msg.sender, underlyingTokenAmount);
+    }
 
-        uint256 underlyingTokenAmount = pending.amount.changeScale(
-            18,
-            _underlyingDecimals
-        );
+    function withdrawMany(uint256[] calldata withdrawalIds) external {
+        uint256 underlyingTokenAmount;
+        for (uint256 i; i < withdrawalIds.length; i++) {
+            underlyingTokenAmount += _completeWithdrawalById(withdrawalIds[i]);
+        }
+        underlying.transfer(msg.sender, underlyingTokenAmount);
+    }
 
-        underlying.transfer(pending.to, underlyingTokenAmount);
+    /// @notice Cancels a pending withdrawal, matured or not, and locks its amount again,
+    /// delegated to `_delegate`, without moving any token
+    function cancelWithdrawal(
+        uint256 withdrawalId,
+        address _delegate
+    ) external {
+        require(_delegate != address(0), "no delegation to 0");
+        _lock(_cancelWithdrawalById(withdrawalId), _delegate);
+    }
 
-        delete pendingWithdrawals[withdrawalId];
-        userPendingWithdrawalIds[pending.to].remove(withdrawalId);
+    function cancelWithdrawals(
+        uint256[] calldata withdrawalIds,
+        address _delegate
+    ) external {
+        require(withdrawalIds.length > 0, "no withdrawal to cancel");
+        require(_delegate != address(0), "no delegation to 0");
+        uint256 amount;
+        for (uint256 i; i < withdrawalIds.length; i++) {
+            amount += _cancelWithdrawalById(withdrawalIds[i]);
+        }
+        _lock(amount, _delegate);
+    }
+
+    function withdrawAllMatured() external returns (uint256) {
+        uint256 underlyingTokenAmount;
+        EnumerableSet.UintSet storage legacyIds = userPendingWithdrawalIds[
+            msg.sender
+        ];
+        // removing a legacy withdrawal moves the last one in its place,
+        // so they are iterated from the end
+        for (uint256 i = legacyIds.length(); i > 0; i--) {
+            uint256 withdrawalId = legacyIds.at(i - 1);
+            if (
+                pendingWithdrawals[withdrawalId].withdrawableAt <=
+                block.timestamp
+            ) {
+                underlyingTokenAmount += _completeLegacyWithdrawal(
+                    withdrawalId
+                );
+            }
+        }
 
-        emit WithdrawalCompleted(withdrawalId, pending.to, pending.amount);
+        WithdrawalQueue.Queue storage queue = _withdrawalQueue(msg.sender);
+        // completing a withdrawal never moves the other entries,
+        // so the indexes stay valid while iterating
+        uint256 tail = queue.tail;
+        for (uint256 i = queue.head; i < tail; i++) {
+            uint256 withdrawableAt = queue.entries[i].withdrawableAt;
+            if (withdrawableAt == 0 || withdrawableAt > block.timestamp) {
+                continue;
+            }
+            underlyingTokenAmount += _completeWithdrawal(i);
+        }
+        if (underlyingTokenAmount > 0) {
+            underlying.transfer(msg.sender, underlyingTokenAmount);
+        }
+        return underlyingTokenAmount;
     }
 
     function getRawVotingPower(
@@ -202,17 +319,42 @@ contract LockedVault is
         override
         returns (uint256)
     {
-        return totalSupply;
+        return totalSupply();
+    }
+
+    /// @notice Total supply of shares locked in the vault that are not queued for withdrawal.
+    /// This is tracked by the liquidity mining stake rather than a separate counter
+    function totalSupply() public view returns (uint256) {
+        return totalStaked;
     }
 
+    /// @notice Lists the pending withdrawals of `_user`. The withdrawals initiated
+    /// before the upgrade come first, followed by the others in the order they were queued
     function listPendingWithdrawals(
         address _user
     ) external view returns (DataTypes.PendingWithdrawal[] memory) {
-        EnumerableSet.UintSet storage ids = userPendingWithdrawalIds[_user];
+        EnumerableSet.UintSet storage legacyIds = userPendingWithdrawalIds[
+            _user
+        ];
+        WithdrawalQueue.Queue storage queue = _withdrawalQueue(_user);
+        uint256 count = legacyIds.length();
         DataTypes.PendingWithdrawal[]
-            memory pending = new DataTypes.PendingWithdrawal[](ids.length());
-        for (uint256 i = 0; i < ids.length(); i++) {
-            pending[i] = pendingWithdrawals[ids.at(i)];
+            memory pending = new DataTypes.PendingWithdrawal[](
+                count + queue.pendingCount()
+            );
+        for (uint256 i = 0; i < count; i++) {
+            pending[i] = pendingWithdrawals[legacyIds.at(i)];
+        }
+        for (uint256 i = queue.head; i < queue.tail; i++) {
+            WithdrawalQueue.Entry memory entry = queue.entries[i];
+            if (entry.withdrawableAt == 0) continue;
+            pending[count++] = DataTypes.PendingWithdrawal({
+                id: entry.id,
+                withdrawableAt: entry.withdrawableAt,
+                amount: entry.amount,
+                to: _user,
+                delegate: entry.delegate
+            });
         }
         return pending;
     }
@@ -221,10 +363,146 @@ contract LockedVault is
         return _VAULT_TYPE;
     }
 
+    /// @dev Completes the pending withdrawal `withdrawalId` of msg.sender,
+    /// whether it was initiated before or after the upgrade
+    function _completeWithdrawalById(
+        uint256 withdrawalId
+    ) internal returns (uint256) {
+        if (userPendingWithdrawalIds[msg.sender].contains(withdrawalId)) {
+            return _completeLegacyWithdrawal(withdrawalId);
+        }
+        return _completeWithdrawal(_findWithdrawal(withdrawalId));
+    }
+
+    /// @dev Cancels the pending withdrawal `withdrawalId` of msg.sender,
+    /// whether it was initiated before or after the upgrade
+    function _cancelWithdrawalById(
+        uint256 withdrawalId
+    ) internal returns (uint256) {
+        if (userPendingWithdrawalIds[msg.sender].contains(withdrawalId)) {
+            return _cancelLegacyWithdrawal(withdrawalId);
+        }
+        return _cancelWithdrawal(_findWithdrawal(withdrawalId));
+    }
+
+    /// @dev Returns the index of the pending withdrawal `withdrawalId` in the queue of msg.sender
+    function _findWithdrawal(
+        uint256 withdrawalId
+    ) internal view returns (uint256) {
+        (bool found, uint256 index) = _withdrawalQueue(msg.sender).find(
+            withdrawalId
+        );
+        require(found, "matching withdrawal does not exist");
+        return index;
+    }
+
+    /// @dev Checks and removes the matured pending withdrawal at `index` in the queue of
+    /// msg.sender and returns the amount of underlying tokens owed, leaving the transfer to the caller
+    function _completeWithdrawal(uint256 index) internal returns (uint256) {
+        WithdrawalQueue.Queue storage queue = _withdrawalQueue(msg.sender);
+        WithdrawalQueue.Entry memory pending = queue.entries[index];
+        require(
+            pending.withdrawableAt <= block.timestamp,
+            "no valid pending withdrawal"
+        );
+
+        queue.complete(index);
+
+        emit WithdrawalCompleted(pending.id, msg.sender, pending.amount);
+
+        return uint256(pending.amount).changeScale(18, _underlyingDecimals);
+    }
+
+    /// @dev Removes the pending withdrawal at `index` in the queue of msg.sender
+    /// and returns its amount, with 18 decimals
+    function _cancelWithdrawal(uint256 index) internal returns (uint256) {
+        WithdrawalQueue.Queue storage queue = _withdrawalQueue(msg.sender);
+        WithdrawalQueue.Entry memory pending = queue.entries[index];
+
+        queue.complete(index);
+
+        emit WithdrawalCancelled(pending.id, msg.sender, pending.amount);
+
+        return pending.amount;
+    }
+
+    /// @dev Same as `_completeWithdrawal` for a withdrawal initiated before the upgrade
+    function _completeLegacyWithdrawal(
+        uint256 withdrawalId
+    ) internal returns (uint256) {
+        DataTypes.PendingWithdrawal memory pending = pendingWithdrawals[
+            withdrawalId
+        ];
+        require(
+            pending.withdrawableAt <= block.timestamp,
+            "no valid pending withdrawal"
+        );
+
+        delete pendingWithdrawals[withdrawalId];
+        userPendingWithdrawalIds[msg.sender].remove(withdrawalId);
+
+        emit WithdrawalCompleted(withdrawalId, msg.sender, pending.amount);
+
+        return pending.amount.changeScale(18, _underlyingDecimals);
+    }
+
+    /// @dev Same as `_cancelWithdrawal` for a withdrawal initiated before the upgrade
+    function _cancelLegacyWithdrawal(
+        uint256 withdrawalId
+    ) internal returns (uint256 amount) {
+        amount = pendingWithdrawals[withdrawalId].amount;
+
+        delete pendingWithdrawals[withdrawalId];
+        userPendingWithdrawalIds[msg.sender].remove(withdrawalId);
+
+        emit WithdrawalCancelled(withdrawalId, msg.sender, amount);
+    }
+
+    /// @dev Adds `scaledAmount` to the voting power of msg.sender, delegated to `_delegate`,
+    /// and to its liquidity mining stake
+    function _lock(uint256 scaledAmount, address _delegate) internal {
+        if (_delegate != msg.sender) {
+            _increaseAndDelegateVote(
+                msg.sender,
+                _delegate,
+                scaledAmount,
+                scaledAmount
+            );
+        } else {
+            VotingPowerHistory.Record memory current = history.currentRecord(
+                msg.sender
+            );
+            history.updateVotingPower(
+                msg.sender,
+                current.baseVotingPower + scaledAmount,
+                current.multiplier,
+                current.netDelegatedVotes
+            );
+        }
+        _stake(msg.sender, scaledAmount);
+    }
+
     function __LockedVault_initialize(
         uint256 _withdrawalWaitDuration
     ) internal {
         withdrawalWaitDuration = _withdrawalWaitDuration;
         globalCheckpoint();
     }
+
+    function _withdrawalQueue(
+        address account
+    ) internal view returns (WithdrawalQueue.Queue storage) {
+        return _lockedVaultStorage().withdrawalQueues[account];
+    }
+
+    function _lockedVaultStorage()
+        internal
+        pure
+        returns (LockedVaultStorage storage s)
+    {
+        bytes32 slot = _LOCKED_VAULT_STORAGE_SLOT;
+        assembly {
+            s.slot := slot
+        }
+    }
 }
@@ -27,9 +27,10 @@ contract LockedVaultWithThreshold is LockedVault, VaultWithThreshold {
         override
         returns (uint256)
     {
-        if (totalSupply < threshold) {
+        uint256 supply = totalSupply();
+        if (supply < threshold) {
             return threshold;
         }
-        return totalSupply;
+        return supply;
     }
 }
@@ -16,6 +16,14 @@ abstract contract NFTVault is BaseDelegatingVault, ImmutableOwner {
 
     constructor(address _owner) ImmutableOwner(_owner) {}
 
+    function setTrustedRouter(
+        bytes32 capability,
+        address router,
+        bool trusted
+    ) external onlyOwner {
+        _setTrustedRouter(capability, router, trusted);
+    }
+
     function getRawVotingPower(
         address user,
         uint256 timestamp
@@ -31,29 +39,56 @@ abstract contract NFTVault is BaseDelegatingVault, ImmutableOwner {
         address[] calldata users,
         uint128 _multiplier
     ) external onlyOwner {
+        uint256 addedVotingPower;
+        for (uint256 i = 0; i < users.length; i++) {
+            addedVotingPower += _updateMultiplier(users[i], _multiplier);
+        }
+        sumVotingPowers += addedVotingPower;
+    }
+
+    function updateMultipliers(
+        address[] calldata users,
+        uint128[] calldata multipliers
+    ) external onlyOwner {
+        require(
+            users.length == multipliers.length,
+            "users and multipliers length mismatch"
+        );
+        uint256 addedVotingPower;
+        for (uint256 i = 0; i < users.length; i++) {
+            addedVotingPower += _updateMultiplier(users[i], multipliers[i]);
+        }
+        sumVotingPowers += addedVotingPower;
+    }
+
+    /// @dev Updates the multiplier of `user` and returns the added voting power,
+    /// which the caller is responsible for adding to `sumVotingPowers`
+    function _updateMultiplier(
+        address user,
+        uint128 _multiplier
+    ) internal returns (uint256) {
         require(_multiplier >= 1e18, "multiplier cannot be less than 1");
         require(_multiplier <= 20e18, "multiplier cannot be more than 20");
-        for (uint i = 0; i < users.length; i++) {
-            VotingPowerHistory.Record memory oldVotingPower = history
-                .currentRecord(users[i]);
-            require(
-                oldVotingPower.baseVotingPower >= 1e18,
-                "all users must have at least 1 NFT"
-            );
-            require(
-                oldVotingPower.multiplier < _multiplier,
-                "cannot decrease voting power"
-            );
 
-            uint256 oldTotal = oldVotingPower.total();
-            VotingPowerHistory.Record memory newVotingPower = history
-                .updateVotingPower(
-                    users[i],
-                    oldVotingPower.baseVotingPower,
-                    _multiplier,
-                    oldVotingPower.netDelegatedVotes
-                );
-            sumVotingPowers += (newVotingPower.total() - oldTotal);
-        }
+        VotingPowerHistory.Record memory oldVotingPower = history
+            .currentRecord(user);
+        require(
+            oldVotingPower.baseVotingPower >= 1e18,
+            "all users must have at least 1 NFT"
+        );
+        require(
+            oldVotingPower.multiplier < _multiplier,
+            "cannot decrease voting power"
+        );
+
+        uint256 oldTotal = oldVotingPower.total();
+        VotingPowerHistory.Record memory newVotingPower = history
+            .updateVotingPower(
+                user,
+                oldVotingPower.baseVotingPower,
+                _multiplier,
+                oldVotingPower.netDelegatedVotes
+            );
+        return newVotingPower.total() - oldTotal;
     }
 }
@@ -5,4 +5,6 @@ import "@openzeppelin/contracts-upgradeable/token/ERC20/IERC20Upgradeable.sol";
 
 interface IBoundedERC20WithEMA is IERC20Upgradeable {
     function boundedPctEMA() external view returns (uint256);
+
+    function currentBoundedPctEMA() external view returns (uint256);
 }
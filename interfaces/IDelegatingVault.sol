@@ -14,10 +14,59 @@ interface IDelegatingVault {
         uint256 _amount
     ) external;
 
+    function delegateVoteFor(
+        address account,
+        address _delegate,
+        uint256 _amount
+    ) external;
+
+    function getAvailableToDelegate(
+        address account
+    ) external view returns (uint256);
+
+    function delegateBySig(
+        address delegator,
+        address delegate,
+        uint256 amount,
+        uint256 deadline,
+        bytes calldata signature
+    ) external;
+
+    function undelegateBySig(
+        address delegator,
+        address delegate,
+        uint256 amount,
+        uint256 deadline,
+        bytes calldata signature
+    ) external;
+
+    function delegateManyBySig(
+        DataTypes.SignedDelegation[] calldata delegations
+    ) external;
+
+    function delegationNonces(address account) external view returns (uint256);
+
     function getDelegations(
         address account
     ) external view returns (DataTypes.Delegation[] memory delegations);
 
+    function getDelegatorsCount(
+        address delegate
+    ) external view returns (uint256);
+
+    function getDelegators(
+        address delegate,
+        uint256 offset,
+        uint256 limit
+    ) external view returns (DataTypes.Delegator[] memory delegators);
+
+    function indexDelegators(address[] calldata accounts) external;
+
     event VotesDelegated(address delegator, address delegate, uint amount);
     event VotesUndelegated(address delegator, address delegate, uint amount);
+    event DelegationBySigFailed(
+        address indexed delegator,
+        uint256 index,
+        bytes reason
+    );
 }
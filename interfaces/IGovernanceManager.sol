@@ -11,6 +11,11 @@ interface IGovernanceManager {
 
     function vote(uint16 proposalId, DataTypes.Ballot ballot) external;
 
+    function voteMany(
+        uint16[] calldata proposalIds,
+        DataTypes.Ballot[] calldata ballots
+    ) external;
+
     function getVoteTotals(
         uint16 proposalId
     ) external view returns (DataTypes.VoteTotals memory);
@@ -9,14 +9,76 @@ interface ILiquidityMining {
     event StartMining(uint256 amount, uint256 endTime);
     event StopMining();
 
-    /// @notice claims rewards for caller
+    /// @dev Same as `Claim`, `StartMining` and `StopMining` for the reward streams
+    /// other than stream 0, whose events keep their original signatures
+    event RewardStreamClaim(
+        address indexed beneficiary,
+        uint256 indexed streamId,
+        uint256 amount
+    );
+    event RewardStreamStartMining(
+        uint256 indexed streamId,
+        uint256 amount,
+        uint256 endTime
+    );
+    event RewardStreamStopMining(uint256 indexed streamId);
+
+    event RewardStreamAdded(
+        uint256 indexed streamId,
+        address token,
+        address treasury
+    );
+
+    /// @notice claims rewards of the first reward stream for caller
     function claimRewards() external returns (uint256);
 
-    /// @notice returns the amount of claimable rewards by `beneficiary`
+    /// @notice claims rewards of the reward stream `streamId` for caller
+    function claimRewards(uint256 streamId) external returns (uint256);
+
+    /// @notice claims rewards of all the reward streams for caller
+    /// and returns the amount claimed for each stream
+    function claimAllRewards() external returns (uint256[] memory);
+
+    /// @notice claims rewards of all the reward streams for `account` and sends them to the caller,
+    /// which must be a trusted router, e.g. to consolidate rewards from several vaults
+    function claimAllRewardsFor(
+        address account
+    ) external returns (uint256[] memory);
+
+    /// @notice returns the amount of claimable rewards by `beneficiary` in the first reward stream
     function claimableRewards(
         address beneficiary
     ) external view returns (uint256);
 
+    /// @notice returns the amount of claimable rewards by `beneficiary` in the reward stream `streamId`
+    function claimableRewards(
+        address beneficiary,
+        uint256 streamId
+    ) external view returns (uint256);
+
+    /// @notice returns the amount of claimable rewards of each of `beneficiaries` in the first reward stream
+    function claimableRewardsBatch(
+        address[] calldata beneficiaries
+    ) external view returns (uint256[] memory);
+
+    /// @notice returns the amount of claimable rewards of each of `beneficiaries` in the reward stream `streamId`
+    function claimableRewardsBatch(
+        address[] calldata beneficiaries,
+        uint256 streamId
+    ) external view returns (uint256[] memory);
+
+    /// @notice the number of reward streams, each paying a different token
+    function rewardStreamsCount() external view returns (uint256);
+
+    function rewardStreamToken(
+        uint256 streamId
+    ) external view returns (address);
+
+    /// @notice the address receiving leftover rewards when the stream `streamId` is stopped
+    function rewardStreamTreasury(
+        uint256 streamId
+    ) external view returns (address);
+
     /// @notice the total amount of tokens staked in the contract
     function totalStaked() external view returns (uint256);
 
@@ -27,9 +89,17 @@ interface ILiquidityMining {
     /// This emission will be given to all stakers in the contract proportionally to their stake
     function rewardsEmissionRate() external view returns (uint256);
 
+    function rewardsEmissionRate(
+        uint256 streamId
+    ) external view returns (uint256);
+
     /// @notice time when rewards emission ends
     function rewardsEmissionEndTime() external view returns (uint256);
 
+    function rewardsEmissionEndTime(
+        uint256 streamId
+    ) external view returns (uint256);
+
     /// @dev these functions will be called internally but can typically be called by anyone
     /// to update the internal tracking state of the contract
     function globalCheckpoint() external;
@@ -46,4 +116,22 @@ interface ILiquidityMining {
     /// @notice Stop liquidity mining early and reimburse leftover rewards to the DAO treasury.
     /// This may also be needed after the mining period has ended when we had `totalStaked() == 0` for a while, where no rewards accrue.
     function stopMining() external;
+
+    /// @notice Adds a new reward stream paying `token`, whose leftover rewards are reimbursed to `treasury`.
+    /// Typically governanceOnly.
+    function addRewardStream(
+        address token,
+        address treasury
+    ) external returns (uint256 streamId);
+
+    /// @notice Same as `startMining` for the reward stream `streamId`
+    function startMining(
+        uint256 streamId,
+        address rewardsFrom,
+        uint256 amount,
+        uint256 endTime
+    ) external;
+
+    /// @notice Same as `stopMining` for the reward stream `streamId`
+    function stopMining(uint256 streamId) external;
 }
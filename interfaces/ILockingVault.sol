@@ -10,6 +10,15 @@ interface ILockingVault {
 
     function deposit(uint256 _amount, address _delegate) external;
 
+    function depositWithPermit(
+        uint256 _amount,
+        address _delegate,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) external;
+
     event Deposit(
         address indexed from,
         address indexed delegate,
@@ -23,6 +32,17 @@ interface ILockingVault {
 
     function withdraw(uint256 withdrawalId) external;
 
+    function withdrawMany(uint256[] calldata withdrawalIds) external;
+
+    function withdrawAllMatured() external returns (uint256);
+
+    function cancelWithdrawal(uint256 withdrawalId, address _delegate) external;
+
+    function cancelWithdrawals(
+        uint256[] calldata withdrawalIds,
+        address _delegate
+    ) external;
+
     event WithdrawalQueued(
         uint256 indexed id,
         address indexed to,
@@ -35,4 +55,9 @@ interface ILockingVault {
         address indexed to,
         uint256 amount
     );
+    event WithdrawalCancelled(
+        uint256 indexed id,
+        address indexed to,
+        uint256 amount
+    );
 }
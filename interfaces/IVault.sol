@@ -15,6 +15,11 @@ interface IVault {
         uint256 timestamp
     ) external view returns (uint256);
 
+    function getRawVotingPowers(
+        address[] calldata accounts,
+        uint256 timestamp
+    ) external view returns (uint256[] memory);
+
     function getTotalRawVotingPower() external view returns (uint256);
 
     function getVaultType() external view returns (string memory);
@@ -7,4 +7,10 @@ interface IVotingPowersUpdater {
         address delegate,
         uint128 addedVotingPower
     ) external;
+
+    function updateBaseVotingPowers(
+        address[] calldata users,
+        address[] calldata delegates,
+        uint128[] calldata addedVotingPowers
+    ) external;
 }
@@ -1,8 +1,6 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 pragma solidity ^0.8.17;
 
-import "@openzeppelin/contracts/utils/structs/EnumerableMap.sol";
-
 library DataTypes {
     enum Status {
         Undefined,
@@ -76,8 +74,11 @@ library DataTypes {
         uint64 createdAt;
         uint64 completesAt;
         Status status;
+        // weighted veto percentage, updated on every veto
+        uint64 vetoPct;
         bytes payload;
-        EnumerableMap.AddressToUintMap vetos;
+        // total veto power of each vault, aligned with the proposal vaults snapshot
+        uint256[] vetoTotals;
     }
 
     enum Ballot {
@@ -93,7 +94,16 @@ library DataTypes {
         VaultVotingPower[] abstentions;
     }
 
+    // packed in two slots, weights are 1e18-scaled fractions so fit in uint96
     struct VaultSnapshot {
+        address vaultAddress;
+        uint96 weight;
+        uint256 totalVotingPower;
+    }
+
+    // layout of `VaultSnapshot` before it was packed, kept to read the snapshots
+    // of the proposals created before the upgrade
+    struct LegacyVaultSnapshot {
         address vaultAddress;
         uint256 weight;
         uint256 totalVotingPower;
@@ -117,4 +127,26 @@ library DataTypes {
         address delegate;
         uint256 amount;
     }
+
+    struct Delegator {
+        address delegator;
+        uint256 amount;
+    }
+
+    struct SignedDelegation {
+        address delegator;
+        address delegate;
+        uint256 amount;
+        uint256 deadline;
+        bytes signature;
+    }
+
+    struct SignedFoundingMemberClaim {
+        uint256 index;
+        address nftOwner;
+        address receiver;
+        address delegate;
+        uint128 multiplier;
+        bytes signature;
+    }
 }
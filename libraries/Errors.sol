@@ -5,6 +5,7 @@ library Errors {
     error DuplicatedVault(address vault);
     error InvalidTotalWeight(uint256 totalWeight);
     error NotAuthorized(address actual, address expected);
+    error UntrustedRouter(address router);
     error InvalidVotingPowerUpdate(
         uint256 actualTotalPower,
         uint256 givenTotalPower
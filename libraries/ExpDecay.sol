@@ -0,0 +1,70 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+/// @notice Computes the decay factor e^(-x) for 18 decimals fixed point x >= 0
+/// This is cheaper than `LogExpMath.exp` as it only handles negative exponents: x is decomposed
+/// in powers of two from 2^5 down to 2^-3 whose exponentials are precomputed, and the exponential
+/// of the remainder (smaller than 1/8) is computed with a Taylor series.
+/// Intermediate values use 20 decimals and the absolute error of the result is below 2e-18,
+/// as for `LogExpMath.exp`, from which it differs by at most 2e-18 (see `scripts/ema_decay_error_analysis.py`)
+library ExpDecay {
+    uint256 internal constant ONE_18 = 1e18;
+    uint256 internal constant ONE_20 = 1e20;
+
+    /// @dev From this value, e^(-x) < 2e-18 and the result is 0, as below `LogExpMath.MIN_NATURAL_EXPONENT`
+    uint256 internal constant MAX_EXPONENT = 41e18;
+
+    // e^(-2^n), 20 decimal constants
+    uint256 internal constant A32 = 1266417; // e^(-32)
+    uint256 internal constant A16 = 11253517471926; // e^(-16)
+    uint256 internal constant A8 = 33546262790251184; // e^(-8)
+    uint256 internal constant A4 = 1831563888873418029; // e^(-4)
+    uint256 internal constant A2 = 13533528323661269189; // e^(-2)
+    uint256 internal constant A1 = 36787944117144232160; // e^(-1)
+    uint256 internal constant A1_2 = 60653065971263342360; // e^(-1/2)
+    uint256 internal constant A1_4 = 77880078307140486825; // e^(-1/4)
+    uint256 internal constant A1_8 = 88249690258459540286; // e^(-1/8)
+
+    /// @dev Number of terms of the Taylor series, the first omitted term is below (1/8)^13 / 13! < 1e-21
+    uint256 internal constant TAYLOR_TERMS = 12;
+
+    function expNeg(uint256 x) internal pure returns (uint256) {
+        if (x >= MAX_EXPONENT) return 0;
+
+        unchecked {
+            // integer part, x < 41 so only the powers of two up to 32 are needed
+            uint256 n = x / ONE_18;
+            uint256 product = ONE_20;
+            if (n & 32 != 0) product = (product * A32) / ONE_20;
+            if (n & 16 != 0) product = (product * A16) / ONE_20;
+            if (n & 8 != 0) product = (product * A8) / ONE_20;
+            if (n & 4 != 0) product = (product * A4) / ONE_20;
+            if (n & 2 != 0) product = (product * A2) / ONE_20;
+            if (n & 1 != 0) product = (product * A1) / ONE_20;
+
+            // fractional part, with 20 decimals
+            uint256 r = (x % ONE_18) * 100;
+            if (r >= 0.5e20) {
+                r -= 0.5e20;
+                product = (product * A1_2) / ONE_20;
+            }
+            if (r >= 0.25e20) {
+                r -= 0.25e20;
+                product = (product * A1_4) / ONE_20;
+            }
+            if (r >= 0.125e20) {
+                r -= 0.125e20;
+                product = (product * A1_8) / ONE_20;
+            }
+
+            // e^(-r) = 1 - r * (1 - r / 2 * (1 - r / 3 * (...))) for r < 1/8
+            // every partial result is in (0, 1] so no term can underflow
+            uint256 series = ONE_20;
+            for (uint256 k = TAYLOR_TERMS; k > 0; k--) {
+                series = ONE_20 - (series * r) / (k * ONE_20);
+            }
+
+            return (product * series) / ONE_20 / 100;
+        }
+    }
+}
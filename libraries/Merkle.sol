@@ -13,11 +13,69 @@ library Merkle {
     ) internal view returns (bool) {
         bytes32 node = firstNode;
         for (uint256 i = 0; i < remainingNodes.length; i++) {
-            (bytes32 left, bytes32 right) = (node, remainingNodes[i]);
-            if (left > right) (left, right) = (right, left);
-            node = keccak256(abi.encodePacked(left, right));
+            node = _hashPair(node, remainingNodes[i]);
         }
 
         return node == root._root;
     }
+
+    /// @notice Checks that all `leaves` are part of the tree using a single multiproof
+    /// `leaves` must be sorted by their position in the tree and `proofFlags` indicates,
+    /// for each hash to compute, whether the second operand is a known node (true)
+    /// or the next element of `proof` (false)
+    function isMultiProofValid(
+        Root storage root,
+        bytes32[] memory leaves,
+        bytes32[] calldata proof,
+        bool[] calldata proofFlags
+    ) internal view returns (bool) {
+        return processMultiProof(leaves, proof, proofFlags) == root._root;
+    }
+
+    function processMultiProof(
+        bytes32[] memory leaves,
+        bytes32[] calldata proof,
+        bool[] calldata proofFlags
+    ) internal pure returns (bytes32) {
+        uint256 leavesLength = leaves.length;
+        uint256 totalHashes = proofFlags.length;
+        require(
+            leavesLength > 0 &&
+                leavesLength + proof.length - 1 == totalHashes,
+            "invalid multiproof"
+        );
+
+        if (totalHashes == 0) {
+            return leaves[0];
+        }
+
+        // known nodes are consumed in order, first the leaves then the computed hashes
+        bytes32[] memory hashes = new bytes32[](totalHashes);
+        uint256 leafPos;
+        uint256 hashPos;
+        uint256 proofPos;
+        for (uint256 i = 0; i < totalHashes; i++) {
+            bytes32 a = leafPos < leavesLength
+                ? leaves[leafPos++]
+                : hashes[hashPos++];
+            bytes32 b;
+            if (proofFlags[i]) {
+                b = leafPos < leavesLength
+                    ? leaves[leafPos++]
+                    : hashes[hashPos++];
+            } else {
+                b = proof[proofPos++];
+            }
+            require(hashPos <= i, "invalid multiproof");
+            hashes[i] = _hashPair(a, b);
+        }
+        require(proofPos == proof.length, "invalid multiproof");
+
+        return hashes[totalHashes - 1];
+    }
+
+    function _hashPair(bytes32 a, bytes32 b) private pure returns (bytes32) {
+        (bytes32 left, bytes32 right) = a < b ? (a, b) : (b, a);
+        return keccak256(abi.encodePacked(left, right));
+    }
 }
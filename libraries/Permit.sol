@@ -0,0 +1,32 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-IERC20Permit.sol";
+
+library Permit {
+    /// @dev Approves `spender` using an EIP-2612 permit signed by `owner`.
+    /// Failures are ignored so that the caller falls back to the existing allowance:
+    /// the token may not support permit, or the permit may already have been submitted by someone else
+    function tryPermit(
+        address token,
+        address owner,
+        address spender,
+        uint256 amount,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) internal {
+        try
+            IERC20Permit(token).permit(
+                owner,
+                spender,
+                amount,
+                deadline,
+                v,
+                r,
+                s
+            )
+        {} catch {}
+    }
+}
@@ -2,6 +2,7 @@
 pragma solidity ^0.8.17;
 
 import "@openzeppelin/contracts/utils/structs/EnumerableMap.sol";
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
 
 import "./DataTypes.sol";
 import "./ScaledMath.sol";
@@ -9,6 +10,13 @@ import "./ScaledMath.sol";
 library VaultsSnapshot {
     using EnumerableMap for EnumerableMap.AddressToUintMap;
     using ScaledMath for uint256;
+    using SafeCast for uint256;
+
+    /// @dev snapshots keyed by the hash of their content, so that identical snapshots,
+    /// e.g. taken while no vault total changed, are only stored once
+    struct Registry {
+        mapping(bytes32 => DataTypes.VaultSnapshot[]) snapshots;
+    }
 
     function getBallotPercentage(
         DataTypes.VaultSnapshot[] memory snapshots,
@@ -23,6 +31,17 @@ library VaultsSnapshot {
         }
     }
 
+    /// @dev loads only the vault addresses, i.e. one slot per vault
+    function vaultAddresses(
+        DataTypes.VaultSnapshot[] storage snapshots
+    ) internal view returns (address[] memory addresses) {
+        uint256 len = snapshots.length;
+        addresses = new address[](len);
+        for (uint256 i; i < len; i++) {
+            addresses[i] = snapshots[i].vaultAddress;
+        }
+    }
+
     /// @dev this simply appends, so the storage must be clean
     function persist(
         DataTypes.VaultSnapshot[] memory snapshots,
@@ -33,4 +52,45 @@ library VaultsSnapshot {
             cleanStorage.push(snapshots[i]);
         }
     }
+
+    /// @dev returns the id of `snapshots` in `registry` and whether they were not stored yet
+    function register(
+        Registry storage registry,
+        DataTypes.VaultSnapshot[] memory snapshots
+    ) internal returns (bytes32 snapshotId, bool persisted) {
+        snapshotId = keccak256(abi.encode(snapshots));
+        DataTypes.VaultSnapshot[] storage stored = registry.snapshots[
+            snapshotId
+        ];
+        persisted = stored.length == 0;
+        if (persisted) {
+            persist(snapshots, stored);
+        }
+    }
+
+    function fromLegacy(
+        DataTypes.LegacyVaultSnapshot[] storage legacySnapshots
+    ) internal view returns (DataTypes.VaultSnapshot[] memory snapshots) {
+        uint256 len = legacySnapshots.length;
+        snapshots = new DataTypes.VaultSnapshot[](len);
+        for (uint256 i; i < len; i++) {
+            DataTypes.LegacyVaultSnapshot storage legacy = legacySnapshots[i];
+            snapshots[i] = DataTypes.VaultSnapshot({
+                vaultAddress: legacy.vaultAddress,
+                weight: legacy.weight.toUint96(),
+                totalVotingPower: legacy.totalVotingPower
+            });
+        }
+    }
+
+    /// @dev loads only the vault addresses, i.e. one slot per vault
+    function vaultAddresses(
+        DataTypes.LegacyVaultSnapshot[] storage legacySnapshots
+    ) internal view returns (address[] memory addresses) {
+        uint256 len = legacySnapshots.length;
+        addresses = new address[](len);
+        for (uint256 i; i < len; i++) {
+            addresses[i] = legacySnapshots[i].vaultAddress;
+        }
+    }
 }
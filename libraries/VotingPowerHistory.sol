@@ -57,11 +57,11 @@ library VotingPowerHistory {
             multiplier: multiplier,
             netDelegatedVotes: netDelegatedVotes
         });
-        Record memory lastRecord = history.currentRecord(for_);
-        if (lastRecord.at == block.timestamp && votesFor.length > 0) {
-            votesFor[votesFor.length - 1] = updatedRecord;
+        uint256 length = votesFor.length;
+        if (length > 0 && votesFor[length - 1].at == block.timestamp) {
+            votesFor[length - 1] = updatedRecord;
         } else {
-            history.votes[for_].push(updatedRecord);
+            votesFor.push(updatedRecord);
         }
         return updatedRecord;
     }
@@ -79,11 +79,12 @@ library VotingPowerHistory {
         History storage history,
         address for_
     ) internal view returns (Record memory) {
-        Record[] memory records = history.votes[for_];
-        if (records.length == 0) {
+        Record[] storage records = history.votes[for_];
+        uint256 length = records.length;
+        if (length == 0) {
             return zeroRecord();
         } else {
-            return records[records.length - 1];
+            return records[length - 1];
         }
     }
 
@@ -126,10 +127,23 @@ library VotingPowerHistory {
         address from,
         address to,
         uint256 amount
+    ) internal {
+        history.increaseAndDelegateVote(from, to, 0, amount);
+    }
+
+    /// @notice Increases the base voting power of `from` by `baseIncrease` and delegates
+    /// `amount` to `to`, writing the current record of each account only once
+    function increaseAndDelegateVote(
+        History storage history,
+        address from,
+        address to,
+        uint256 baseIncrease,
+        uint256 amount
     ) internal {
         Record memory fromCurrent = history.currentRecord(from);
+        uint256 baseVotingPower = fromCurrent.baseVotingPower + baseIncrease;
 
-        uint256 availableToDelegate = fromCurrent.baseVotingPower.mulDown(
+        uint256 availableToDelegate = baseVotingPower.mulDown(
             fromCurrent.multiplier
         ) - history._delegatedToOthers[from];
         require(
@@ -143,7 +157,7 @@ library VotingPowerHistory {
 
         history.updateVotingPower(
             from,
-            fromCurrent.baseVotingPower,
+            baseVotingPower,
             fromCurrent.multiplier,
             history.netDelegatedVotingPower(from)
         );
@@ -191,6 +205,14 @@ library VotingPowerHistory {
         emit VotesUndelegated(from, to, amount);
     }
 
+    function delegatedAmount(
+        History storage history,
+        address from,
+        address to
+    ) internal view returns (uint256) {
+        return history._delegations[from][to];
+    }
+
     function netDelegatedVotingPower(
         History storage history,
         address who
@@ -0,0 +1,79 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity ^0.8.17;
+
+/// @notice FIFO queue of the pending withdrawals of a single account.
+/// Entries are pushed at `tail` with increasing ids, so they can be found by binary search,
+/// and are removed from `head` as they complete. An entry completed out of order keeps its id
+/// so that the search still works and is removed once it reaches `head`
+library WithdrawalQueue {
+    /// @dev A pending withdrawal, packed in two slots
+    struct Entry {
+        uint128 amount;
+        // zero once the withdrawal is completed
+        uint64 withdrawableAt;
+        uint64 id;
+        address delegate;
+    }
+
+    struct Queue {
+        uint64 head;
+        uint64 tail;
+        mapping(uint256 => Entry) entries;
+    }
+
+    function push(Queue storage queue, Entry memory entry) internal {
+        uint64 tail = queue.tail;
+        queue.entries[tail] = entry;
+        queue.tail = tail + 1;
+    }
+
+    /// @dev Returns the index of the pending withdrawal `id` in the queue
+    function find(
+        Queue storage queue,
+        uint256 id
+    ) internal view returns (bool found, uint256 index) {
+        uint256 low = queue.head;
+        uint256 high = queue.tail;
+        while (low < high) {
+            uint256 mid = (low + high) / 2;
+            uint256 midId = queue.entries[mid].id;
+            if (midId == id) {
+                return (queue.entries[mid].withdrawableAt != 0, mid);
+            } else if (midId < id) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return (false, 0);
+    }
+
+    /// @dev Removes the pending withdrawal at `index`, which must not be completed yet
+    function complete(Queue storage queue, uint256 index) internal {
+        uint256 head = queue.head;
+        if (index != head) {
+            Entry storage entry = queue.entries[index];
+            entry.amount = 0;
+            entry.withdrawableAt = 0;
+            entry.delegate = address(0);
+            return;
+        }
+
+        // drop the entries completed out of order that are now at the head
+        uint256 tail = queue.tail;
+        do {
+            delete queue.entries[head];
+            head++;
+        } while (head < tail && queue.entries[head].withdrawableAt == 0);
+        queue.head = uint64(head);
+    }
+
+    /// @dev Number of pending withdrawals, excluding the ones completed out of order
+    function pendingCount(
+        Queue storage queue
+    ) internal view returns (uint256 count) {
+        for (uint256 i = queue.head; i < queue.tail; i++) {
+            if (queue.entries[i].withdrawableAt != 0) count++;
+        }
+    }
+}
@@ -0,0 +1,61 @@
+"""Writes a CSV report of the claimable rewards of every staker of a `LiquidityMining` vault
+
+Stakers are found by paging through the `Stake` events of the vault and their rewards are
+queried with `claimableRewardsBatch`, all at the same block so that the report is consistent.
+
+Usage: brownie run scripts/claimable_rewards_report.py main <vault> <out_file> [from_block] --network <network>
+"""
+
+import csv
+from typing import List
+
+from brownie import chain, interface, web3  # type: ignore
+
+DEFAULT_PAGE_SIZE = 10_000  # blocks per `eth_getLogs` request
+DEFAULT_BATCH_SIZE = 500  # stakers per `claimableRewardsBatch` call
+
+
+def find_stakers(vault, from_block: int, to_block: int, page_size: int) -> List[str]:
+    contract = web3.eth.contract(address=vault.address, abi=vault.abi)
+    stakers = {}
+    for start in range(from_block, to_block + 1, page_size):
+        end = min(start + page_size - 1, to_block)
+        for log in contract.events.Stake.getLogs(fromBlock=start, toBlock=end):
+            # dict keeps the order in which stakers were first seen
+            stakers.setdefault(log.args.account, None)
+    return list(stakers)
+
+
+def main(
+    vault_address: str,
+    out_file: str,
+    from_block: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+):
+    from_block, page_size, batch_size = int(from_block), int(page_size), int(batch_size)
+    vault = interface.ILiquidityMining(vault_address)
+    block = chain.height
+
+    stakers = find_stakers(vault, from_block, block, page_size)
+    streams_count = vault.rewardStreamsCount(block_identifier=block)
+    tokens = [
+        vault.rewardStreamToken(i, block_identifier=block) for i in range(streams_count)
+    ]
+
+    rewards = {staker: [] for staker in stakers}
+    for stream_id in range(streams_count):
+        for start in range(0, len(stakers), batch_size):
+            batch = stakers[start : start + batch_size]
+            amounts = vault.claimableRewardsBatch(
+                batch, stream_id, block_identifier=block
+            )
+            for staker, amount in zip(batch, amounts):
+                rewards[staker].append(int(amount))
+
+    with open(out_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["account"] + tokens)
+        for staker in stakers:
+            writer.writerow([staker] + rewards[staker])
+    print(f"block {block}: {len(stakers)} stakers, {streams_count} reward streams")
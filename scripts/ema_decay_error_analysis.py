@@ -0,0 +1,140 @@
+"""Error analysis of `ExpDecay.expNeg` used by `BoundedERC20WithEMA._updateEMA`
+
+Both `ExpDecay.expNeg` and `LogExpMath.exp` are ported with the same integer arithmetic
+as the Solidity code and compared to e^(-x) computed with 60 significant digits, for the
+exponents `_updateEMA` computes from realistic block gaps and window widths.
+Errors are reported in units of 1e-18, i.e. in wei of the 18 decimals result.
+
+Usage: python scripts/ema_decay_error_analysis.py
+"""
+
+import random
+from decimal import Decimal, getcontext
+
+getcontext().prec = 60
+
+ONE_18 = 10**18
+ONE_20 = 10**20
+
+# window widths in blocks, scaled to 18 decimals as in `BoundedERC20WithEMA.windowWidth`
+WINDOW_WIDTHS = [300 * ONE_18, 7200 * ONE_18, 50400 * ONE_18]
+BLOCK_GAPS = [1, 2, 3, 5, 10, 30, 100, 300, 1000, 3600, 7200, 14400, 50400, 100800]
+RANDOM_SAMPLES = 20_000
+
+
+def expneg_exp_decay(x: int) -> int:
+    """Port of `ExpDecay.expNeg`"""
+    if x >= 41 * ONE_18:
+        return 0
+    constants = [
+        (32, 1266417),
+        (16, 11253517471926),
+        (8, 33546262790251184),
+        (4, 1831563888873418029),
+        (2, 13533528323661269189),
+        (1, 36787944117144232160),
+    ]
+    n = x // ONE_18
+    product = ONE_20
+    for bit, a in constants:
+        if n & bit:
+            product = product * a // ONE_20
+
+    r = (x % ONE_18) * 100
+    for x_n, a in [
+        (50 * 10**18, 60653065971263342360),
+        (25 * 10**18, 77880078307140486825),
+        (125 * 10**17, 88249690258459540286),
+    ]:
+        if r >= x_n:
+            r -= x_n
+            product = product * a // ONE_20
+
+    series = ONE_20
+    for k in range(12, 0, -1):
+        series = ONE_20 - series * r // (k * ONE_20)
+    return product * series // ONE_20 // 100
+
+
+def _exp_log_exp_math(x: int) -> int:
+    """Port of `LogExpMath.exp` for 0 <= x <= 41e18"""
+    x *= 100
+    product = ONE_20
+    for x_n, a_n in [
+        (3200000000000000000000, 7896296018268069516100000000000000),
+        (1600000000000000000000, 888611052050787263676000000),
+        (800000000000000000000, 298095798704172827474000),
+        (400000000000000000000, 5459815003314423907810),
+        (200000000000000000000, 738905609893065022723),
+        (100000000000000000000, 271828182845904523536),
+        (50000000000000000000, 164872127070012814685),
+        (25000000000000000000, 128402541668774148407),
+    ]:
+        if x >= x_n:
+            x -= x_n
+            product = product * a_n // ONE_20
+
+    series_sum = ONE_20
+    term = x
+    series_sum += term
+    for n in range(2, 13):
+        term = term * x // ONE_20 // n
+        series_sum += term
+    return product * series_sum // ONE_20 // 100
+
+
+def expneg_log_exp_math(x: int) -> int:
+    """Decay factor as computed before, i.e. `LogExpMath.exp(-x)` or 0 below `MIN_NATURAL_EXPONENT`"""
+    if x >= 41 * ONE_18:
+        return 0
+    return ONE_18 * ONE_18 // _exp_log_exp_math(x)
+
+
+def expneg_exact(x: int) -> Decimal:
+    return (-Decimal(x) / ONE_18).exp() * ONE_18
+
+
+def exponent(block_gap: int, window_width: int) -> int:
+    """Same as `deltaBlockNb.divDown(windowWidth)` in `_updateEMA`"""
+    return block_gap * ONE_18 * ONE_18 // window_width
+
+
+def analyze(exponents):
+    max_error_new = max_error_old = max_diff = Decimal(0)
+    for x in exponents:
+        exact = expneg_exact(x)
+        new, old = expneg_exp_decay(x), expneg_log_exp_math(x)
+        max_error_new = max(max_error_new, abs(new - exact))
+        max_error_old = max(max_error_old, abs(old - exact))
+        max_diff = max(max_diff, Decimal(abs(new - old)))
+    return max_error_new, max_error_old, max_diff
+
+
+def main():
+    random.seed(0)
+    print(f"{'window':>8} {'gaps':>10} {'ExpDecay':>10} {'LogExpMath':>11} {'diff':>6}")
+    for window_width in WINDOW_WIDTHS:
+        window = window_width // ONE_18
+        gaps = {
+            "fixed": BLOCK_GAPS,
+            "random": [random.randint(1, 50 * window) for _ in range(RANDOM_SAMPLES)],
+        }
+        for name, block_gaps in gaps.items():
+            exponents = [exponent(gap, window_width) for gap in block_gaps]
+            error_new, error_old, diff = analyze(exponents)
+            print(
+                f"{window:>8} {name:>10} {float(error_new):>10.3f} "
+                f"{float(error_old):>11.3f} {float(diff):>6.0f}"
+            )
+
+    # whole domain, including exponents that are not reachable with integer block gaps
+    exponents = [random.randint(0, 41 * ONE_18) for _ in range(RANDOM_SAMPLES)]
+    error_new, error_old, diff = analyze(exponents)
+    print(
+        f"{'any':>8} {'random':>10} {float(error_new):>10.3f} "
+        f"{float(error_old):>11.3f} {float(diff):>6.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
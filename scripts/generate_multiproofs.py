@@ -0,0 +1,124 @@
+"""Generates the founding member tree and the multiproofs for `FoundingMemberVault.claimMany`
+
+Usage:
+    brownie run scripts/generate_multiproofs.py main <in_file> <out_file> [batch_size]
+    brownie run scripts/generate_multiproofs.py multiproof <proofs_file> <indices>
+
+`claimMany` only accepts claims signed by their members, so the precomputed batches can
+only be relayed once every member of the batch signed. `multiproof` generates the
+multiproof of any set of leaves, e.g. the ones for which signed claims were collected,
+given as comma-separated indices
+"""
+
+import json
+import sys
+from os import path
+
+from support.merkle import (
+    MerkleTree,
+    founding_member_leaf,
+    process_multiproof,
+    to_hex,
+    verify_proof,
+)
+
+DATA_PATH = path.join(path.dirname(path.dirname(__file__)), "data")
+DEFAULT_IN_FILE = path.join(DATA_PATH, "verified_founding_frogger_vault.csv")
+# the proofs file is the one consumed by `deploy_vaults.founding_member_vault`
+DEFAULT_OUT_FILE = path.join(DATA_PATH, "verified_founding_frogger_vault_proofs.json")
+DEFAULT_BATCH_SIZE = 200
+
+
+def read_members(in_file: str):
+    members = []
+    with open(in_file) as f:
+        for line in f:
+            # skip headers and empty lines
+            if not line.startswith("0x"):
+                continue
+            owner, multiplier = line.strip().split(",")[:2]
+            multiplier = int(multiplier)
+            # same convention as `scripts/proof.ts`: small values are not scaled yet
+            if multiplier < 10**10:
+                multiplier *= 10**18
+            members.append((owner, multiplier))
+    return members
+
+
+def main(
+    in_file: str = DEFAULT_IN_FILE,
+    out_file: str = DEFAULT_OUT_FILE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+):
+    batch_size = int(batch_size)
+    members = read_members(in_file)
+    leaves = [founding_member_leaf(i, *member) for i, member in enumerate(members)]
+    tree = MerkleTree(leaves)
+
+    proofs = []
+    for index, (owner, multiplier) in enumerate(members):
+        proof = tree.get_proof(index)
+        if not verify_proof(tree.root, leaves[index], proof):
+            raise ValueError(f"invalid proof for {owner}")
+        proofs.append(
+            {
+                "index": index,
+                "owner": owner,
+                "multiplier": str(multiplier),
+                "proof": [to_hex(node) for node in proof],
+            }
+        )
+
+    batches = []
+    for start in range(0, len(members), batch_size):
+        indices = list(range(start, min(start + batch_size, len(members))))
+        proof, proof_flags = tree.get_multiproof(indices)
+        batch_leaves = [leaves[i] for i in indices]
+        if process_multiproof(batch_leaves, proof, proof_flags) != tree.root:
+            raise ValueError(f"invalid multiproof for batch starting at {start}")
+        batches.append(
+            {
+                "indices": indices,
+                "owners": [members[i][0] for i in indices],
+                "multipliers": [str(members[i][1]) for i in indices],
+                "proof": [to_hex(node) for node in proof],
+                "proofFlags": proof_flags,
+            }
+        )
+
+    with open(out_file, "w") as f:
+        json.dump({"root": to_hex(tree.root), "proofs": proofs, "batches": batches}, f)
+    print(f"root {to_hex(tree.root)}: {len(proofs)} proofs, {len(batches)} batches")
+
+
+def multiproof(proofs_file: str = DEFAULT_OUT_FILE, indices: str = ""):
+    with open(proofs_file) as f:
+        data = json.load(f)
+    leaves = [
+        founding_member_leaf(p["index"], p["owner"], int(p["multiplier"]))
+        for p in data["proofs"]
+    ]
+    tree = MerkleTree(leaves)
+    if to_hex(tree.root) != data["root"]:
+        raise ValueError("proofs file does not match its root")
+
+    indices = sorted(int(i) for i in indices.split(","))
+    proof, proof_flags = tree.get_multiproof(indices)
+    if (
+        process_multiproof([leaves[i] for i in indices], proof, proof_flags)
+        != tree.root
+    ):
+        raise ValueError("invalid multiproof")
+    print(
+        json.dumps(
+            {
+                "indices": indices,
+                "proof": [to_hex(node) for node in proof],
+                "proofFlags": proof_flags,
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
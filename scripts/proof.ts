@@ -13,9 +13,12 @@ function scale(value: number | bigint, decimals: number = 18): bigint {
 class Element {
   owner: string;
   multiplier: bigint;
+  // set for trees whose leaves commit to the position of the element, such as the `FoundingMemberVault` one
+  index?: number;
 
-  constructor(owner: string, multiplier: bigint) {
+  constructor(owner: string, multiplier: bigint, index?: number) {
     this.owner = owner;
+    this.index = index;
     if (multiplier < 10 ** 10) {
       multiplier = scale(multiplier);
     }
@@ -23,20 +26,25 @@ class Element {
   }
 
   toLeaf() {
-    return utils.solidityKeccak256(["address", "uint128"], [this.owner, this.multiplier]);
+    if (this.index === undefined) {
+      return utils.solidityKeccak256(["address", "uint128"], [this.owner, this.multiplier]);
+    }
+    return utils.solidityKeccak256(["uint256", "address", "uint128"], [this.index, this.owner, this.multiplier]);
   }
 
-  toObject(): { owner: string; multiplier: string } {
-    return { owner: this.owner, multiplier: this.multiplier.toString() };
+  toObject(): { index?: number; owner: string; multiplier: string } {
+    const object = { owner: this.owner, multiplier: this.multiplier.toString() };
+    return this.index === undefined ? object : { index: this.index, ...object };
   }
 
-  static fromLine(line: string): Element {
+  static fromLine(line: string, index?: number): Element {
     const [owner, multiplier] = line.split(",");
-    return new Element(owner, multiplier ? BigInt(parseInt(multiplier)) : undefined);
+    return new Element(owner, multiplier ? BigInt(parseInt(multiplier)) : undefined, index);
   }
 }
 
 type OutputDatum = {
+  index?: number;
   owner: string;
   multiplier: string;
   proof: string[];
@@ -66,7 +74,7 @@ function generateRoot(elements: Element[]): string {
 }
 
 function generateProof(line: Element, lines: Element[]): string[] {
-  const leafIndex = lines.findIndex((l) => l.owner === line.owner);
+  const leafIndex = line.index ?? lines.findIndex((l) => l.owner === line.owner);
   if (leafIndex === -1) {
     throw new Error("Account not found");
   }
@@ -85,11 +93,11 @@ function generateProof(line: Element, lines: Element[]): string[] {
   return hashes;
 }
 
-async function generateProofs(inFile: string, outFile: string): Promise<void> {
+async function generateProofs(inFile: string, outFile: string, indexed: boolean): Promise<void> {
   console.log(inFile, outFile);
   const ownerData = await fs.readFile(inFile, "utf-8");
   const lines = ownerData.trim().split("\n");
-  const data = lines.map(Element.fromLine);
+  const data = lines.map((line, index) => Element.fromLine(line, indexed ? index : undefined));
 
   const root = generateRoot(data);
   const proofs: OutputDatum[] = [];
@@ -120,6 +128,7 @@ function validateProof(element: Element, proof: string[], root: string): boolean
   return node == root;
 }
 
-const [, , inFile, outFile] = process.argv;
+// pass `indexed` as the third argument to generate `FoundingMemberVault` proofs
+const [, , inFile, outFile, leafType] = process.argv;
 
-generateProofs(inFile || defaultInFile, outFile || defaultOutFile);
+generateProofs(inFile || defaultInFile, outFile || defaultOutFile, leafType === "indexed");
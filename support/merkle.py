@@ -0,0 +1,104 @@
+"""Merkle trees compatible with `libraries/Merkle.sol`.
+
+Nodes are hashed as sorted pairs and odd levels are padded with `keccak256("")`,
+which is how `scripts/proof.ts` builds the trees used by the deployed contracts.
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+from eth_utils import keccak, to_bytes, to_checksum_address
+
+EMPTY_NODE = keccak(b"")
+
+
+def hash_pair(a: bytes, b: bytes) -> bytes:
+    left, right = (a, b) if a <= b else (b, a)
+    return keccak(left + right)
+
+
+def founding_member_leaf(index: int, owner: str, multiplier: int) -> bytes:
+    """Leaf of the founding member tree, i.e.
+    `keccak256(abi.encodePacked(uint256 index, address owner, uint128 multiplier))`
+    """
+    return keccak(
+        int(index).to_bytes(32, "big")
+        + to_bytes(hexstr=to_checksum_address(owner))
+        + int(multiplier).to_bytes(16, "big")
+    )
+
+
+def to_hex(node: bytes) -> str:
+    return "0x" + node.hex()
+
+
+class MerkleTree:
+    def __init__(self, leaves: Sequence[bytes]):
+        if not leaves:
+            raise ValueError("cannot build a tree without leaves")
+        self.layers: List[List[bytes]] = [list(leaves)]
+        while len(self.layers[-1]) > 1:
+            layer = self.layers[-1]
+            if len(layer) % 2 == 1:
+                layer.append(EMPTY_NODE)
+            self.layers.append(
+                [hash_pair(layer[i], layer[i + 1]) for i in range(0, len(layer), 2)]
+            )
+
+    @property
+    def root(self) -> bytes:
+        return self.layers[-1][0]
+
+    def get_proof(self, index: int) -> List[bytes]:
+        proof = []
+        for layer in self.layers[:-1]:
+            proof.append(layer[index ^ 1])
+            index //= 2
+        return proof
+
+    def get_multiproof(self, indices: Iterable[int]) -> Tuple[List[bytes], List[bool]]:
+        """Returns the proof and flags expected by `Merkle.isMultiProofValid`
+        for the leaves at `indices`, which must be passed in increasing order.
+        """
+        known = sorted(set(indices))
+        if not known:
+            raise ValueError("at least one leaf is required")
+        proof, flags = [], []
+        for layer in self.layers[:-1]:
+            known_set = set(known)
+            parents = []
+            for index in known:
+                if index ^ 1 < index and index ^ 1 in known_set:
+                    # already consumed together with its sibling
+                    continue
+                sibling = index ^ 1
+                if sibling in known_set:
+                    flags.append(True)
+                else:
+                    flags.append(False)
+                    proof.append(layer[sibling])
+                parents.append(index // 2)
+            known = parents
+        return proof, flags
+
+
+def verify_proof(root: bytes, leaf: bytes, proof: Sequence[bytes]) -> bool:
+    node = leaf
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
+
+
+def process_multiproof(
+    leaves: Sequence[bytes], proof: Sequence[bytes], proof_flags: Sequence[bool]
+) -> bytes:
+    """Python version of `Merkle.processMultiProof`"""
+    if not leaves or len(leaves) + len(proof) - 1 != len(proof_flags):
+        raise ValueError("invalid multiproof")
+    queue, proof = list(leaves), list(proof)
+    for flag in proof_flags:
+        a = queue.pop(0)
+        b = queue.pop(0) if flag else proof.pop(0)
+        queue.append(hash_pair(a, b))
+    if proof:
+        raise ValueError("invalid multiproof")
+    return queue[-1]
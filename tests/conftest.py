@@ -9,6 +9,7 @@ from brownie import (
     CouncillorNFT,
     CouncillorNFTVault,
     ERC20Mintable,
+    ERC20PermitMintable,
     ERC721Mintable,
     FoundingMemberVault,
     RaisingERC20,
@@ -24,6 +25,8 @@ from hexbytes import HexBytes
 from eth_utils.abi import function_signature_to_4byte_selector
 from eth_abi.abi import encode_abi
 
+from support.merkle import MerkleTree, founding_member_leaf, to_hex
+
 FIXTURES_PATH = path.join(path.dirname(__file__), "fixtures")
 
 
@@ -94,6 +97,15 @@ PROOF = [
 ]
 
 
+def founding_member_tree(members) -> MerkleTree:
+    return MerkleTree(
+        [
+            founding_member_leaf(i, owner, multiplier)
+            for i, (owner, multiplier) in enumerate(members)
+        ]
+    )
+
+
 class Tier(NamedTuple):
     quorum: int
     proposal_threshold: int
@@ -136,6 +148,117 @@ def signature(local_account, receiver, delegate, multiplier, verifying_contract,
     return sm.signature.hex()
 
 
+def claim_signature(signer, verifying_contract, index, receiver, delegate, multiplier):
+    class Claim(EIP712Message):
+        # domain
+        _name_: "string"
+        _version_: "string"
+        _chainId_: "uint256"
+        _verifyingContract_: "address"
+
+        index: "uint256"
+        account: "address"
+        receiver: "address"
+        delegate: "address"
+        multiplier: "uint128"
+
+    msg = Claim(
+        _name_="FoundingMemberVault",
+        _version_="1",
+        _chainId_=chain.id,
+        _verifyingContract_=verifying_contract,
+        index=index,
+        account=signer.address,
+        receiver=str(receiver),
+        delegate=str(delegate),
+        multiplier=int(multiplier),
+    )
+    sm = signer.sign_message(msg)
+    return sm.signature.hex()
+
+
+def delegation_signature(
+    local_account,
+    verifying_contract,
+    name,
+    delegate,
+    amount,
+    nonce,
+    deadline,
+    undelegation=False,
+):
+    class Delegation(EIP712Message):
+        # domain
+        _name_: "string"
+        _version_: "string"
+        _chainId_: "uint256"
+        _verifyingContract_: "address"
+
+        delegator: "address"
+        delegate: "address"
+        amount: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    class Undelegation(EIP712Message):
+        # domain
+        _name_: "string"
+        _version_: "string"
+        _chainId_: "uint256"
+        _verifyingContract_: "address"
+
+        delegator: "address"
+        delegate: "address"
+        amount: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    message_type = Undelegation if undelegation else Delegation
+    msg = message_type(
+        _name_=name,
+        _version_="1",
+        _chainId_=chain.id,
+        _verifyingContract_=verifying_contract,
+        delegator=local_account.address,
+        delegate=str(delegate),
+        amount=int(amount),
+        nonce=nonce,
+        deadline=deadline,
+    )
+    sm = local_account.sign_message(msg)
+    return sm.signature.hex()
+
+
+def permit_signature(local_account, token, spender, value, nonce, deadline):
+    class Permit(EIP712Message):
+        # domain
+        _name_: "string"
+        _version_: "string"
+        _chainId_: "uint256"
+        _verifyingContract_: "address"
+
+        owner: "address"
+        spender: "address"
+        value: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    msg = Permit(
+        _name_=token.name(),
+        _version_="1",
+        _chainId_=chain.id,
+        _verifyingContract_=token.address,
+        owner=local_account.address,
+        spender=str(spender),
+        value=int(value),
+        nonce=nonce,
+        deadline=deadline,
+    )
+    sm = local_account.sign_message(msg)
+    # split as expected by `depositWithPermit`
+    return sm.v, sm.r.to_bytes(32, "big"), sm.s.to_bytes(32, "big")
+
+
 @pytest.fixture(scope="module")
 def local_account(accounts):
     local_account = accounts.add(private_key=ACCOUNT_KEY)
@@ -314,20 +437,41 @@ def nft_vault(councillor_nft, admin):
     return nft_vault
 
 
+@pytest.fixture(scope="session")
+def founding_members(accounts):
+    # the first member is the local account, which is able to sign claims
+    return [(ACCOUNT_ADDRESS, 10**18)] + [
+        (accounts[i].address, i * 10**18) for i in range(1, 7)
+    ]
+
+
+@pytest.fixture(scope="session")
+def founding_members_tree(founding_members):
+    return founding_member_tree(founding_members)
+
+
+@pytest.fixture(scope="session")
+def founding_member_proof(founding_members_tree):
+    return [to_hex(node) for node in founding_members_tree.get_proof(0)]
+
+
 @pytest.fixture
-def founding_member_vault(admin):
-    founding_member_vault = admin.deploy(FoundingMemberVault, admin, 5e18, ROOT)
+def founding_member_vault(admin, founding_members_tree):
+    founding_member_vault = admin.deploy(
+        FoundingMemberVault, admin, 5e18, to_hex(founding_members_tree.root)
+    )
     return founding_member_vault
 
 
 @pytest.fixture
 def founding_member_vault_with_claimed_nfts(
-    local_account, founding_member_vault, admin
+    local_account, founding_member_vault, founding_member_proof, admin
 ):
+    proof = founding_member_proof
     sig = signature(
-        local_account, admin, admin, 1e18, founding_member_vault.address, PROOF
+        local_account, admin, admin, 1e18, founding_member_vault.address, proof
     )
-    founding_member_vault.claimNFT(ACCOUNT_ADDRESS, admin, 1e18, PROOF, sig)
+    founding_member_vault.claimNFT(0, ACCOUNT_ADDRESS, admin, 1e18, proof, sig)
     return founding_member_vault
 
 
@@ -354,6 +498,13 @@ def token(admin):
     return c
 
 
+@pytest.fixture(scope="module")
+def permit_token(admin):
+    c = admin.deploy(ERC20PermitMintable)
+    c.mint(admin, INITIAL_BALANCE)
+    return c
+
+
 @pytest.fixture(scope="module")
 def static_tier_strategy(admin):
     return admin.deploy(
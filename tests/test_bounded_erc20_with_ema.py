@@ -1,6 +1,9 @@
-from brownie import chain
+import math
 
-from tests.conftest import INITIAL_BALANCE
+import pytest
+from brownie import chain, reverts
+
+from tests.conftest import INITIAL_BALANCE, permit_signature
 
 
 def test_deposit(admin, bounded_erc20, token):
@@ -15,6 +18,32 @@ def test_deposit(admin, bounded_erc20, token):
     assert token.balanceOf(admin) == INITIAL_BALANCE - 20
 
 
+def test_deposit_with_permit(admin, local_account, BoundedERC20WithEMA, permit_token):
+    bounded_erc20 = admin.deploy(BoundedERC20WithEMA, admin, permit_token)
+    bounded_erc20.initialize(2e18)
+    permit_token.mint(local_account, 20)
+
+    deadline = chain.time() + 3600
+    v, r, s = permit_signature(
+        local_account, permit_token, bounded_erc20, 20, 0, deadline
+    )
+    bounded_erc20.depositWithPermit(20, deadline, v, r, s, {"from": local_account})
+
+    assert bounded_erc20.balanceOf(local_account) == 20
+    assert permit_token.balanceOf(bounded_erc20) == 20
+    assert permit_token.allowance(local_account, bounded_erc20) == 0
+
+
+def test_deposit_with_permit_fallback(admin, bounded_erc20, token):
+    # the token does not support permit, so the existing allowance is used
+    with reverts():
+        bounded_erc20.depositWithPermit(20, 0, 0, 0, 0, {"from": admin})
+
+    token.approve(bounded_erc20.address, 20, {"from": admin})
+    bounded_erc20.depositWithPermit(20, 0, 0, 0, 0, {"from": admin})
+    assert bounded_erc20.balanceOf(admin) == 20
+
+
 def test_withdraw(admin, bounded_erc20, token):
     token.approve(bounded_erc20.address, 100, {"from": admin})
     bounded_erc20.deposit(20, {"from": admin})
@@ -53,3 +82,103 @@ def test_ema(admin, bounded_erc20, token):
     bounded_erc20.updateEMA({"from": admin})
     ema = bounded_erc20.boundedPctEMA()
     assert previousEMA < ema <= 20e16
+
+
+def _extrapolate(ema, ema_block, value, block, window):
+    return ema + (value - ema) * (1 - math.exp(-(block - ema_block) / window))
+
+
+def test_ema_matches_formula(admin, bounded_erc20, token):
+    token.approve(bounded_erc20.address, 100, {"from": admin})
+    bounded_erc20.deposit(20, {"from": admin})
+    window = bounded_erc20.windowWidth() / 1e18
+    ema_block, ema = bounded_erc20.expMovingAverage()
+    previous_block, previous = bounded_erc20.previousBoundedPctOfSupply()
+    assert previous == 20e16
+
+    for blocks in [1, 3, 10, 50]:
+        chain.mine(blocks)
+        tx = bounded_erc20.updateEMA({"from": admin})
+
+        ema = _extrapolate(ema, ema_block, previous, tx.block_number - 1, window)
+        ema_block, previous_block = tx.block_number - 1, tx.block_number
+        assert bounded_erc20.expMovingAverage()[0] == ema_block
+        assert bounded_erc20.boundedPctEMA() == pytest.approx(ema, rel=1e-12)
+        assert bounded_erc20.previousBoundedPctOfSupply() == (previous_block, previous)
+
+
+def test_current_ema(admin, bounded_erc20, token, EMAUpdateObserver):
+    token.approve(bounded_erc20.address, 100, {"from": admin})
+    bounded_erc20.deposit(20, {"from": admin})
+    window = bounded_erc20.windowWidth() / 1e18
+    ema_block, ema = bounded_erc20.expMovingAverage()
+
+    chain.mine(5)
+    # stored EMA is not updated without a transaction
+    assert bounded_erc20.boundedPctEMA() == ema
+
+    # the view and the update are compared in the same block
+    observer = admin.deploy(EMAUpdateObserver)
+    tx = observer.currentAndUpdatedEMA(bounded_erc20, {"from": admin})
+    current, updated = tx.return_value
+    assert current == updated
+    expected = _extrapolate(ema, ema_block, 20e16, tx.block_number - 1, window)
+    assert current == pytest.approx(expected, rel=1e-12)
+    assert bounded_erc20.expMovingAverage()[0] == tx.block_number - 1
+
+
+def test_legacy_values(admin, token, TestingBoundedERC20WithEMA):
+    bounded_erc20 = admin.deploy(TestingBoundedERC20WithEMA, admin, token)
+    bounded_erc20.initialize(2e18)
+    token.approve(bounded_erc20.address, 100, {"from": admin})
+    bounded_erc20.deposit(20, {"from": admin})
+    chain.mine(5)
+    bounded_erc20.updateEMA({"from": admin})
+    window = bounded_erc20.windowWidth() / 1e18
+    previous_block, previous = bounded_erc20.previousBoundedPctOfSupply()
+    ema_block, ema = bounded_erc20.expMovingAverage()
+
+    # as in a proxy initialized before the values were packed
+    bounded_erc20.useLegacyValues({"from": admin})
+    assert bounded_erc20.previousBoundedPctOfSupply() == (previous_block, previous)
+    assert bounded_erc20.expMovingAverage() == (ema_block, ema)
+    assert bounded_erc20.boundedPctEMA() == ema
+
+    # the first update reads the legacy values and writes the packed ones
+    chain.mine(5)
+    migrating_tx = bounded_erc20.updateEMA({"from": admin})
+    expected = _extrapolate(
+        ema, ema_block, previous, migrating_tx.block_number - 1, window
+    )
+    assert bounded_erc20.expMovingAverage()[0] == migrating_tx.block_number - 1
+    assert bounded_erc20.boundedPctEMA() == pytest.approx(expected, rel=1e-12)
+    assert bounded_erc20.previousBoundedPctOfSupply() == (
+        migrating_tx.block_number,
+        previous,
+    )
+
+    chain.mine(5)
+    tx = bounded_erc20.updateEMA({"from": admin})
+    print(f"updateEMA: {migrating_tx.gas_used} gas migrating, {tx.gas_used} gas after")
+    assert tx.gas_used < migrating_tx.gas_used
+
+
+def test_first_update_after_upgrade(admin, token, TestingBoundedERC20WithEMA):
+    bounded_erc20 = admin.deploy(TestingBoundedERC20WithEMA, admin, token)
+    ema_block = bounded_erc20.initialize(2e18).block_number
+    token.approve(bounded_erc20.address, 100, {"from": admin})
+    tx = bounded_erc20.deposit(20, {"from": admin})
+    window = bounded_erc20.windowWidth() / 1e18
+
+    # versions before the EMA was advanced to the previous block stored it at the
+    # block of the update before the last one, here `initialize`
+    bounded_erc20.setLegacyValues(tx.block_number, 20e16, ema_block, 0)
+
+    chain.mine(5)
+    tx = bounded_erc20.updateEMA({"from": admin})
+    # the EMA is advanced from its stored block, so the blocks between it and the
+    # previous update are counted once
+    expected = _extrapolate(0, ema_block, 20e16, tx.block_number - 1, window)
+    assert bounded_erc20.expMovingAverage()[0] == tx.block_number - 1
+    assert bounded_erc20.boundedPctEMA() == pytest.approx(expected, rel=1e-12)
+    assert bounded_erc20.previousBoundedPctOfSupply() == (tx.block_number, 20e16)
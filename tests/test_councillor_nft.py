@@ -7,9 +7,9 @@ from eip712.messages import EIP712Message
 from eth_abi.packed import encode_packed
 from eth_utils import keccak
 
+from support.utils import typed_reverts
 from tests.conftest import FIXTURES_PATH
 
-
 ONE = 10**18
 
 
@@ -165,3 +165,66 @@ def test_update_minting_params(councillor_nft, alice):
     councillor_nft.updateMintingParams(100, new_merkle_root)
     assert councillor_nft.maxSupply() == 100
     assert councillor_nft.getMerkleRoot() == new_merkle_root
+
+
+def test_mint_batch(admin, accounts, alice, charlie, councillor_nft, nft_vault):
+    a, b = accounts.add(), accounts.add()
+    total = nft_vault.getTotalRawVotingPower()
+
+    with typed_reverts("NotAuthorized(address,address)"):
+        councillor_nft.mintBatch([a], [ONE], [a], {"from": alice})
+
+    with reverts("mint error: length mismatch"):
+        councillor_nft.mintBatch([a, b], [ONE], [a, b], {"from": admin})
+
+    with reverts("user has already claimed NFT"):
+        councillor_nft.mintBatch([a, alice], [ONE, ONE], [a, alice], {"from": admin})
+
+    supply = councillor_nft.totalSupply()
+    councillor_nft.mintBatch([a, b], [ONE, 2 * ONE], [a, charlie], {"from": admin})
+    assert councillor_nft.totalSupply() == supply + 2
+    assert councillor_nft.ownerOf(supply) == a
+    assert councillor_nft.ownerOf(supply + 1) == b
+    assert councillor_nft.tokenOfOwnerByIndex(a, 0) == supply
+    assert councillor_nft.tokenByIndex(supply + 1) == supply + 1
+
+    assert nft_vault.getRawVotingPower(a) == ONE
+    assert nft_vault.getRawVotingPower(b) == 0
+    assert nft_vault.getRawVotingPower(charlie) == 3 * ONE
+    assert nft_vault.getDelegations(b) == [(charlie, 2 * ONE)]
+    assert nft_vault.getTotalRawVotingPower() == total + 3 * ONE
+
+    remaining = councillor_nft.maxSupply() - councillor_nft.totalSupply()
+    users = [accounts.add() for _ in range(remaining + 1)]
+    with reverts("mint error: supply cap would be exceeded"):
+        councillor_nft.mintBatch(users, [ONE] * len(users), users, {"from": admin})
+
+
+def test_mint_batch_gas(admin, accounts, councillor_nft, nft_vault):
+    count = 10
+    councillor_nft.updateMintingParams(100, councillor_nft.getMerkleRoot())
+
+    single_mints_gas = 0
+    for _ in range(count):
+        a = accounts.add()
+        single_mints_gas += councillor_nft.mint(a, ONE, a, [], b"").gas_used
+
+    users = [accounts.add() for _ in range(count)]
+    tx = councillor_nft.mintBatch(users, [ONE] * count, users, {"from": admin})
+    print(f"{count} mints: {single_mints_gas} gas, mintBatch: {tx.gas_used} gas")
+    assert tx.gas_used < single_mints_gas
+
+
+def test_enumerable_mint_overhead(admin, accounts, ERC721Mintable, ERC721BasicMintable):
+    # CouncillorNFT keeps ERC721Enumerable, this measures what it costs per mint
+    gas_used = {}
+    for nft_contract in [ERC721Mintable, ERC721BasicMintable]:
+        nft = admin.deploy(nft_contract)
+        to = accounts.add()
+        gas_used[nft_contract._name] = [nft.mint(to, i).gas_used for i in range(2)]
+    print(gas_used)
+
+    for with_enumerable, without_enumerable in zip(
+        gas_used["ERC721Mintable"], gas_used["ERC721BasicMintable"]
+    ):
+        assert without_enumerable < with_enumerable
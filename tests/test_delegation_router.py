@@ -0,0 +1,69 @@
+import pytest
+
+from support.utils import typed_reverts
+
+
+@pytest.fixture
+def vaults(MockVault, AggregateLPVault, admin, alice, chain):
+    trusting_vault = admin.deploy(MockVault)
+    untrusting_vault = admin.deploy(MockVault)
+    for vault in [trusting_vault, untrusting_vault]:
+        vault.updateVotingPower(alice, 50e18, {"from": admin})
+    # does not support delegation
+    lp_vault = admin.deploy(AggregateLPVault, admin, 0, [(trusting_vault, 1e18)])
+    chain.sleep(1)
+    chain.mine()
+    return trusting_vault, untrusting_vault, lp_vault
+
+
+@pytest.fixture
+def aggregator(VotingPowerAggregator, admin, chain, vaults):
+    ct = chain.time() - 1000
+    schedule = (
+        [(vaults[0], 4e17, 4e17), (vaults[1], 3e17, 3e17), (vaults[2], 3e17, 3e17)],
+        ct,
+        ct + 1,
+    )
+    return admin.deploy(VotingPowerAggregator, admin, schedule)
+
+
+@pytest.fixture
+def router(DelegationRouter, admin, aggregator, vaults):
+    router = admin.deploy(DelegationRouter, aggregator)
+    vaults[0].setTrustedRouter(
+        vaults[0].DELEGATE_VOTE_CAPABILITY(), router, True, {"from": admin}
+    )
+    return router
+
+
+def test_delegate_all(router, vaults, alice, bob, charlie):
+    trusting_vault, untrusting_vault, lp_vault = vaults
+    trusting_vault.delegateVote(charlie, 10e18, {"from": alice})
+
+    tx = router.delegateAll(bob, {"from": alice})
+    assert tx.return_value == [
+        (trusting_vault, 40e18),
+        (untrusting_vault, 0),
+        (lp_vault, 0),
+    ]
+
+    assert trusting_vault.getRawVotingPower(bob) == 40e18
+    assert trusting_vault.getAvailableToDelegate(alice) == 0
+    assert trusting_vault.getDelegations(alice) == [(charlie, 10e18), (bob, 40e18)]
+    assert untrusting_vault.getRawVotingPower(alice) == 50e18
+
+    # nothing left to delegate
+    tx = router.delegateAll(bob, {"from": alice})
+    assert tx.return_value[0] == (trusting_vault, 0)
+
+
+def test_delegate_vote_for_untrusted_router(vaults, admin, alice, bob):
+    with typed_reverts("UntrustedRouter(address)"):
+        vaults[0].delegateVoteFor(alice, bob, 1e18, {"from": bob})
+
+    # trusting a router to claim rewards does not let it delegate
+    vault = vaults[1]
+    vault.setTrustedRouter(vault.CLAIM_REWARDS_CAPABILITY(), bob, True, {"from": admin})
+    assert not vault.isTrustedRouter(vault.DELEGATE_VOTE_CAPABILITY(), bob)
+    with typed_reverts("UntrustedRouter(address)"):
+        vault.delegateVoteFor(alice, bob, 1e18, {"from": bob})
@@ -107,6 +107,43 @@ def test_doesnt_double_count_vetos(
     assert emergency_recovery.getVetoPercentage(propId) == 0.30e18
 
 
+def test_sums_vetos_of_voters(emergency_recovery, mock_voting_aggregator, alice):
+    tx = emergency_recovery.startGovernanceUpgrade(accounts[1])
+    propId = tx.events["UpgradeProposed"]["proposalId"]
+
+    emergency_recovery.veto(propId)
+    mock_voting_aggregator.setVotingPower(10e18)
+    emergency_recovery.veto(propId, {"from": alice})
+    assert emergency_recovery.getVetoTotals(propId) == [
+        ("0x0000000000000000000000000000000000000001", 31e18)
+    ]
+    assert emergency_recovery.getVetoPercentage(propId) == 0.31e18
+
+    mock_voting_aggregator.setVotingPower(0)
+    emergency_recovery.veto(propId)
+    assert emergency_recovery.getVetoTotals(propId) == [
+        ("0x0000000000000000000000000000000000000001", 10e18)
+    ]
+    assert emergency_recovery.getVetoPercentage(propId) == 0.10e18
+
+
+def test_veto_gas(emergency_recovery, mock_voting_aggregator):
+    tx = emergency_recovery.startGovernanceUpgrade(accounts[1])
+    propId = tx.events["UpgradeProposed"]["proposalId"]
+
+    first_tx = emergency_recovery.veto(propId)
+    mock_voting_aggregator.setVotingPower(30e18)
+    repeated_tx = emergency_recovery.veto(propId)
+    unchanged_tx = emergency_recovery.veto(propId)
+
+    print(f"first veto: {first_tx.gas_used}")
+    print(f"repeated veto: {repeated_tx.gas_used}")
+    print(f"unchanged veto: {unchanged_tx.gas_used}")
+    # only the first veto writes fresh slots
+    assert repeated_tx.gas_used < first_tx.gas_used
+    assert unchanged_tx.gas_used < repeated_tx.gas_used
+
+
 def test_cannot_veto_if_out_of_timelock(emergency_recovery, mock_proxy):
     toAddress = accounts[1]
     tx = emergency_recovery.startGovernanceUpgrade(toAddress)
@@ -2,6 +2,7 @@ import pytest
 from brownie import (
     chain,
     reverts,
+    MultiSendCallOnly,
     NoSafeManagementByMultisig,
     SafeManagementModule,
     Contract,
@@ -23,6 +24,11 @@ def safe(admin, GnosisSafe, GnosisSafeProxy):
     return Contract.from_abi("GnosisSafe", proxy.address, GnosisSafe.abi)
 
 
+@pytest.fixture()
+def multi_send(admin):
+    return admin.deploy(MultiSendCallOnly)
+
+
 @pytest.fixture()
 def signers(accounts):
     result = [accounts.add() for i in range(3)]
@@ -50,7 +56,7 @@ def sign_and_execute_transaction(account, safe, address, value, data):
         {"from": account.address},
     )
     pk = keys.PrivateKey(bytes.fromhex(account.private_key[2:]))
-    (_, _, _, signature) = sign_message_hash(msg_hash=message_hash, key=pk)
+    _, _, _, signature = sign_message_hash(msg_hash=message_hash, key=pk)
     tx = safe.execTransaction(
         *args,
         signature,
@@ -60,7 +66,7 @@ def sign_and_execute_transaction(account, safe, address, value, data):
 
 
 @pytest.fixture()
-def safe_without_guard(safe, local_account, signers):
+def safe_without_guard(safe, local_account, signers, multi_send):
     tx = safe.setup(
         [local_account.address, *[s.address for s in signers]],
         1,  # threshold
@@ -74,7 +80,7 @@ def safe_without_guard(safe, local_account, signers):
     )
 
     module = local_account.deploy(
-        SafeManagementModule, safe.address, local_account.address
+        SafeManagementModule, safe.address, local_account.address, multi_send
     )
 
     enable_module_call = encode_call("enableModule", ["address"], [module.address])
@@ -258,10 +264,21 @@ def test_module_setGuard(signers, local_account, configured_safe):
     sign_and_execute_transaction(signers[0], safe, safe.address, 0, call)
 
 
-def test_module_enableModule(local_account, configured_safe):
+def test_module_requires_multi_send(local_account, safe):
+    with reverts("multiSend cannot be 0 address"):
+        local_account.deploy(
+            SafeManagementModule, safe.address, local_account.address, ZERO_ADDR
+        )
+    with reverts("multiSend is not a contract"):
+        local_account.deploy(
+            SafeManagementModule, safe.address, local_account.address, local_account
+        )
+
+
+def test_module_enableModule(local_account, configured_safe, multi_send):
     safe, module, guard = configured_safe
     new_module = local_account.deploy(
-        SafeManagementModule, safe.address, local_account.address
+        SafeManagementModule, safe.address, local_account.address, multi_send
     )
     tx = module.enableModule(new_module.address, {"from": local_account})
     assert "ExecutionFromModuleSuccess" in tx.events
@@ -269,10 +286,10 @@ def test_module_enableModule(local_account, configured_safe):
     assert "ExecutionFromModuleSuccess" in tx.events
 
 
-def test_module_disableModule(local_account, configured_safe):
+def test_module_disableModule(local_account, configured_safe, multi_send):
     safe, module, guard = configured_safe
     new_module = local_account.deploy(
-        SafeManagementModule, safe.address, local_account.address
+        SafeManagementModule, safe.address, local_account.address, multi_send
     )
     tx = module.enableModule(new_module.address)
     assert "ExecutionFromModuleSuccess" in tx.events
@@ -290,3 +307,36 @@ def test_module_changeThreshold(local_account, configured_safe):
     safe, module, guard = configured_safe
     module.changeThreshold(2, {"from": local_account})
     assert safe.getThreshold() == 2
+
+
+def test_module_setSigners_gas(accounts, local_account, configured_safe):
+    safe, module, guard = configured_safe
+    old_owners = safe.getOwners()
+    new_owners = [a.address for a in accounts[:5]]
+
+    tx = module.setSigners(new_owners, 1, {"from": local_account})
+    assert len(tx.events["ExecutionFromModuleSuccess"]) == 1
+    assert set(safe.getOwners()) == set(new_owners)
+
+    # reverse rotation, with one module execution per owner update
+    current_owners = safe.getOwners()
+    calls = []
+    previous_owner = HEAD_ADDR
+    for current_owner, old_owner in zip(current_owners, old_owners):
+        calls.append(
+            module.swapOwner(
+                previous_owner, current_owner, old_owner, {"from": local_account}
+            )
+        )
+        previous_owner = old_owner
+    for current_owner in current_owners[len(old_owners) :]:
+        calls.append(
+            module.removeOwner(
+                previous_owner, current_owner, 1, {"from": local_account}
+            )
+        )
+    assert safe.getOwners() == old_owners
+
+    unbatched_gas = sum(call.gas_used for call in calls)
+    print(f"setSigners: {tx.gas_used}, one execution per update: {unbatched_gas}")
+    assert tx.gas_used < unbatched_gas
@@ -34,6 +34,41 @@ def test_create_proposal(governance_manager, admin):
     assert proposal == createdProposal[-1][0]
 
 
+def test_proposals_share_vaults_snapshot(governance_manager, admin, mock_vault):
+    proposal = ProposalAction.function_call(admin.address, "totalSupply()")
+    tx = governance_manager.createProposal([proposal])
+    snapshot_id = tx.events["VaultsSnapshotPersisted"]["snapshotId"]
+
+    # no vault total changed, so the snapshot of the first proposal is reused
+    tx = governance_manager.createProposal([proposal])
+    assert "VaultsSnapshotPersisted" not in tx.events
+
+    mock_vault.updateVotingPower(admin, 70e18)
+    tx = governance_manager.createProposal([proposal])
+    assert tx.events["VaultsSnapshotPersisted"]["snapshotId"] != snapshot_id
+
+
+def test_legacy_vaults_snapshot(governance_manager, admin, mock_vault):
+    mv = mock_vault
+    proposal = ProposalAction.function_call(admin.address, "totalSupply()")
+    prop_ids = [
+        governance_manager.createProposal([proposal]).events["ProposalCreated"]["id"]
+        for _ in range(2)
+    ]
+    governance_manager.useLegacyVaultsSnapshot(prop_ids[0])
+    chain.sleep(1)
+
+    # the legacy proposal is not grouped with the other one but counted the same
+    governance_manager.voteMany(prop_ids, [FOR_BALLOT, FOR_BALLOT])
+    for prop_id in prop_ids:
+        assert governance_manager.getVoteTotals(prop_id) == VoteTotals(
+            for_=[(mv.address, 50e18)], against=[], abstentions=[]
+        )
+    assert governance_manager.getCurrentPercentages(
+        prop_ids[0]
+    ) == governance_manager.getCurrentPercentages(prop_ids[1])
+
+
 def test_create_proposal_without_sufficient_voting_power(
     governance_manager, admin, mock_vault, chain
 ):
@@ -108,6 +143,40 @@ def test_vote_doesnt_double_count_if_vote_is_changed(
     )
 
 
+def test_vote_many(mock_vault, governance_manager, admin):
+    mv = mock_vault
+    proposal = ProposalAction.function_call(admin.address, "totalSupply()")
+    propIds = [
+        governance_manager.createProposal([proposal]).events["ProposalCreated"]["id"]
+        for _ in range(3)
+    ]
+    chain.sleep(1)
+
+    ballots = [FOR_BALLOT, AGAINST_BALLOT, FOR_BALLOT]
+    tx = governance_manager.voteMany(propIds, ballots)
+    assert [e["proposalId"] for e in tx.events["VoteCast"]] == propIds
+
+    for propId, ballot in zip(propIds, ballots):
+        assert governance_manager.getBallot(admin, propId) == ballot
+    assert governance_manager.getVoteTotals(propIds[1]) == VoteTotals(
+        for_=[], against=[(mv.address, 50e18)], abstentions=[]
+    )
+
+    # changing votes doesn't double count
+    tx = governance_manager.voteMany(propIds[:2], [AGAINST_BALLOT, FOR_BALLOT])
+    assert governance_manager.getVoteTotals(propIds[0]) == VoteTotals(
+        for_=[(mv.address, 0)], against=[(mv.address, 50e18)], abstentions=[]
+    )
+    assert governance_manager.getVoteTotals(propIds[1]) == VoteTotals(
+        for_=[(mv.address, 50e18)], against=[(mv.address, 0)], abstentions=[]
+    )
+
+
+def test_vote_many_length_mismatch(governance_manager, admin):
+    with reverts("proposals and ballots length mismatch"):
+        governance_manager.voteMany([0, 1], [FOR_BALLOT])
+
+
 def test_tally(governance_manager, raising_token):
     proposal = ProposalAction.function_call(raising_token, "totalSupply()")
     tx = governance_manager.createProposal([proposal])
@@ -282,6 +351,23 @@ def test_uses_override_tier_if_enough_gyd_is_bounded(
     assert prop[3] == 4e17  # vote threshold
 
 
+def test_uses_override_tier_without_ema_update(
+    admin, governance_manager, bounded_erc20, token
+):
+    proposal = ProposalAction.function_call(governance_manager, "upgradeTo()")
+
+    token.approve(bounded_erc20.address, 100, {"from": admin})
+    bounded_erc20.deposit(100, {"from": admin})
+    chain.mine()
+    assert bounded_erc20.boundedPctEMA() == 0
+
+    # the EMA is extrapolated from the deposit, no `updateEMA` call is needed
+    governance_manager.createProposal([proposal])
+
+    prop = governance_manager.listActiveProposals()[-1]
+    assert prop[3] == 4e17  # vote threshold
+
+
 def test_uses_highest_tier_if_multiple_proposals_made(
     admin, governance_manager, mock_tierer
 ):
@@ -423,3 +509,30 @@ def test_multisig_sunset(governance_manager, admin, multisig):
     action = ProposalAction.function_call(admin.address, "totalSupply()")
     with typed_reverts("MultisigSunset()"):
         governance_manager.createAndExecuteProposal([action], {"from": multisig})
+
+
+def test_gas_usage(governance_manager, raising_token):
+    proposal = ProposalAction.function_call(raising_token, "totalSupply()")
+    create_tx = governance_manager.createProposal([proposal])
+    shared_snapshot_tx = governance_manager.createProposal([proposal])
+    propId = create_tx.events["ProposalCreated"]["id"]
+    legacyPropId = shared_snapshot_tx.events["ProposalCreated"]["id"]
+    governance_manager.useLegacyVaultsSnapshot(legacyPropId)
+    chain.sleep(1)
+    vote_tx = governance_manager.vote(propId, FOR_BALLOT)
+    governance_manager.vote(legacyPropId, FOR_BALLOT)
+
+    chain.sleep(PROPOSAL_LENGTH_DURATION + 1)
+    chain.mine()
+    # the proposal tallied is the last active one in both cases
+    legacy_tally_tx = governance_manager.tallyVote(legacyPropId)
+    tally_tx = governance_manager.tallyVote(propId)
+
+    print(f"createProposal: {create_tx.gas_used}")
+    print(f"createProposal with shared snapshot: {shared_snapshot_tx.gas_used}")
+    print(f"vote: {vote_tx.gas_used}")
+    print(f"tallyVote: {tally_tx.gas_used}")
+    print(f"tallyVote with legacy snapshot: {legacy_tally_tx.gas_used}")
+    assert shared_snapshot_tx.gas_used < create_tx.gas_used
+    # packed snapshots take one slot less per vault to load
+    assert tally_tx.gas_used < legacy_tally_tx.gas_used
@@ -1,4 +1,5 @@
 import pytest
+from brownie import reverts
 
 from support.utils import scale
 
@@ -87,3 +88,126 @@ def test_rewards_computation(lm, alice, bob, chain, reward_token):
 
     _claim_and_check_rewards(lm, reward_token, alice, alice_expected)
     _claim_and_check_rewards(lm, reward_token, bob, bob_expected)
+
+
+def test_legacy_stake_migration(lm, alice, bob, chain):
+    lm.deposit(scale(6), {"from": alice})
+    lm.deposit(scale(3), {"from": bob})
+    chain.sleep(86400)
+    # accrues a share and an integral, which are then moved to the legacy mappings
+    lm.withdraw(scale(1), {"from": alice})
+    lm.useLegacyStake({"from": alice})
+    chain.sleep(86400)
+    chain.mine()
+
+    assert lm.stakedBalanceOf(alice) == scale(5)
+    legacy_claimable = lm.claimableRewards(alice)
+    assert legacy_claimable > lm.claimableRewards(bob) > 0
+
+    # the first checkpoint moves the stake to the packed struct
+    lm.deposit(scale(1), {"from": alice})
+    assert lm.stakedBalanceOf(alice) == scale(6)
+    assert lm.totalStaked() == scale(9)
+    assert int(lm.claimableRewards(alice)) == pytest.approx(legacy_claimable, rel=1e-4)
+
+
+def test_gas_usage(lm, alice, bob, chain, reward_token):
+    lm.deposit(scale(10), {"from": alice})
+    lm.deposit(scale(10), {"from": bob})
+    lm.useLegacyStake({"from": alice})
+    chain.sleep(86400)
+
+    migrating_deposit_tx = lm.deposit(scale(10), {"from": alice})
+    deposit_tx = lm.deposit(scale(10), {"from": bob})
+    chain.sleep(86400)
+    withdraw_tx = lm.withdraw(scale(5), {"from": alice})
+    chain.sleep(86400)
+    claim_tx = lm.claimRewards({"from": bob})
+
+    print(f"deposit migrating a legacy stake: {migrating_deposit_tx.gas_used} gas")
+    print(f"deposit: {deposit_tx.gas_used} gas")
+    print(f"withdraw: {withdraw_tx.gas_used} gas")
+    print(f"claim: {claim_tx.gas_used} gas")
+    # both deposits checkpoint the user, bob's only updates the two packed slots
+    assert deposit_tx.gas_used < migrating_deposit_tx.gas_used
+    assert reward_token.balanceOf(bob) == claim_tx.return_value
+    assert lm.claimableRewards(bob) == 0
+
+
+@pytest.fixture
+def partner_token(ERC20Mintable, admin, lm):
+    partner_token = admin.deploy(ERC20Mintable)
+    partner_token.mint(admin, scale(1_000), {"from": admin})
+    partner_token.approve(lm, 2**256 - 1, {"from": admin})
+    return partner_token
+
+
+def test_multiple_reward_streams(
+    lm, alice, bob, admin, charlie, chain, reward_token, partner_token
+):
+    assert lm.rewardStreamsCount() == 1
+    with reverts("reward token already used"):
+        lm.addRewardStream(reward_token, charlie, {"from": admin})
+
+    tx = lm.addRewardStream(partner_token, charlie, {"from": admin})
+    stream_id = tx.return_value
+    assert stream_id == 1
+    assert lm.rewardStreamsCount() == 2
+    assert lm.rewardStreamToken(stream_id) == partner_token
+    assert lm.rewardStreamTreasury(stream_id) == charlie
+    with reverts("reward stream does not exist"):
+        lm.claimableRewards(alice, 2)
+
+    lm.startMining(
+        stream_id,
+        admin,
+        scale(1_000),
+        chain[-1].timestamp + 100 * 86400,
+        {"from": admin},
+    )
+    assert lm.rewardsEmissionRate(stream_id) == scale(1_000) // (100 * 86400)
+    lm.deposit(scale(2), {"from": alice})
+    tx = lm.deposit(scale(1), {"from": bob})
+    deposit_time = tx.timestamp
+
+    chain.sleep(86400)
+    tx = lm.claimAllRewards({"from": alice})
+    time_elapsed = tx.timestamp - deposit_time
+    amounts = tx.return_value
+    assert len(amounts) == 2
+    for i, token in enumerate([reward_token, partner_token]):
+        expected = 2 / 3 * time_elapsed * lm.rewardsEmissionRate(i)
+        assert amounts[i] == pytest.approx(expected, rel=1e-4)
+        assert token.balanceOf(alice) == amounts[i]
+    assert lm.claimableRewards(alice) == 0
+    assert lm.claimableRewards(alice, stream_id) == 0
+
+    # stopping a stream does not affect the others
+    lm.stopMining(stream_id, {"from": admin})
+    assert lm.rewardsEmissionEndTime(stream_id) == 0
+    assert lm.rewardsEmissionEndTime() > 0
+    unclaimed = partner_token.balanceOf(lm)
+    assert partner_token.balanceOf(charlie) == scale(1_000) - unclaimed - amounts[1]
+
+    tx = lm.claimRewards(stream_id, {"from": bob})
+    assert tx.return_value == pytest.approx(amounts[1] / 2, rel=1e-4)
+    assert tx.events["RewardStreamClaim"]["streamId"] == stream_id
+    assert tx.events["RewardStreamClaim"]["amount"] == tx.return_value
+    # only rounding dust is left
+    assert partner_token.balanceOf(lm) < 10
+
+
+def test_claimable_rewards_batch(lm, alice, bob, charlie, chain):
+    lm.deposit(scale(6), {"from": alice})
+    lm.deposit(scale(3), {"from": bob})
+    chain.sleep(86400)
+    chain.mine()
+
+    beneficiaries = [alice, bob, charlie]
+    amounts = lm.claimableRewardsBatch(beneficiaries)
+    assert amounts == [lm.claimableRewards(account) for account in beneficiaries]
+    assert amounts[0] > amounts[1] > 0
+    assert amounts[2] == 0
+    assert lm.claimableRewardsBatch([]) == []
+    with reverts("reward stream does not exist"):
+        lm.claimableRewardsBatch(beneficiaries, 1)
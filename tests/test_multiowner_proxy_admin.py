@@ -0,0 +1,69 @@
+import pytest
+from brownie import ZERO_ADDRESS, MockProxy, reverts
+
+from support.utils import typed_reverts
+
+
+@pytest.fixture
+def proxies(admin, multiowner_proxy_admin, GovernanceManagerProxy, EmptyContract):
+    empty_contract = admin.deploy(EmptyContract)
+    return [
+        admin.deploy(
+            GovernanceManagerProxy, empty_contract, multiowner_proxy_admin, b""
+        )
+        for _ in range(3)
+    ]
+
+
+@pytest.fixture
+def implementations(admin, EmptyContract):
+    return [admin.deploy(EmptyContract) for _ in range(3)]
+
+
+def test_upgrade_many(admin, multiowner_proxy_admin, proxies, implementations):
+    multiowner_proxy_admin.upgradeMany(proxies, implementations, {"from": admin})
+    for proxy, implementation in zip(proxies, implementations):
+        assert multiowner_proxy_admin.getProxyImplementation(proxy) == implementation
+
+
+def test_upgrade_many_is_atomic(
+    admin, multiowner_proxy_admin, proxies, implementations
+):
+    previous = multiowner_proxy_admin.getProxyImplementation(proxies[0])
+    # not a contract
+    implementations[2] = admin
+    with reverts():
+        multiowner_proxy_admin.upgradeMany(proxies, implementations, {"from": admin})
+    assert multiowner_proxy_admin.getProxyImplementation(proxies[0]) == previous
+
+
+def test_upgrade_many_checks(
+    admin, alice, multiowner_proxy_admin, proxies, implementations
+):
+    with typed_reverts("NotAuthorized(address,address)"):
+        multiowner_proxy_admin.upgradeMany(proxies, implementations, {"from": alice})
+    with reverts("proxies and implementations length mismatch"):
+        multiowner_proxy_admin.upgradeMany(
+            proxies, implementations[:2], {"from": admin}
+        )
+
+
+def test_upgrade_and_call_many(admin, alice, multiowner_proxy_admin, proxies):
+    implementation = admin.deploy(MockProxy)
+    aggregators = [ZERO_ADDRESS, admin.address, alice.address]
+    data = [
+        implementation.setVotingPowerAggregator.encode_input(aggregator)
+        for aggregator in aggregators
+    ]
+
+    with reverts("proxies and implementations length mismatch"):
+        multiowner_proxy_admin.upgradeAndCallMany(
+            proxies, [implementation] * 3, data[:2], {"from": admin}
+        )
+
+    multiowner_proxy_admin.upgradeAndCallMany(
+        proxies, [implementation] * 3, data, {"from": admin}
+    )
+    for proxy, aggregator in zip(proxies, aggregators):
+        assert multiowner_proxy_admin.getProxyImplementation(proxy) == implementation
+        assert MockProxy.at(proxy).votingPowerAggregator() == aggregator
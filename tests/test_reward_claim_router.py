@@ -0,0 +1,103 @@
+import pytest
+
+from support.utils import scale, typed_reverts
+
+
+@pytest.fixture
+def reward_token(ERC20Mintable, admin):
+    reward_token = admin.deploy(ERC20Mintable)
+    reward_token.mint(admin, scale(2_000_000), {"from": admin})
+    return reward_token
+
+
+@pytest.fixture
+def vaults(SampleLiquidityMining, token, reward_token, admin, alice, treasury, chain):
+    token.mint(alice, scale(20), {"from": admin})
+    vaults = []
+    for _ in range(2):
+        lm = admin.deploy(SampleLiquidityMining, token, reward_token, treasury)
+        reward_token.approve(lm, 2**256 - 1, {"from": admin})
+        lm.startMining(
+            admin, scale(1_000_000), chain[-1].timestamp + 365 * 86400, {"from": admin}
+        )
+        token.approve(lm, scale(10), {"from": alice})
+        lm.deposit(scale(10), {"from": alice})
+        vaults.append(lm)
+    return vaults
+
+
+@pytest.fixture
+def router(RewardClaimRouter, admin, vaults):
+    router = admin.deploy(RewardClaimRouter)
+    for vault in vaults:
+        vault.setTrustedRouter(
+            vault.CLAIM_REWARDS_CAPABILITY(), router, True, {"from": admin}
+        )
+    return router
+
+
+def test_untrusted_router(RewardClaimRouter, admin, alice, vaults, chain):
+    router = admin.deploy(RewardClaimRouter)
+    chain.sleep(86400)
+    with typed_reverts("UntrustedRouter(address)"):
+        router.claimRewards(vaults, {"from": alice})
+    with typed_reverts("UntrustedRouter(address)"):
+        vaults[0].claimAllRewardsFor(alice, {"from": alice})
+
+    # trusting a router to delegate does not let it claim
+    vault = vaults[0]
+    vault.setTrustedRouter(
+        vault.DELEGATE_VOTE_CAPABILITY(), router, True, {"from": admin}
+    )
+    assert not vault.isTrustedRouter(vault.CLAIM_REWARDS_CAPABILITY(), router)
+    with typed_reverts("UntrustedRouter(address)"):
+        router.claimRewards(vaults, {"from": alice})
+
+
+def test_claim_rewards(router, vaults, alice, reward_token, chain):
+    chain.sleep(86400)
+    chain.mine()
+    tokens, amounts = router.claimableRewardsBatch(alice, vaults)
+    assert tokens == [reward_token]
+    expected = sum(vault.claimableRewards(alice) for vault in vaults)
+    assert amounts[0] == expected
+
+    tx = router.claimRewards(vaults, {"from": alice})
+    tokens, amounts = tx.return_value
+    assert tokens == [reward_token]
+    assert amounts[0] == pytest.approx(expected, rel=1e-4)
+    assert reward_token.balanceOf(alice) == amounts[0]
+    assert reward_token.balanceOf(router) == 0
+    assert len(tx.events["Claim"]) == 2
+    # rewards from both vaults are sent in a single transfer
+    transfers_to_alice = [t for t in tx.events["Transfer"] if t["to"] == alice]
+    assert len(transfers_to_alice) == 1
+
+    for vault in vaults:
+        assert vault.claimableRewards(alice) == 0
+    assert router.claimableRewardsBatch(alice, vaults) == ([], [])
+
+
+def test_claim_rewards_multiple_tokens(
+    router, vaults, admin, alice, charlie, reward_token, ERC20Mintable, chain
+):
+    partner_token = admin.deploy(ERC20Mintable)
+    partner_token.mint(admin, scale(1_000), {"from": admin})
+    partner_token.approve(vaults[1], scale(1_000), {"from": admin})
+    vaults[1].addRewardStream(partner_token, charlie, {"from": admin})
+    vaults[1].startMining(
+        1, admin, scale(1_000), chain[-1].timestamp + 86400, {"from": admin}
+    )
+
+    chain.sleep(3600)
+    tx = router.claimRewards(vaults, {"from": alice})
+    tokens, amounts = tx.return_value
+    assert tokens == [reward_token, partner_token]
+    assert reward_token.balanceOf(alice) == amounts[0]
+    assert partner_token.balanceOf(alice) == amounts[1] > 0
+    assert partner_token.balanceOf(router) == 0
+
+    # nothing to claim for an account without stake
+    tx = router.claimRewards(vaults, {"from": charlie})
+    assert tx.return_value == ([], [])
+    assert "Transfer" not in tx.events
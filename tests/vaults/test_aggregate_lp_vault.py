@@ -1,6 +1,6 @@
 import pytest
 
-from brownie import chain, reverts, AggregateLPVault, MockVault
+from brownie import chain, reverts, AggregateLPVault, LegacyMockVault, MockVault
 
 INITIAL_RAW_VOTING_POWER = 10
 INITIAL_TOTAL_RAW_VOTING_POWER = 100
@@ -40,3 +40,43 @@ def test_aggregate_lp_vault_scaled_threshold(admin, aggregate_lp_vault, alice):
     assert aggregate_lp_vault.getVaultWeights() == weights
     assert aggregate_lp_vault.getRawVotingPower(admin) == 20
     assert aggregate_lp_vault.getTotalRawVotingPower() == 300
+
+
+def test_get_raw_voting_powers(admin, aggregate_lp_vault, alice, bob):
+    mv = admin.deploy(MockVault)
+    mv.updateVotingPower(admin, 10)
+    mv.updateVotingPower(alice, 90)
+    mv2 = admin.deploy(MockVault)
+    mv2.updateVotingPower(alice, 100)
+    aggregate_lp_vault.setVaultWeights([(mv, 2 * 1e18), (mv2, 1 * 1e18)])
+    chain.sleep(1)
+    chain.mine()
+
+    accounts = [admin, alice, bob]
+    timestamp = chain[-1].timestamp
+    assert mv.getRawVotingPowers(accounts, timestamp) == [10, 90, 0]
+    powers = aggregate_lp_vault.getRawVotingPowers(accounts, timestamp)
+    assert powers == [20, 280, 0]
+    assert powers == [
+        aggregate_lp_vault.getRawVotingPower(account, timestamp) for account in accounts
+    ]
+
+
+def test_get_raw_voting_powers_legacy_vault(admin, aggregate_lp_vault, alice, bob):
+    mv = admin.deploy(MockVault)
+    mv.updateVotingPower(alice, 100)
+    # deployed before getRawVotingPowers was added, queried once per account
+    legacy_vault = admin.deploy(LegacyMockVault)
+    legacy_vault.updateVotingPower(admin, 10)
+    legacy_vault.updateVotingPower(alice, 90)
+    aggregate_lp_vault.setVaultWeights([(mv, 1 * 1e18), (legacy_vault, 2 * 1e18)])
+    chain.sleep(1)
+    chain.mine()
+
+    accounts = [admin, alice, bob]
+    timestamp = chain[-1].timestamp
+    powers = aggregate_lp_vault.getRawVotingPowers(accounts, timestamp)
+    assert powers == [20, 280, 0]
+    assert powers == [
+        aggregate_lp_vault.getRawVotingPower(account, timestamp) for account in accounts
+    ]
@@ -1,3 +1,6 @@
+from tests.conftest import ROOT
+
+
 def test_sum_voting_powers(admin, accounts, nft_vault, councillor_nft):
     initial_total = 5e18
     assert nft_vault.getTotalRawVotingPower() == initial_total
@@ -14,3 +17,88 @@ def test_sum_voting_powers(admin, accounts, nft_vault, councillor_nft):
     acc = accounts.add()
     councillor_nft.mint(acc, 10**18, acc, [], b"", {"from": admin})
     assert nft_vault.getTotalRawVotingPower() == new_total + 1e18
+
+
+def test_update_multiplier_gas(admin, accounts, CouncillorNFT, CouncillorNFTVault):
+    # small enough for the default block gas limit of the development network
+    batch_sizes = [10, 50]
+    councillor_nft = admin.deploy(
+        CouncillorNFT, "CouncillorNFT", "RNFT", admin, sum(batch_sizes), ROOT
+    )
+    nft_vault = admin.deploy(CouncillorNFTVault, admin, councillor_nft)
+    councillor_nft.initializeGovernanceVault(nft_vault)
+
+    gas_per_user = {}
+    for batch_size in batch_sizes:
+        users = [accounts.add() for _ in range(batch_size)]
+        for user in users:
+            councillor_nft.mint(user, 10**18, user, [], b"", {"from": admin})
+
+        total = nft_vault.getTotalRawVotingPower()
+        tx = nft_vault.updateMultiplier(users, 2e18, {"from": admin})
+        assert nft_vault.getTotalRawVotingPower() == total + batch_size * 1e18
+        gas_per_user[batch_size] = tx.gas_used / batch_size
+        print(f"updateMultiplier for {batch_size} users: {tx.gas_used} gas")
+
+    # the per-user cost must not grow with the batch size
+    assert gas_per_user[50] <= gas_per_user[10]
+
+
+def test_get_delegators(nft_vault, admin, accounts):
+    assert nft_vault.getDelegatorsCount(accounts[5]) == 0
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == []
+
+    nft_vault.delegateVote(accounts[5], 5e17, {"from": admin})
+    nft_vault.delegateVote(accounts[5], 1e18, {"from": accounts[1]})
+    nft_vault.delegateVote(accounts[5], 1e18, {"from": accounts[2]})
+    nft_vault.delegateVote(accounts[5], 5e17, {"from": admin})
+    assert nft_vault.getDelegatorsCount(accounts[5]) == 3
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == [
+        (admin, 1e18),
+        (accounts[1], 1e18),
+        (accounts[2], 1e18),
+    ]
+    assert nft_vault.getDelegators(accounts[5], 1, 1) == [(accounts[1], 1e18)]
+    assert nft_vault.getDelegators(accounts[5], 2, 10) == [(accounts[2], 1e18)]
+    assert nft_vault.getDelegators(accounts[5], 3, 10) == []
+
+    nft_vault.undelegateVote(accounts[5], 4e17, {"from": accounts[1]})
+    nft_vault.undelegateVote(accounts[5], 1e18, {"from": admin})
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == [
+        (accounts[2], 1e18),
+        (accounts[1], 6e17),
+    ]
+
+    nft_vault.changeDelegate(accounts[5], accounts[6], 6e17, {"from": accounts[1]})
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == [(accounts[2], 1e18)]
+    assert nft_vault.getDelegators(accounts[6], 0, 10) == [(accounts[1], 6e17)]
+    assert nft_vault.getDelegations(accounts[1]) == [(accounts[6], 6e17)]
+
+
+def test_index_delegators(nft_vault, admin, accounts):
+    nft_vault.delegateVote(accounts[5], 5e17, {"from": admin})
+    nft_vault.delegateVote(accounts[6], 5e17, {"from": admin})
+
+    # delegations created by this implementation are already indexed
+    nft_vault.indexDelegators([admin, accounts[1]], {"from": accounts[2]})
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == [(admin, 5e17)]
+    assert nft_vault.getDelegators(accounts[6], 0, 10) == [(admin, 5e17)]
+
+
+def test_delegators_index_gas(admin, accounts, nft_vault, chain):
+    nft_vault.delegateVote(accounts[5], 5e17, {"from": admin})
+
+    # new delegation: accounts[5] is added to the delegates of accounts[1]
+    # and accounts[1] to the delegators of accounts[5]
+    chain.sleep(1)
+    new_tx = nft_vault.delegateVote(accounts[5], 5e17, {"from": accounts[1]})
+    # existing delegation: only the amount changes
+    chain.sleep(1)
+    topup_tx = nft_vault.delegateVote(accounts[5], 5e17, {"from": accounts[1]})
+    print(f"new delegation: {new_tx.gas_used} gas, top-up: {topup_tx.gas_used} gas")
+    assert topup_tx.gas_used < new_tx.gas_used
+
+    chain.sleep(1)
+    tx = nft_vault.undelegateVote(accounts[5], 1e18, {"from": accounts[1]})
+    print(f"removing a delegation: {tx.gas_used} gas")
+    assert nft_vault.getDelegators(accounts[5], 0, 10) == [(admin, 5e17)]
@@ -1,7 +1,14 @@
 import pytest
-from brownie import chain, reverts
+from brownie import ZERO_ADDRESS, chain, reverts
 
-from ..conftest import ACCOUNT_ADDRESS, ACCOUNT_KEY, PROOF, ROOT, signature
+from support.merkle import to_hex
+
+from ..conftest import (
+    ACCOUNT_ADDRESS,
+    claim_signature,
+    founding_member_tree,
+    signature,
+)
 
 
 def test_user_owns_no_nft(admin, accounts, founding_member_vault):
@@ -12,30 +19,59 @@ def test_user_owns_no_nft(admin, accounts, founding_member_vault):
         founding_member_vault.updateMultiplier([admin], 2e18)
 
 
-def test_invalid_proof_claim(admin, local_account, accounts, founding_member_vault):
+def test_invalid_proof_claim(
+    admin, local_account, accounts, founding_member_vault, founding_members_tree
+):
     # Attempt to claim with an invalid proof, namely the root.
     # This will get hashed with the ACCOUNT_ADDRESS to produce
     # a new, different root.
+    root = to_hex(founding_members_tree.root)
+    with reverts("invalid proof"):
+        founding_member_vault.claimNFT(
+            0,
+            ACCOUNT_ADDRESS,
+            admin,
+            1e18,
+            [root],
+            signature(
+                local_account, admin, admin, 1e18, founding_member_vault.address, [root]
+            ),
+        )
+
+
+def test_invalid_index_claim(
+    admin, local_account, founding_member_vault, founding_member_proof
+):
+    proof = founding_member_proof
     with reverts("invalid proof"):
         founding_member_vault.claimNFT(
+            1,
             ACCOUNT_ADDRESS,
             admin,
             1e18,
-            [ROOT],
+            proof,
             signature(
-                local_account, admin, admin, 1e18, founding_member_vault.address, [ROOT]
+                local_account, admin, admin, 1e18, founding_member_vault.address, proof
             ),
         )
 
 
-def test_valid_proof(admin, accounts, founding_member_vault, local_account):
+def test_valid_proof(
+    admin, accounts, founding_member_vault, local_account, founding_member_proof
+):
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         admin,
         1e18,
-        PROOF,
+        founding_member_proof,
         signature(
-            local_account, admin, admin, 1e18, founding_member_vault.address, PROOF
+            local_account,
+            admin,
+            admin,
+            1e18,
+            founding_member_vault.address,
+            founding_member_proof,
         ),
     )
     assert founding_member_vault.getRawVotingPower(admin) == 1e18
@@ -45,16 +81,22 @@ def test_valid_proof(admin, accounts, founding_member_vault, local_account):
 
 
 def test_claiming_nft_doesnt_increase_supply(
-    local_account, admin, accounts, founding_member_vault
+    local_account, admin, accounts, founding_member_vault, founding_member_proof
 ):
     assert founding_member_vault.getTotalRawVotingPower() == 5e18
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         admin,
         1e18,
-        PROOF,
+        founding_member_proof,
         signature(
-            local_account, admin, admin, 1e18, founding_member_vault.address, PROOF
+            local_account,
+            admin,
+            admin,
+            1e18,
+            founding_member_vault.address,
+            founding_member_proof,
         ),
     )
     assert founding_member_vault.getTotalRawVotingPower() == 5e18
@@ -65,14 +107,22 @@ def test_claiming_nft_doesnt_increase_supply(
     assert founding_member_vault.getTotalRawVotingPower() == 9e18
 
 
-def test_updates_raw_power(local_account, admin, accounts, founding_member_vault):
+def test_updates_raw_power(
+    local_account, admin, accounts, founding_member_vault, founding_member_proof
+):
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         admin,
         1e18,
-        PROOF,
+        founding_member_proof,
         signature(
-            local_account, admin, admin, 1e18, founding_member_vault.address, PROOF
+            local_account,
+            admin,
+            admin,
+            1e18,
+            founding_member_vault.address,
+            founding_member_proof,
         ),
     )
     assert founding_member_vault.getRawVotingPower(admin) == 1e18
@@ -83,50 +133,54 @@ def test_updates_raw_power(local_account, admin, accounts, founding_member_vault
     assert founding_member_vault.getTotalRawVotingPower() == 6e18
 
 
-def test_nft_already_claimed(local_account, admin, accounts, founding_member_vault):
+def test_nft_already_claimed(
+    local_account, admin, accounts, founding_member_vault, founding_member_proof
+):
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         accounts[6],
         1e18,
-        PROOF,
+        founding_member_proof,
         signature(
             local_account,
             accounts[6],
             accounts[6],
             1e18,
             founding_member_vault.address,
-            PROOF,
+            founding_member_proof,
         ),
         {"from": accounts[6]},
     )
     with reverts("NFT already claimed"):
         founding_member_vault.claimNFT(
+            0,
             ACCOUNT_ADDRESS,
             accounts[6],
             1e18,
-            PROOF,
+            founding_member_proof,
             signature(
                 local_account,
                 accounts[6],
                 accounts[6],
                 1e18,
                 founding_member_vault.address,
-                PROOF,
+                founding_member_proof,
             ),
             {"from": accounts[6]},
         )
 
 
-def test_nft_claimed_with_nonzero_multiplier(admin, local_account, FoundingMemberVault):
-    root = "0x8005654da8bad4ccb60009614a4f7d79bdb27f747c64fef259f5b7a0f064bc5a"
-    proof = [
-        "0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
-        "0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
-        "0xcc20bdebe234641ec9c9c1c278579ef608f23fb46f1be71cd61a8cb3d6a53735",
-    ]
+def test_nft_claimed_with_nonzero_multiplier(
+    admin, local_account, FoundingMemberVault, founding_members
+):
     multiplier = 2e18
+    tree = founding_member_tree([(ACCOUNT_ADDRESS, multiplier)] + founding_members[1:])
+    root = to_hex(tree.root)
+    proof = [to_hex(node) for node in tree.get_proof(0)]
     founding_member_vault = admin.deploy(FoundingMemberVault, admin, 6e18, root)
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         admin,
         multiplier,
@@ -145,16 +199,16 @@ def test_nft_claimed_with_nonzero_multiplier(admin, local_account, FoundingMembe
     assert founding_member_vault.getTotalRawVotingPower() == 6e18
 
 
-def test_nft_claimed_and_delegate(admin, local_account, FoundingMemberVault, accounts):
-    root = "0x8005654da8bad4ccb60009614a4f7d79bdb27f747c64fef259f5b7a0f064bc5a"
-    proof = [
-        "0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
-        "0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
-        "0xcc20bdebe234641ec9c9c1c278579ef608f23fb46f1be71cd61a8cb3d6a53735",
-    ]
+def test_nft_claimed_and_delegate(
+    admin, local_account, FoundingMemberVault, accounts, founding_members
+):
     multiplier = 2e18
+    tree = founding_member_tree([(ACCOUNT_ADDRESS, multiplier)] + founding_members[1:])
+    root = to_hex(tree.root)
+    proof = [to_hex(node) for node in tree.get_proof(0)]
     founding_member_vault = admin.deploy(FoundingMemberVault, admin, 6e18, root)
     founding_member_vault.claimNFT(
+        0,
         ACCOUNT_ADDRESS,
         accounts[8],
         multiplier,
@@ -172,3 +226,126 @@ def test_nft_claimed_and_delegate(admin, local_account, FoundingMemberVault, acc
     assert founding_member_vault.getRawVotingPower(admin) == 0
     assert founding_member_vault.getRawVotingPower(accounts[8]) == 2e18
     assert founding_member_vault.getTotalRawVotingPower() == 6e18
+
+
+@pytest.fixture
+def signing_members(accounts):
+    # members able to sign their claims
+    return [(accounts.add(), (i + 1) * 10**18) for i in range(6)]
+
+
+def _signed_claims(vault, members, indices, receivers, delegates):
+    return [
+        (
+            index,
+            members[index][0].address,
+            receiver,
+            delegate,
+            members[index][1],
+            claim_signature(
+                members[index][0],
+                vault.address,
+                index,
+                receiver,
+                delegate,
+                members[index][1],
+            ),
+        )
+        for index, receiver, delegate in zip(indices, receivers, delegates)
+    ]
+
+
+def test_claim_many(admin, accounts, FoundingMemberVault, signing_members):
+    tree = founding_member_tree([(m.address, v) for m, v in signing_members])
+    vault = admin.deploy(FoundingMemberVault, admin, 21e18, to_hex(tree.root))
+    indices = [1, 2, 5]
+    receivers = [signing_members[1][0], accounts[7], signing_members[5][0]]
+    delegates = [ZERO_ADDRESS, ZERO_ADDRESS, accounts[8]]
+    claims = _signed_claims(vault, signing_members, indices, receivers, delegates)
+    proof, proof_flags = tree.get_multiproof(indices)
+    proof = [to_hex(node) for node in proof]
+
+    # the receiver and the delegate are part of the signed claim
+    tampered = list(claims)
+    tampered[1] = tampered[1][:2] + (accounts[9],) + tampered[1][3:]
+    with reverts("invalid signature"):
+        vault.claimMany(tampered, proof, proof_flags, {"from": accounts[9]})
+
+    with reverts("indices not sorted"):
+        vault.claimMany(claims[::-1], proof, proof_flags)
+
+    # anyone can relay the signed claims
+    vault.claimMany(claims, proof, proof_flags, {"from": accounts[9]})
+    for index in indices:
+        assert vault.isClaimed(index)
+    assert vault.getRawVotingPower(signing_members[1][0]) == 2e18
+    assert vault.getRawVotingPower(accounts[7]) == 3e18
+    assert vault.getRawVotingPower(signing_members[5][0]) == 0
+    assert vault.getRawVotingPower(accounts[8]) == 6e18
+    assert not vault.isClaimed(3)
+
+    with reverts("NFT already claimed"):
+        vault.claimMany(claims, proof, proof_flags)
+
+
+def test_claim_many_invalid_proof(admin, FoundingMemberVault, signing_members):
+    tree = founding_member_tree([(m.address, v) for m, v in signing_members])
+    vault = admin.deploy(FoundingMemberVault, admin, 21e18, to_hex(tree.root))
+    indices = [0, 3]
+    claims = _signed_claims(
+        vault, signing_members, indices, [admin] * 2, [ZERO_ADDRESS] * 2
+    )
+    proof, proof_flags = tree.get_multiproof([0, 4])
+    with reverts("invalid proof"):
+        vault.claimMany(claims, [to_hex(node) for node in proof], proof_flags)
+
+
+def test_claim_many_then_claim_nft(
+    admin,
+    local_account,
+    founding_member_vault,
+    founding_members,
+    founding_members_tree,
+    founding_member_proof,
+):
+    owner, multiplier = founding_members[0]
+    proof, proof_flags = founding_members_tree.get_multiproof([0])
+    claims = [
+        (
+            0,
+            owner,
+            admin,
+            ZERO_ADDRESS,
+            multiplier,
+            claim_signature(
+                local_account,
+                founding_member_vault.address,
+                0,
+                admin,
+                ZERO_ADDRESS,
+                multiplier,
+            ),
+        )
+    ]
+    founding_member_vault.claimMany(
+        claims, [to_hex(node) for node in proof], proof_flags
+    )
+    assert founding_member_vault.isClaimed(0)
+    assert founding_member_vault.getRawVotingPower(admin) == multiplier
+
+    with reverts("NFT already claimed"):
+        founding_member_vault.claimNFT(
+            0,
+            ACCOUNT_ADDRESS,
+            admin,
+            1e18,
+            founding_member_proof,
+            signature(
+                local_account,
+                admin,
+                admin,
+                1e18,
+                founding_member_vault.address,
+                founding_member_proof,
+            ),
+        )
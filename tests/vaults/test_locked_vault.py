@@ -1,8 +1,15 @@
 import pytest
 
-from brownie import ZERO_ADDRESS, chain, reverts, LockedVault
+from brownie import (
+    ZERO_ADDRESS,
+    Contract,
+    chain,
+    reverts,
+    LockedVault,
+    TestingLockedVault,
+)
 from brownie.exceptions import VirtualMachineError
-from tests.conftest import INITIAL_BALANCE
+from tests.conftest import INITIAL_BALANCE, delegation_signature, permit_signature
 
 DURATION_SECONDS = 60 * 60
 
@@ -15,6 +22,30 @@ def locked_vault(token, admin, treasury, ERC20Mintable):
     return vault
 
 
+@pytest.fixture
+def proxied_locked_vault(
+    token, admin, treasury, proxy_admin, ERC20Mintable, TransparentUpgradeableProxy
+):
+    # same setup as `deploy_vaults.full_locked_vault`
+    reward_token = admin.deploy(ERC20Mintable)
+    implementation = admin.deploy(LockedVault, admin, token, reward_token, treasury)
+    proxy = admin.deploy(
+        TransparentUpgradeableProxy,
+        implementation,
+        proxy_admin,
+        implementation.initialize.encode_input(DURATION_SECONDS),
+    )
+    return Contract.from_abi("LockedVault", proxy, LockedVault.abi)
+
+
+@pytest.fixture
+def testing_locked_vault(token, admin, treasury, ERC20Mintable):
+    reward_token = admin.deploy(ERC20Mintable)
+    vault = admin.deploy(TestingLockedVault, admin, token, reward_token, treasury)
+    vault.initialize(DURATION_SECONDS)
+    return vault
+
+
 @pytest.fixture
 def locked_vault_6_decimals(token, admin, treasury, ERC20Mintable):
     token.changeDecimals(6)
@@ -45,6 +76,23 @@ def test_deposit(admin, token, locked_vault):
     assert token.balanceOf(locked_vault) == 10
 
 
+def test_deposit_with_permit(local_account, alice, admin, treasury, permit_token):
+    vault = admin.deploy(LockedVault, admin, permit_token, permit_token, treasury)
+    vault.initialize(DURATION_SECONDS)
+    permit_token.mint(local_account, 20)
+
+    deadline = chain.time() + 3600
+    v, r, s = permit_signature(local_account, permit_token, vault, 20, 0, deadline)
+    vault.depositWithPermit(20, alice, deadline, v, r, s, {"from": local_account})
+    assert permit_token.nonces(local_account) == 1
+    assert vault.getRawVotingPower(alice) == 20
+    assert permit_token.balanceOf(vault) == 20
+
+    # the permit was already used, so the allowance is used instead
+    with reverts():
+        vault.depositWithPermit(20, alice, deadline, v, r, s, {"from": local_account})
+
+
 def test_change_delegate(admin, accounts, token, locked_vault):
     assert locked_vault.getTotalRawVotingPower() == 0
 
@@ -63,6 +111,117 @@ def test_change_delegate(admin, accounts, token, locked_vault):
     assert locked_vault.getDelegations(admin) == [(accounts[2], 10)]
 
 
+def _deposit_from(account, token, locked_vault, amount):
+    token.mint(account, amount)
+    token.approve(locked_vault, amount, {"from": account})
+    locked_vault.deposit(amount, {"from": account})
+
+
+def test_delegate_by_sig(local_account, alice, bob, token, locked_vault):
+    _deposit_from(local_account, token, locked_vault, 10)
+    deadline = chain.time() + DURATION_SECONDS
+
+    sig = delegation_signature(
+        local_account, locked_vault.address, "LockedVault", alice, 6, 0, deadline
+    )
+    locked_vault.delegateBySig(local_account, alice, 6, deadline, sig, {"from": bob})
+    assert locked_vault.getRawVotingPower(alice) == 6
+    assert locked_vault.getRawVotingPower(local_account) == 4
+    assert locked_vault.delegationNonces(local_account) == 1
+
+    with reverts("invalid signature"):
+        locked_vault.delegateBySig(
+            local_account, alice, 6, deadline, sig, {"from": bob}
+        )
+
+    sig = delegation_signature(
+        local_account,
+        locked_vault.address,
+        "LockedVault",
+        alice,
+        6,
+        1,
+        deadline,
+        undelegation=True,
+    )
+    locked_vault.undelegateBySig(local_account, alice, 6, deadline, sig, {"from": bob})
+    assert locked_vault.getRawVotingPower(alice) == 0
+    assert locked_vault.getRawVotingPower(local_account) == 10
+
+
+def test_delegate_by_sig_expired(local_account, alice, token, locked_vault):
+    _deposit_from(local_account, token, locked_vault, 10)
+    deadline = chain.time() - 1
+    sig = delegation_signature(
+        local_account, locked_vault.address, "LockedVault", alice, 6, 0, deadline
+    )
+    with reverts("signature expired"):
+        locked_vault.delegateBySig(local_account, alice, 6, deadline, sig)
+
+
+def test_delegate_many_by_sig(local_account, alice, bob, charlie, token, locked_vault):
+    _deposit_from(local_account, token, locked_vault, 10)
+    deadline = chain.time() + DURATION_SECONDS
+
+    delegations = [
+        (
+            local_account,
+            delegate,
+            amount,
+            deadline,
+            delegation_signature(
+                local_account,
+                locked_vault.address,
+                "LockedVault",
+                delegate,
+                amount,
+                nonce,
+                deadline,
+            ),
+        )
+        for nonce, (delegate, amount) in enumerate([(alice, 3), (charlie, 5)])
+    ]
+    locked_vault.delegateManyBySig(delegations, {"from": bob})
+
+    assert locked_vault.getRawVotingPower(alice) == 3
+    assert locked_vault.getRawVotingPower(charlie) == 5
+    assert locked_vault.getDelegations(local_account) == [(alice, 3), (charlie, 5)]
+    assert locked_vault.delegationNonces(local_account) == 2
+
+
+def test_delegate_many_by_sig_skips_failures(
+    local_account, alice, bob, charlie, token, locked_vault
+):
+    _deposit_from(local_account, token, locked_vault, 10)
+    deadline = chain.time() + DURATION_SECONDS
+
+    def signed(delegate, amount, nonce, deadline):
+        sig = delegation_signature(
+            local_account,
+            locked_vault.address,
+            "LockedVault",
+            delegate,
+            amount,
+            nonce,
+            deadline,
+        )
+        return (local_account, delegate, amount, deadline, sig)
+
+    delegations = [
+        signed(alice, 3, 0, deadline),
+        signed(charlie, 5, 1, chain.time() - 1),
+        signed(charlie, 4, 1, deadline),
+    ]
+    tx = locked_vault.delegateManyBySig(delegations, {"from": bob})
+
+    # the expired delegation is skipped without consuming its nonce
+    assert len(tx.events["DelegationBySigFailed"]) == 1
+    assert tx.events["DelegationBySigFailed"]["delegator"] == local_account
+    assert tx.events["DelegationBySigFailed"]["index"] == 1
+    assert locked_vault.getDelegations(local_account) == [(alice, 3), (charlie, 4)]
+    assert locked_vault.delegationNonces(local_account) == 2
+
+
 def test_delegation(admin, accounts, token, locked_vault):
     token.approve(locked_vault, 10)
     locked_vault.deposit(10, accounts[1])
@@ -222,3 +381,250 @@ def test_withdrawal_custom_decimals(admin, token, locked_vault_6_decimals):
     assert token.balanceOf(locked_vault) == 0
     assert locked_vault.getRawVotingPower(admin) == 0
     assert locked_vault.getTotalRawVotingPower() == 0
+
+
+def test_withdraw_many(admin, token, locked_vault):
+    token.approve(locked_vault, 30)
+    locked_vault.deposit(30, admin)
+    withdrawal_ids = [
+        locked_vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+        for _ in range(3)
+    ]
+
+    with reverts(revert_msg="no valid pending withdrawal"):
+        locked_vault.withdrawMany(withdrawal_ids[:2])
+
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+
+    with reverts(revert_msg="matching withdrawal does not exist"):
+        locked_vault.withdrawMany([withdrawal_ids[0], withdrawal_ids[0]])
+
+    tx = locked_vault.withdrawMany(withdrawal_ids[:2])
+    assert [e["id"] for e in tx.events["WithdrawalCompleted"]] == withdrawal_ids[:2]
+    assert len(tx.events["Transfer"]) == 1
+    assert token.balanceOf(admin) == INITIAL_BALANCE - 10
+    assert token.balanceOf(locked_vault) == 10
+
+    pws = locked_vault.listPendingWithdrawals(admin)
+    assert [pw[0] for pw in pws] == [withdrawal_ids[2]]
+
+
+def test_withdraw_all_matured(admin, token, locked_vault):
+    token.approve(locked_vault, 30)
+    locked_vault.deposit(30, admin)
+
+    tx = locked_vault.withdrawAllMatured()
+    assert tx.return_value == 0
+    assert "Transfer" not in tx.events
+
+    matured_ids = [
+        locked_vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+        for _ in range(2)
+    ]
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+    pending_id = locked_vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"][
+        "id"
+    ]
+
+    tx = locked_vault.withdrawAllMatured()
+    assert tx.return_value == 20
+    assert sorted(e["id"] for e in tx.events["WithdrawalCompleted"]) == matured_ids
+    assert len(tx.events["Transfer"]) == 1
+    assert token.balanceOf(admin) == INITIAL_BALANCE - 10
+
+    pws = locked_vault.listPendingWithdrawals(admin)
+    assert [pw[0] for pw in pws] == [pending_id]
+
+
+def test_deposit_gas(locked_vault, token, alice, bob, charlie, accounts):
+    for account in [alice, bob]:
+        token.mint(account, 100)
+        token.approve(locked_vault, 100, {"from": account})
+        locked_vault.deposit(10, {"from": account})
+    chain.sleep(1)
+
+    plain_tx = locked_vault.deposit(10, bob, {"from": bob})
+    delegate_tx = locked_vault.delegateVote(accounts[4], 10, {"from": bob})
+    delegated_tx = locked_vault.deposit(10, charlie, {"from": alice})
+
+    print(
+        f"deposit: {plain_tx.gas_used}, delegateVote: {delegate_tx.gas_used}, "
+        f"deposit with delegate: {delegated_tx.gas_used}"
+    )
+    # depositing with a delegate writes each checkpoint once, so it must be
+    # cheaper than depositing and delegating in two separate transactions
+    assert delegated_tx.gas_used < plain_tx.gas_used + delegate_tx.gas_used - 21_000
+
+    assert locked_vault.totalSupply() == locked_vault.totalStaked() == 40
+    assert locked_vault.getRawVotingPower(alice) == 10
+    assert locked_vault.getRawVotingPower(charlie) == 10
+    assert locked_vault.getDelegations(alice) == [(charlie, 10)]
+
+
+def test_withdraw_out_of_order(admin, token, locked_vault):
+    token.approve(locked_vault, 30)
+    locked_vault.deposit(30, admin)
+    withdrawal_ids = [
+        locked_vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+        for _ in range(3)
+    ]
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+
+    locked_vault.withdraw(withdrawal_ids[1])
+    with reverts(revert_msg="matching withdrawal does not exist"):
+        locked_vault.withdraw(withdrawal_ids[1])
+    pws = locked_vault.listPendingWithdrawals(admin)
+    assert [pw[0] for pw in pws] == [withdrawal_ids[0], withdrawal_ids[2]]
+
+    locked_vault.withdraw(withdrawal_ids[0])
+    pws = locked_vault.listPendingWithdrawals(admin)
+    assert [pw[0] for pw in pws] == [withdrawal_ids[2]]
+
+    tx = locked_vault.withdrawAllMatured()
+    assert tx.return_value == 10
+    assert locked_vault.listPendingWithdrawals(admin) == []
+    assert token.balanceOf(admin) == INITIAL_BALANCE
+
+
+def test_withdrawal_gas(admin, token, testing_locked_vault):
+    vault = testing_locked_vault
+    token.approve(vault, 30)
+    vault.deposit(30, admin)
+    vault.initiateWithdrawal(10, admin)
+    chain.sleep(1)
+
+    legacy_id = vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+    vault.useLegacyWithdrawal(legacy_id)
+    initiate_tx = vault.initiateWithdrawal(10, admin)
+    withdrawal_id = initiate_tx.events["WithdrawalQueued"]["id"]
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+    legacy_withdraw_tx = vault.withdraw(legacy_id)
+    withdraw_tx = vault.withdraw(withdrawal_id)
+
+    print(
+        f"initiateWithdrawal: {initiate_tx.gas_used}, withdraw: {withdraw_tx.gas_used}, "
+        f"legacy withdraw: {legacy_withdraw_tx.gas_used}"
+    )
+    # a queue entry takes two slots, a legacy withdrawal five and its id set entry
+    assert withdraw_tx.gas_used < legacy_withdraw_tx.gas_used
+
+
+def test_legacy_withdrawals(admin, alice, token, testing_locked_vault):
+    vault = testing_locked_vault
+    token.approve(vault, 40)
+    vault.deposit(40, admin)
+    ids = [
+        vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+        for _ in range(4)
+    ]
+    vault.useLegacyWithdrawal(ids[0])
+    vault.useLegacyWithdrawal(ids[2])
+    assert [w[0] for w in vault.listPendingWithdrawals(admin)] == [
+        ids[0],
+        ids[2],
+        ids[1],
+        ids[3],
+    ]
+
+    # legacy withdrawals can be cancelled, and completed like the queued ones
+    vault.cancelWithdrawals([ids[2], ids[3]], alice)
+    assert vault.getRawVotingPower(alice) == 20
+
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+    balance_before = token.balanceOf(admin)
+    tx = vault.withdraw(ids[0])
+    assert tx.events["WithdrawalCompleted"]["id"] == ids[0]
+    with reverts("matching withdrawal does not exist"):
+        vault.withdraw(ids[0])
+
+    vault.initiateWithdrawal(10, alice)
+    vault.useLegacyWithdrawal(ids[-1] + 1)
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+    assert vault.withdrawAllMatured().return_value == 20
+    assert vault.listPendingWithdrawals(admin) == []
+    assert token.balanceOf(admin) == balance_before + 30
+
+
+def test_cancel_withdrawal(admin, token, locked_vault, alice):
+    token.approve(locked_vault, 30)
+    locked_vault.deposit(30, admin)
+    withdrawal_id = locked_vault.initiateWithdrawal(10, admin).events[
+        "WithdrawalQueued"
+    ]["id"]
+    assert locked_vault.totalSupply() == 20
+
+    tx = locked_vault.cancelWithdrawal(withdrawal_id, admin)
+    assert tx.events["WithdrawalCancelled"]["id"] == withdrawal_id
+    assert tx.events["WithdrawalCancelled"]["amount"] == 10
+    assert "Transfer" not in tx.events
+    assert locked_vault.getRawVotingPower(admin) == 30
+    assert locked_vault.totalSupply() == locked_vault.totalStaked() == 30
+    assert locked_vault.listPendingWithdrawals(admin) == []
+
+    with reverts(revert_msg="matching withdrawal does not exist"):
+        locked_vault.cancelWithdrawal(withdrawal_id, admin)
+    with reverts(revert_msg="matching withdrawal does not exist"):
+        locked_vault.cancelWithdrawal(withdrawal_id, admin, {"from": alice})
+
+
+def test_cancel_withdrawals(admin, token, locked_vault, alice):
+    token.approve(locked_vault, 30)
+    locked_vault.deposit(30, admin)
+    withdrawal_ids = [
+        locked_vault.initiateWithdrawal(10, admin).events["WithdrawalQueued"]["id"]
+        for _ in range(3)
+    ]
+    chain.sleep(DURATION_SECONDS)
+    chain.mine()
+
+    tx = locked_vault.cancelWithdrawals(withdrawal_ids[:2], alice)
+    assert [e["id"] for e in tx.events["WithdrawalCancelled"]] == withdrawal_ids[:2]
+    assert token.balanceOf(locked_vault) == 30
+    assert locked_vault.getRawVotingPower(admin) == 0
+    assert locked_vault.getRawVotingPower(alice) == 20
+    assert locked_vault.getDelegations(admin) == [(alice, 20)]
+    assert locked_vault.totalSupply() == 20
+
+    pws = locked_vault.listPendingWithdrawals(admin)
+    assert [pw[0] for pw in pws] == [withdrawal_ids[2]]
+
+
+def test_cancel_no_withdrawals(admin, locked_vault, alice):
+    with reverts("no withdrawal to cancel"):
+        locked_vault.cancelWithdrawals([], alice)
+    assert locked_vault.getDelegations(admin) == []
+
+
+def test_rewards_through_proxy(admin, token, proxied_locked_vault, ERC20Mintable):
+    vault = proxied_locked_vault
+    reward_token = ERC20Mintable.at(vault.rewardToken())
+    reward_token.mint(admin, 10**21, {"from": admin})
+    reward_token.approve(vault, 10**21, {"from": admin})
+    assert vault.rewardStreamsCount() == 1
+
+    tx = vault.startMining(
+        admin, 10**21, chain[-1].timestamp + 100 * 86400, {"from": admin}
+    )
+    assert tx.events["StartMining"]["amount"] == 10**21
+    assert vault.rewardsEmissionRate() > 0
+
+    token.approve(vault, 10, {"from": admin})
+    vault.deposit(10, {"from": admin})
+    chain.sleep(86400)
+    chain.mine()
+
+    claimable = vault.claimableRewards(admin)
+    assert claimable > 0
+    assert vault.claimableRewardsBatch([admin]) == [claimable]
+
+    tx = vault.claimRewards({"from": admin})
+    assert tx.return_value >= claimable
+    assert tx.events["Claim"]["beneficiary"] == admin
+    assert tx.events["Claim"]["amount"] == tx.return_value
+    assert reward_token.balanceOf(admin) == tx.return_value
@@ -130,3 +130,45 @@ def test_raw_voting_power_cannot_be_zeroed(vault, admin):
 def test_all_users_must_have_voting_power_to_update(vault, admin):
     with reverts("all users must have at least 1 NFT"):
         vault.updateMultiplier([admin, accounts[9]], 5e18, {"from": admin})
+
+
+def test_update_multipliers(vault, admin, accounts):
+    total = vault.getTotalRawVotingPower()
+
+    with reverts("users and multipliers length mismatch"):
+        vault.updateMultipliers([admin, accounts[1]], [2e18], {"from": admin})
+
+    with reverts("multiplier cannot be more than 20"):
+        vault.updateMultipliers([admin, accounts[1]], [2e18, 25e18], {"from": admin})
+
+    vault.updateMultipliers([admin, accounts[1]], [2e18, 3e18], {"from": admin})
+    assert vault.getRawVotingPower(admin) == 2e18
+    assert vault.getRawVotingPower(accounts[1]) == 3e18
+    assert vault.getTotalRawVotingPower() == total + 3e18
+
+    with reverts("cannot decrease voting power"):
+        vault.updateMultipliers([admin], [2e18], {"from": admin})
+
+
+def test_get_delegations_after_removal(vault, admin, accounts):
+    vault.updateMultiplier([admin], 3e18)
+    for i in range(5, 8):
+        vault.delegateVote(accounts[i], 1e18, {"from": admin})
+    assert vault.getDelegations(admin) == [
+        (accounts[5], 1e18),
+        (accounts[6], 1e18),
+        (accounts[7], 1e18),
+    ]
+
+    # removing a delegation moves the last one in its place
+    vault.undelegateVote(accounts[5], 1e18, {"from": admin})
+    assert vault.getDelegations(admin) == [(accounts[7], 1e18), (accounts[6], 1e18)]
+
+    vault.undelegateVote(accounts[6], 5e17, {"from": admin})
+    vault.delegateVote(accounts[5], 5e17, {"from": admin})
+    assert vault.getDelegations(admin) == [
+        (accounts[7], 1e18),
+        (accounts[6], 5e17),
+        (accounts[5], 5e17),
+    ]
+    assert vault.getRawVotingPower(admin) == 5e17